@@ -0,0 +1,263 @@
+"""
+Account pool for scraping with several Upwork logins at once.
+
+Accounts and their state come from execution/data/status/email_status.json
+({email: {"status", "last_page", "updated_at"}}). AccountPool picks the usable accounts,
+lease_sessions logs them in (reusing saved sessions where possible), and the resulting
+SessionPool behaves like one requests.Session whose get() rotates over the accounts, each
+paced by its own rate budget.
+Accounts that hit the login page are marked expired, accounts that keep getting throttled are
+put in a cooldown, and the statuses are written back to the status file at the end of the run.
+"""
+
+import datetime
+import itertools
+import json
+import os
+import re
+import threading
+from typing import Callable, Optional
+
+import requests
+
+try:
+    from logger import Logger
+    from rate_limiter import RateLimiter
+    from concurrency_controller import is_cloudflare_challenge
+    from session_store import check_session, is_login_page
+except ImportError:
+    from execution.logger import Logger
+    from execution.rate_limiter import RateLimiter
+    from execution.concurrency_controller import is_cloudflare_challenge
+    from execution.session_store import check_session, is_login_page
+
+logger = Logger(level="DEBUG").get_logger()
+
+ACCOUNT_STATUS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'status', 'email_status.json')
+
+# Statuses an account can be leased in; 'cooling' accounts become usable again after cooldown_until
+USABLE_STATUSES = ('active', 'not_started')
+ACTIVE = 'active'
+COOLING = 'cooling'
+EXPIRED = 'expired'
+
+DEFAULT_COOLDOWN_MINUTES = 30
+# Throttled responses (429/403/Cloudflare) in a row before an account is put in cooldown
+MAX_STRIKES = 3
+
+PAGE_PARAM_PATTERN = re.compile(r'[?&]page=(\d+)')
+
+
+def _now() -> datetime.datetime:
+    return datetime.datetime.now().replace(microsecond=0)
+
+
+class AccountPool:
+    """The account status file: which accounts can be leased, and their status updates."""
+
+    def __init__(self, path: str = ACCOUNT_STATUS_PATH, cooldown_minutes: float = DEFAULT_COOLDOWN_MINUTES):
+        self.path = path
+        self.cooldown = datetime.timedelta(minutes=float(cooldown_minutes))
+        self.accounts = self._load()
+        self._changed = set()
+        self._lock = threading.Lock()
+
+    def _load(self) -> dict:
+        try:
+            with open(self.path, 'r') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            logger.warning(f"⚠️ Account status file {self.path} not found.")
+            return {}
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"⚠️ Could not read account statuses from {self.path} ({e}).")
+            return {}
+
+    def _usable(self, entry: dict) -> bool:
+        if entry.get('status') in USABLE_STATUSES:
+            return True
+        if entry.get('status') == COOLING and entry.get('cooldown_until'):
+            return datetime.datetime.fromisoformat(entry['cooldown_until']) <= _now()
+        return False
+
+    def available(self) -> list:
+        """Usable account emails: known-good ('active') accounts first, then the least recently used."""
+        usable = [(email, entry) for email, entry in self.accounts.items() if self._usable(entry)]
+        usable.sort(key=lambda item: (item[1].get('status') != ACTIVE, item[1].get('updated_at') or ''))
+        return [email for email, _ in usable]
+
+    def mark(self, email: str, status: str, **fields):
+        """Set the status (and any extra fields) of `email`; written out by save()."""
+        with self._lock:
+            entry = self.accounts.setdefault(email, {'status': status, 'last_page': 0, 'updated_at': None})
+            entry['status'] = status
+            if status != COOLING:
+                entry.pop('cooldown_until', None)
+            entry.update(fields)
+            entry['updated_at'] = _now().isoformat()
+            self._changed.add(email)
+
+    def cool_down(self, email: str):
+        """Put `email` in cooldown for cooldown_minutes."""
+        self.mark(email, COOLING, cooldown_until=(_now() + self.cooldown).isoformat())
+
+    def save(self):
+        """Write the changed accounts back, re-reading the file so edits made meanwhile are kept."""
+        with self._lock:
+            if not self._changed:
+                return
+            accounts = self._load()
+            for email in self._changed:
+                accounts[email] = self.accounts[email]
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump(accounts, f, indent=2)
+            os.replace(tmp_path, self.path)
+            logger.debug(f"Saved {len(self._changed)} account statuses to {self.path}")
+            self._changed.clear()
+
+
+class AccountLease:
+    """One logged-in account of a SessionPool with its own rate budget and health counters."""
+
+    def __init__(self, email: str, session: requests.Session, limiter: RateLimiter):
+        self.email = email
+        self.session = session
+        self.limiter = limiter
+        self.healthy = True
+        self.strikes = 0
+        self.requests = 0
+        self.last_page = 0
+
+
+class SessionPool:
+    """
+    requests.Session stand-in that spreads requests over several accounts. get() takes the next
+    healthy account round-robin, waits for that account's own budget for the endpoint and
+    updates the account's health from the response. A request whose account is retired by
+    its response is sent again with the next healthy account.
+    """
+
+    def __init__(self, pool: AccountPool, leases: list):
+        if not leases:
+            raise ValueError("SessionPool needs at least one logged-in account")
+        self.pool = pool
+        self.leases = leases
+        self._cycle = itertools.cycle(leases)
+        self._lock = threading.Lock()
+
+    # requests.Session attributes read by the rest of the pipeline (e.g. debug logging)
+    @property
+    def headers(self):
+        return self.leases[0].session.headers
+
+    @property
+    def cookies(self):
+        return self.leases[0].session.cookies
+
+    @property
+    def proxies(self):
+        return self.leases[0].session.proxies
+
+    def healthy_leases(self) -> list:
+        return [lease for lease in self.leases if lease.healthy]
+
+    def _next_lease(self) -> AccountLease:
+        with self._lock:
+            for _ in range(len(self.leases)):
+                lease = next(self._cycle)
+                if lease.healthy:
+                    return lease
+        raise RuntimeError("Session Invalid: no healthy accounts left in the pool.")
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        endpoint = 'search' if '/search/' in url else 'detail'
+        for _ in range(len(self.leases)):
+            lease = self._next_lease()
+            lease.limiter.acquire(endpoint)
+            resp = lease.session.get(url, **kwargs)
+            if not self._observe(lease, url, endpoint, resp) or not self.healthy_leases():
+                break
+        return resp
+
+    def _observe(self, lease: AccountLease, url: str, endpoint: str, resp: requests.Response) -> bool:
+        """Update the health of `lease` from `resp`; True if the account was just retired."""
+        with self._lock:
+            lease.requests += 1
+            if endpoint == 'search':
+                match = PAGE_PARAM_PATTERN.search(url)
+                lease.last_page = max(lease.last_page, int(match.group(1)) if match else 1)
+            if not lease.healthy:
+                return False
+            if endpoint == 'search' and resp.status_code == 200 and is_login_page(resp.text):
+                lease.healthy = False
+                self.pool.mark(lease.email, EXPIRED, last_page=lease.last_page)
+                logger.warning(f"⚠️ Account {lease.email} was logged out. Marked expired; {len(self.healthy_leases())} accounts left.")
+                return True
+            if resp.status_code in (403, 429) or is_cloudflare_challenge(resp.text):
+                lease.strikes += 1
+                if lease.strikes >= MAX_STRIKES:
+                    lease.healthy = False
+                    self.pool.cool_down(lease.email)
+                    logger.warning(f"⚠️ Account {lease.email} throttled {lease.strikes} times in a row. Cooling down; {len(self.healthy_leases())} accounts left.")
+                    return True
+                return False
+            lease.strikes = 0
+            return False
+
+    def stats(self) -> dict:
+        """Requests and health per account."""
+        return {lease.email: {'requests': lease.requests, 'healthy': lease.healthy} for lease in self.leases}
+
+    def close(self):
+        """Record the healthy accounts as active (with their last search page) and save the status file."""
+        for lease in self.leases:
+            if lease.healthy:
+                self.pool.mark(lease.email, ACTIVE, last_page=lease.last_page)
+        try:
+            self.pool.save()
+        except OSError as e:
+            logger.warning(f"⚠️ Failed to save account statuses: {e}")
+
+
+async def lease_sessions(pool: AccountPool, max_accounts: int, login: Callable, rate_budgets: Optional[dict] = None,
+                         session_store=None, check_url: Optional[str] = None, proxies: Optional[dict] = None) -> Optional[SessionPool]:
+    """
+    Log in up to `max_accounts` usable accounts and return them as a SessionPool (None if none
+    could log in). A saved session in `session_store` that passes a check against `check_url` is
+    used instead of a browser login. `login(email)` is awaited for the others and must return a
+    requests.Session; accounts whose login fails are marked expired.
+    """
+    leases = []
+    for email in pool.available():
+        if len(leases) >= max_accounts:
+            break
+        session = None
+        if session_store is not None and session_store.reuse:
+            session = session_store.load(email, proxies)
+            if session is not None and check_url and not check_session(session, check_url):
+                session = None
+        if session is None:
+            try:
+                logger.info(f"🔐 Logging in account {email}...")
+                session = await login(email)
+            except Exception as e:
+                logger.warning(f"⚠️ Login failed for {email}: {e}")
+                pool.mark(email, EXPIRED)
+                continue
+            if session_store is not None:
+                try:
+                    session_store.save(email, session)
+                except OSError as e:
+                    logger.debug(f"Failed to save session of {email}: {e}")
+        leases.append(AccountLease(email, session, RateLimiter(rate_budgets)))
+        pool.mark(email, ACTIVE)
+    try:
+        pool.save()
+    except OSError as e:
+        logger.warning(f"⚠️ Failed to save account statuses: {e}")
+    if not leases:
+        return None
+    logger.info(f"👥 Account pool: {len(leases)} accounts logged in")
+    return SessionPool(pool, leases)
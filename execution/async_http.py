@@ -0,0 +1,134 @@
+"""
+Asyncio HTTP engine for Upwork search pages and job detail pages.
+
+Takes over the cookies, headers and proxy of the requests.Session built after the browser login
+(get_requests_session_from_playwright / selenium_cookies_to_requests) and runs every request as a
+coroutine on one pooled httpx.AsyncClient, so connections are reused and the number of requests in
+flight is set by a concurrency limit instead of a thread count.
+"""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import Optional
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    from logger import Logger
+    from rate_limiter import RateLimiter, get_default_limiter
+    from concurrency_controller import AIMDController, is_cloudflare_challenge
+except ImportError:
+    from execution.logger import Logger
+    from execution.rate_limiter import RateLimiter, get_default_limiter
+    from execution.concurrency_controller import AIMDController, is_cloudflare_challenge
+
+logger = Logger(level="DEBUG").get_logger()
+
+
+def async_engine_available() -> bool:
+    """True when httpx is installed and the async engine can be used."""
+    return httpx is not None
+
+
+class AsyncUpworkClient:
+    """Shared httpx.AsyncClient with a concurrency limit, paced by the same RateLimiter as the requests flow"""
+
+    def __init__(self, session, concurrency: int = 10, timeout: float = 30.0, limiter: Optional[RateLimiter] = None,
+                 controller: Optional[AIMDController] = None, refresher=None):
+        if httpx is None:
+            raise ImportError("httpx is required for the async HTTP engine (pip install httpx)")
+        # With an AIMD controller the window moves at runtime; `concurrency` becomes its ceiling
+        self.controller = controller
+        self.concurrency = controller.maximum if controller else max(1, int(concurrency))
+        self._slots = asyncio.Semaphore(self.concurrency)
+        self.limiter = limiter or get_default_limiter()
+        # session_refresher.RefreshingSession: re-login when responses show the session went bad
+        self.refresher = refresher
+        self._generation = refresher.generation if refresher is not None else 0
+
+        proxies = getattr(session, 'proxies', None) or {}
+        self._client = httpx.AsyncClient(
+            headers=dict(session.headers),
+            cookies=session.cookies,
+            proxy=proxies.get('https') or proxies.get('http'),
+            timeout=timeout,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=self.concurrency, max_keepalive_connections=self.concurrency),
+        )
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def aclose(self):
+        await self._client.aclose()
+
+    @asynccontextmanager
+    async def _slot(self):
+        """Concurrency slot from the AIMD controller, or from the fixed semaphore without one."""
+        if self.controller is not None:
+            async with self.controller.slot_async() as epoch:
+                yield epoch
+        else:
+            async with self._slots:
+                yield 0
+
+    def _adopt_session(self):
+        """Take over the cookies and headers the refresher swapped into the shared session."""
+        self._client.cookies = self.refresher.cookies
+        self._client.headers.update(dict(self.refresher.headers))
+        self._generation = self.refresher.generation
+
+    async def get(self, url: str, endpoint: str = 'detail'):
+        """
+        GET `url` once the endpoint's rate budget and a concurrency slot allow it and return the response.
+        Raises httpx errors like requests.Session.get would; the outcome is fed back to the controller.
+        With a refresher, requests wait while a re-login runs and a bad-session response is retried once
+        after it.
+        """
+        if self.refresher is None:
+            return await self._get(url, endpoint)
+        if not self.refresher.is_ready():
+            await asyncio.to_thread(self.refresher.wait_ready)
+        generation = self.refresher.generation
+        if generation != self._generation:
+            self._adopt_session()
+        resp = await self._get(url, endpoint)
+        problem = self.refresher.check(resp.status_code, resp.text)
+        if problem is not None and await asyncio.to_thread(self.refresher.refresh, generation, problem, url):
+            self._adopt_session()
+            self.refresher.retried += 1
+            resp = await self._get(url, endpoint)
+        return resp
+
+    async def _get(self, url: str, endpoint: str):
+        await self.limiter.acquire_async(endpoint)
+        async with self._slot() as epoch:
+            status_code, text = None, None
+            start = time.monotonic()
+            try:
+                resp = await self._client.get(url)
+                status_code, text = resp.status_code, resp.text
+                return resp
+            finally:
+                if self.controller is not None:
+                    self.controller.record(epoch, status_code, time.monotonic() - start, text, url)
+
+    async def get_text(self, url: str, endpoint: str = 'detail') -> Optional[str]:
+        """Return the body of a successful GET, or None if the request failed."""
+        logger.debug(f"[async] Fetching: {url}")
+        try:
+            resp = await self.get(url, endpoint)
+            resp.raise_for_status()
+            if is_cloudflare_challenge(resp.text):
+                raise ValueError("Cloudflare challenge page returned")
+            return resp.text
+        except Exception as e:
+            logger.debug(f"[async] Failed to fetch {url}: {e}")
+            return None
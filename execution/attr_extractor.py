@@ -2,14 +2,19 @@
 Upwork Job Data Extraction Module
 
 This module extracts specific job data fields from HTML strings containing Upwork job postings.
-It handles various data sources including JSON embedded in script tags, HTML attributes, and text content.
+The decoded __NUXT_DATA__ payload is the primary source. When it carries every required field
+no DOM is built at all; otherwise HTML attributes, text content and regex scans over the raw page
+fill in.
 """
 
 import json
 import re
+from functools import lru_cache
+from html import unescape
 from typing import Any, Dict, Optional
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, Tag
+from bs4.builder import builder_registry
 
 # Configure logging
 try:
@@ -20,68 +25,333 @@ except ImportError:
 logger_obj = Logger(level="DEBUG")
 logger = logger_obj.get_logger()
 
+# Where each target field lives inside the decoded __NUXT_DATA__ job details object
+# ({"job": {...}, "buyer": {...}, ...}) and the type it is coerced to.
+# Paths are tried in order; a "*." prefix matches the first object carrying that key anywhere below.
+NUXT_FIELD_PATHS = {
+    'applicants': (('job.clientActivity.totalApplicants',), 'int'),
+    'buyer_avgHourlyJobsRate_amount': (('buyer.avgHourlyJobsRate.amount',), 'number'),
+    'buyer_company_contractDate': (('buyer.company.contractDate',), 'str'),
+    'buyer_jobs_openCount': (('buyer.jobs.openCount',), 'int'),
+    'buyer_jobs_postedCount': (('buyer.jobs.postedCount',), 'int'),
+    'buyer_location_city': (('buyer.location.city',), 'str'),
+    'buyer_location_countryTimezone': (('buyer.location.countryTimezone',), 'str'),
+    'buyer_location_offsetFromUtcMillis': (('buyer.location.offsetFromUtcMillis',), 'int'),
+    'buyer_stats_activeAssignmentsCount': (('buyer.stats.activeAssignmentsCount',), 'int'),
+    'buyer_stats_hoursCount': (('buyer.stats.hoursCount',), 'number'),
+    'buyer_stats_totalJobsWithHires': (('buyer.stats.totalJobsWithHires',), 'int'),
+    'category': (('job.category.name',), 'str'),
+    'categoryGroup_name': (('job.categoryGroup.name',), 'str'),
+    'categoryGroup_urlSlug': (('job.categoryGroup.urlSlug',), 'str'),
+    'category_name': (('job.category.name',), 'str'),
+    'category_urlSlug': (('job.category.urlSlug',), 'str'),
+    'clientActivity_invitationsSent': (('job.clientActivity.invitationsSent',), 'int'),
+    'clientActivity_totalHired': (('job.clientActivity.totalHired',), 'int'),
+    'clientActivity_totalInvitedToInterview': (('job.clientActivity.totalInvitedToInterview',), 'int'),
+    'clientActivity_unansweredInvites': (('job.clientActivity.unansweredInvites',), 'int'),
+    'client_company_size': (('buyer.company.profile.size',), 'str'),
+    'client_country': (('buyer.location.country',), 'str'),
+    'client_hires': (('buyer.stats.totalAssignments',), 'int'),
+    'client_industry': (('buyer.company.profile.industry',), 'str'),
+    'client_rating': (('buyer.stats.score',), 'number'),
+    'client_reviews': (('buyer.stats.feedbackCount',), 'int'),
+    'client_total_spent': (('buyer.stats.totalCharges.amount',), 'number'),
+    'connects_required': (('*.requiredConnects',), 'int'),
+    'contractorTier': (('job.contractorTier',), 'int'),
+    'currency': (('job.amount.currencyCode', 'buyer.stats.totalCharges.currencyCode'), 'str'),
+    'description': (('job.description',), 'str'),
+    'duration': (('job.durationLabel', 'job.engagementDuration.label'), 'str'),
+    'enterpriseJob': (('job.enterpriseJob', 'buyer.isEnterprise'), 'bool'),
+    'fixed_budget_amount': (('job.amount.amount', 'job.budget.amount'), 'number'),
+    'hourly_max': (('job.extendedBudgetInfo.hourlyBudgetMax',), 'number'),
+    'hourly_min': (('job.extendedBudgetInfo.hourlyBudgetMin',), 'number'),
+    'isContractToHire': (('job.isContractToHire',), 'bool'),
+    'lastBuyerActivity': (('job.clientActivity.lastBuyerActivity',), 'str'),
+    'level': (('job.contractorTier',), 'level'),
+    'numberOfPositionsToHire': (('job.numberOfPositionsToHire', 'job.clientActivity.numberOfPositionsToHire'), 'int'),
+    'payment_verified': (('buyer.isPaymentMethodVerified',), 'bool'),
+    'phone_verified': (('buyer.isPhoneVerified',), 'bool'),
+    'premium': (('job.isPremium',), 'bool'),
+    'questions': (('job.questions',), 'questions'),
+    'skills': (('job.sandsData', 'job.skills'), 'skills'),
+    'title': (('job.title',), 'str'),
+    'ts_create': (('job.createdOn',), 'str'),
+    'ts_publish': (('job.publishTime',), 'str'),
+    'type': (('job.type',), 'job_type'),
+}
+
+# Fields where the rendered label beats the payload's raw value (e.g. "Small company (2-9 people)")
+NUXT_DOM_PREFERRED_FIELDS = {'client_company_size'}
+
+# The payload-only fast path skips the DOM when these come back non-empty from the payload
+NUXT_REQUIRED_FIELDS = ('title', 'description', 'type', 'ts_create', 'skills')
+
+# Raw-HTML markers of what the DOM pass reads for fields the payload may lack. When such a field is
+# missing from the fast-path result and one of its markers is on the page, the full DOM pass runs.
+NUXT_DOM_MARKERS = {
+    'buyer_avgHourlyJobsRate_amount': ('data-qa="client-hourly-rate"',),
+    'buyer_company_contractDate': ('data-qa="client-contract-date"',),
+    'buyer_location_city': ('data-qa="client-location"',),
+    'buyer_stats_hoursCount': ('data-qa="client-hours"',),
+    'category': ('data-test="category"',),
+    'client_company_size': ('data-qa="client-company-profile',),
+    'client_country': ('data-qa="client-location"',),
+    'client_hires': ('data-qa="client-hires"',),
+    'client_total_spent': ('data-qa="client-spend"',),
+    'duration': ('duration',),
+    'hourly_max': ('data-cy="clock-timelog"',),
+    'hourly_min': ('data-cy="clock-timelog"',),
+    'level': ('level',),
+    'payment_verified': ('payment-verified', 'Payment method verified'),
+    'phone_verified': ('phone-verified', 'Phone number verified'),
+    'qualifications': ('deliverable',),
+    'questions': ('data-test="questions"',),
+}
+
+# Skill lists inside job.sandsData
+NUXT_SKILL_KEYS = ('ontologySkills', 'additionalSkills')
+
+# Job payload enums
+NUXT_JOB_TYPES = {1: 'Fixed', 2: 'Hourly', 'FIXED': 'Fixed', 'HOURLY': 'Hourly'}
+NUXT_CONTRACTOR_TIERS = {1: 'Entry', 2: 'Intermediate', 3: 'Expert', 'ENTRY_LEVEL': 'Entry', 'INTERMEDIATE': 'Intermediate', 'EXPERT': 'Expert'}
+
+# devalue encodes these values as negative indices
+NUXT_SENTINELS = {-1: None, -2: None, -3: float('nan'), -4: float('inf'), -5: float('-inf'), -6: -0.0}
+
+# Raw-HTML fallback rules as (Nuxt key, value form, target field), in precedence order.
+# Value forms: 'int' "key":123, 'number' "key":1.5, 'int,' "key":123, (trailing comma),
+# 'str' "key":"text", 'bool' "key":true. The countryTimezone rules feed client_country on purpose:
+# that is the field the original per-pattern loop assigned them to.
+NUXT_KEY_RULES = [
+    ('createdOn', 'int', 'ts_create'),
+    ('publishTime', 'int', 'ts_publish'),
+    ('totalApplicants', 'int', 'applicants'),
+    ('numberOfPositionsToHire', 'int', 'numberOfPositionsToHire'),
+    ('requiredConnects', 'int', 'connects_required'),
+    ('score', 'number', 'client_rating'),
+    ('feedbackCount', 'int', 'client_reviews'),
+    ('totalCharges', 'number', 'client_total_spent'),
+    ('activeAssignmentsCount', 'int', 'buyer_stats_activeAssignmentsCount'),
+    ('hoursCount', 'number', 'buyer_stats_hoursCount'),
+    ('totalJobsWithHires', 'int', 'buyer_stats_totalJobsWithHires'),
+    ('invitationsSent', 'int', 'clientActivity_invitationsSent'),
+    ('totalHired', 'int', 'clientActivity_totalHired'),
+    ('totalInvitedToInterview', 'int', 'clientActivity_totalInvitedToInterview'),
+    ('unansweredInvites', 'int', 'clientActivity_unansweredInvites'),
+    ('openCount', 'int', 'buyer_jobs_openCount'),
+    ('postedCount', 'int', 'buyer_jobs_postedCount'),
+    ('title', 'str', 'title'),
+    ('description', 'str', 'description'),
+    ('category', 'str', 'category'),
+    ('name', 'str', 'category_name'),
+    ('currencyCode', 'str', 'currency'),
+    ('country', 'str', 'client_country'),
+    ('industry', 'str', 'client_industry'),
+    ('size', 'str', 'client_company_size'),
+    ('city', 'str', 'buyer_location_city'),
+    ('countryTimezone', 'str', 'client_country'),
+    ('contractorTier', 'str', 'contractorTier'),
+    ('label', 'str', 'level'),
+    ('isContractToHire', 'bool', 'isContractToHire'),
+    ('isPaymentMethodVerified', 'bool', 'payment_verified'),
+    ('isPhoneVerified', 'bool', 'phone_verified'),
+    ('isPremium', 'bool', 'premium'),
+    ('isEnterprise', 'bool', 'enterpriseJob'),
+    ('offsetFromUtcMillis', 'int', 'buyer_location_offsetFromUtcMillis'),
+    ('contractDate', 'str', 'buyer_company_contractDate'),
+    ('offsetFromUtcMillis', 'int,', 'buyer_location_offsetFromUtcMillis'),
+    ('countryTimezone', 'int,', 'client_country'),
+    ('city', 'int,', 'buyer_location_city'),
+    ('country', 'int,', 'client_country'),
+    ('industry', 'int,', 'client_industry'),
+    ('size', 'int,', 'client_company_size'),
+    ('isPhoneVerified', 'int,', 'phone_verified'),
+    ('isContractToHire', 'int,', 'isContractToHire'),
+    ('currencyCode', 'int,', 'currency'),
+    ('lastBuyerActivity', 'int,', 'lastBuyerActivity'),
+    ('urlSlug', 'str', 'category_urlSlug'),
+    ('contractorTier', 'int', 'contractorTier'),
+]
+
+# Lookup tables for the scanner: lowercase key -> key as written in NUXT_KEY_RULES, key -> value forms
+NUXT_KEY_CANONICAL = {key.lower(): key for key, _, _ in NUXT_KEY_RULES}
+NUXT_KEY_FORMS = {
+    key: tuple(dict.fromkeys(form for rule_key, form, _ in NUXT_KEY_RULES if rule_key == key))
+    for key in NUXT_KEY_CANONICAL.values()
+}
+
+# One alternation over every rule key. Only the opening quote is consumed (the rest is a
+# lookahead), so a single finditer sees every position a per-key regex would have matched.
+NUXT_KEY_SCANNER = re.compile(
+    r'"(?=(' + '|'.join(re.escape(key) for key in sorted(NUXT_KEY_CANONICAL.values(), key=len, reverse=True)) + r')":'
+    r'(?:"([^"]+)"|(true|false)|(\d+(?:\.\d+)?)(,?)))',
+    re.IGNORECASE
+)
+
+# Script assignments that may carry a plain JSON job object
+NUXT_SCRIPT_PATTERNS = [
+    re.compile(pattern, re.DOTALL) for pattern in (
+        r'window\.__NUXT__\s*=\s*({.*?});',
+        r'window\.__INITIAL_STATE__\s*=\s*({.*?});',
+        r'window\.data\s*=\s*({.*?});',
+        r'window\.job\s*=\s*({.*?});',
+        r'window\.jobData\s*=\s*({.*?});',
+        r'window\.__NUXT__\.data\s*=\s*({.*?});',
+        r'window\.__NUXT__\.state\s*=\s*({.*?});',
+        r'window\.__NUXT__\.payload\s*=\s*({.*?});'
+    )
+]
+
+# BeautifulSoup tree builders the scraper can parse with. html.parser ships with Python and is the
+# fallback; lxml is C-backed and builds the same tree for Upwork pages roughly twice as fast.
+PARSER_BACKENDS = ('html.parser', 'lxml')
+DEFAULT_PARSER_BACKEND = 'html.parser'
+
+
+@lru_cache(maxsize=None)
+def resolve_parser_backend(parser: Optional[str] = None) -> str:
+    """
+    Return the tree builder to use for `parser`, falling back to html.parser when the backend
+    is unknown or its library is not installed. Cached so the warning is logged once per process.
+    """
+    if not parser or parser == DEFAULT_PARSER_BACKEND:
+        return DEFAULT_PARSER_BACKEND
+    if parser not in PARSER_BACKENDS:
+        logger.warning(f"Unknown parser backend '{parser}', using {DEFAULT_PARSER_BACKEND}")
+        return DEFAULT_PARSER_BACKEND
+    if builder_registry.lookup(parser) is None:
+        logger.warning(f"Parser backend '{parser}' is not installed, using {DEFAULT_PARSER_BACKEND}")
+        return DEFAULT_PARSER_BACKEND
+    return parser
+
+
 class JobAttrExtractor:
     """Extract job data from Upwork HTML content"""
     
-    def __init__(self):
-        # Define the fields we want to extract
-        self.target_fields = [
-            'applicants',
-            'buyer_avgHourlyJobsRate_amount',
-            'buyer_company_contractDate',
-            'buyer_hire_rate_pct',
-            'buyer_jobs_openCount',
-            'buyer_jobs_postedCount',
-            'buyer_location_city',
-            'buyer_location_countryTimezone',
-            'buyer_location_localTime',
-            'buyer_location_offsetFromUtcMillis',
-            'buyer_stats_activeAssignmentsCount',
-            'buyer_stats_hoursCount',
-            'buyer_stats_totalJobsWithHires',
-            'category',
-            'categoryGroup_name',
-            'categoryGroup_urlSlug',
-            'category_name',
-            'category_urlSlug',
-            'clientActivity_invitationsSent',
-            'clientActivity_totalHired',
-            'clientActivity_totalInvitedToInterview',
-            'clientActivity_unansweredInvites',
-            'client_company_size',
-            'client_country',
-            'client_hires',
-            'client_industry',
-            'client_rating',
-            'client_reviews',
-            'client_total_spent',
-            'connects_required',
-            'contractorTier',
-            'currency',
-            'description',
-            'duration',
-            'enterpriseJob',
-            'fixed_budget_amount',
-            'hourly_max',
-            'hourly_min',
-            'isContractToHire',
-            'job_id',
-            'lastBuyerActivity',
-            'level',
-            'numberOfPositionsToHire',
-            'payment_verified',
-            'phone_verified',
-            'premium',
-            'qualifications',
-            'questions',
-            'skills',
-            'title',
-            'ts_create',
-            'ts_publish',
-            'type',
-            'url'
-        ]
-    
+    # Fields every record carries; extract_from_html fills missing ones with defaults
+    TARGET_FIELDS = (
+        'applicants',
+        'buyer_avgHourlyJobsRate_amount',
+        'buyer_company_contractDate',
+        'buyer_hire_rate_pct',
+        'buyer_jobs_openCount',
+        'buyer_jobs_postedCount',
+        'buyer_location_city',
+        'buyer_location_countryTimezone',
+        'buyer_location_localTime',
+        'buyer_location_offsetFromUtcMillis',
+        'buyer_stats_activeAssignmentsCount',
+        'buyer_stats_hoursCount',
+        'buyer_stats_totalJobsWithHires',
+        'category',
+        'categoryGroup_name',
+        'categoryGroup_urlSlug',
+        'category_name',
+        'category_urlSlug',
+        'clientActivity_invitationsSent',
+        'clientActivity_totalHired',
+        'clientActivity_totalInvitedToInterview',
+        'clientActivity_unansweredInvites',
+        'client_company_size',
+        'client_country',
+        'client_hires',
+        'client_industry',
+        'client_rating',
+        'client_reviews',
+        'client_total_spent',
+        'connects_required',
+        'contractorTier',
+        'currency',
+        'description',
+        'duration',
+        'enterpriseJob',
+        'fixed_budget_amount',
+        'hourly_max',
+        'hourly_min',
+        'isContractToHire',
+        'job_id',
+        'lastBuyerActivity',
+        'level',
+        'numberOfPositionsToHire',
+        'payment_verified',
+        'phone_verified',
+        'premium',
+        'qualifications',
+        'questions',
+        'skills',
+        'title',
+        'ts_create',
+        'ts_publish',
+        'type',
+        'url'
+    )
+    TARGET_FIELD_SET = frozenset(TARGET_FIELDS)
+    # Missing fields that default to "0" instead of ""
+    ZERO_DEFAULT_FIELDS = frozenset({
+        'buyer_avgHourlyJobsRate_amount', 'client_hires', 'client_total_spent',
+        'hourly_min', 'hourly_max', 'fixed_budget_amount', 'connects_required'
+    })
+
+    # Regexes are compiled once per process and shared by every instance
+    NUXT_DATA_PATTERN = re.compile(r'<script[^>]*id="__NUXT_DATA__"[^>]*>(.*?)</script>', re.DOTALL)
+    SCRIPT_JSON_PATTERNS = NUXT_SCRIPT_PATTERNS[:6]
+    URL_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in (
+        r'href="(/jobs/[^"]*)"',
+        r'href="(/freelance-jobs/[^"]*)"',
+        r'data-test="job-url"[^>]*href="([^"]*)"',
+        r'class="job-url"[^>]*href="([^"]*)"'
+    )]
+    SKILLS_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in (
+        r'data-test="skills"[^>]*>([^<]+)<',
+        r'class="skills"[^>]*>([^<]+)<',
+        r'<span[^>]*class="[^"]*skill[^"]*"[^>]*>([^<]+)</span>'
+    )]
+    BUDGET_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in (
+        r'\$(\d+(?:,\d{3})*(?:\.\d{2})?)',
+        r'(\d+(?:,\d{3})*(?:\.\d{2})?)\s*USD',
+        r'budget[^>]*>([^<]+)<'
+    )]
+    DURATION_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in (
+        r'duration[^>]*>([^<]+)<',
+        r'<span[^>]*class="[^"]*duration[^"]*"[^>]*>([^<]+)</span>'
+    )]
+    # Explicit duration phrases commonly used by Upwork UI
+    DURATION_PHRASE_PATTERN = re.compile(r'(More than 6 months|3 to 6 months|1 to 3 months|Less than 1 month)', re.IGNORECASE)
+    LEVEL_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in (
+        r'level[^>]*>([^<]+)<',
+        r'<span[^>]*class="[^"]*level[^"]*"[^>]*>([^<]+)</span>',
+        r'(Entry|Intermediate|Expert|Advanced)',
+        r'experience[^>]*level[^>]*>([^<]+)<',
+        r'<div[^>]*class="[^"]*level[^"]*"[^>]*>([^<]+)</div>'
+    )]
+    # A bare local time such as "6:09" or "12:09 PM", and a time token inside a longer string
+    TIME_ONLY_PATTERN = re.compile(r'^\s*\d{1,2}:\d{2}(\s*[AP]M)?\s*$', re.IGNORECASE)
+    TIME_TOKEN_PATTERN = re.compile(r'(\d{1,2}:\d{2}\s*(?:[AP]M)?)', re.IGNORECASE)
+    HIRE_RATE_PATTERN = re.compile(r'(\d+)% hire rate')
+    TAG_PATTERN = re.compile(r'<[^>]+>')
+    CITY_TIME_PATTERN = re.compile(r'^(.*?)(?:\D{0,4})?(\d{1,2}:\d{2}\s*(?:[AP]M)?)$', re.IGNORECASE)
+    # Nuxt index blocks in the raw page, e.g. {"offsetFromUtcMillis":139,"countryTimezone":140,"city":141,"country":142}
+    LOC_MAP_PATTERN = re.compile(r'\{"offsetFromUtcMillis":(\d+),"countryTimezone":(\d+),"city":(\d+),"country":(\d+)\}')
+    INDUSTRY_PATTERN = re.compile(r'\{"industry":(\d+),"size":(\d+)\}')
+    CURRENCY_PATTERN = re.compile(r'"currencyCode":(\d+)\},[^,]*,"([^"]+)"')
+    CATEGORY_PATTERN = re.compile(r'\{"name":(\d+),"urlSlug":(\d+)\},"([^"]+)","([^"]+)"')
+    HOURS_BLOCK_PATTERN = re.compile(
+        r'\{"totalAssignments":(\d+),"activeAssignmentsCount":(\d+),"hoursCount":(\d+),"feedbackCount":(\d+),"score":(\d+),"totalJobsWithHires":(\d+),"totalCharges":(\d+)\}'
+        r'\s*,\s*(\d+)\s*,\s*([\d\.]+)\s*,\s*(\d+)\s*,\s*([\d\.]+)\s*,\s*(\d+)'  # captures: totalAssignmentsVal, hoursVal, feedbackVal, scoreVal, totalJobsWithHiresVal
+    )
+    # Money amounts: a whole value with optional K suffix, and candidates inside noisy strings
+    MONEY_VALUE_PATTERN = re.compile(r'^([\d]+(?:\.\d+)?)([Kk])?$')
+    MONEY_CANDIDATE_PATTERNS = [
+        re.compile(r'(\d+(?:\.\d+)?[Kk]?)'),  # Numbers with optional K
+        re.compile(r'(\d+(?:,\d{3})*(?:\.\d{2})?)'),  # Numbers with commas
+    ]
+
+    def __init__(self, parser: str = DEFAULT_PARSER_BACKEND, payload_fast_path: bool = True):
+        # BeautifulSoup tree builder, see PARSER_BACKENDS
+        self.parser = resolve_parser_backend(parser)
+        # False always runs the full DOM extraction (used to check the fast path against it)
+        self.payload_fast_path = payload_fast_path
+
     def extract_from_html(self, html_content: str) -> Dict[str, Any]:
         """
         Extract job data from HTML content string
@@ -93,52 +363,22 @@ class JobAttrExtractor:
             Dictionary containing extracted job data
         """
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
-            extracted_data = {}
-            
-            # Method 1: Extract from JSON in script tags
-            json_data = self._extract_json_from_scripts(soup)
-            if json_data:
-                extracted_data.update(self._extract_from_json(json_data))
-            
-            # Method 2: Extract from HTML attributes and text content
-            html_data = self._extract_from_html_elements(soup)
-            extracted_data.update(html_data)
-            
-            # Method 3: Extract from meta tags and other sources
-            meta_data = self._extract_from_meta_tags(soup)
-            extracted_data.update(meta_data)
-            
-            # Method 4: Extract from data attributes
-            data_attrs = self._extract_from_data_attributes(soup)
-            extracted_data.update(data_attrs)
-            
-            # Method 5: Extract from HTML content and text
-            html_content_data = self._extract_from_html_content(soup)
-            extracted_data.update(html_content_data)
-            
-            # Method 6: Parse Nuxt data and resolve indices
+            # The __NUXT_DATA__ payload is the primary source; decode it before touching the DOM
             nuxt_data = self._parse_nuxt_data(html_content)
-            nuxt_lookup = {}
-            if nuxt_data:
-                nuxt_lookup = self._build_nuxt_lookup(nuxt_data)
-                # Resolve all extracted values that might be indices
-                for key, value in extracted_data.items():
-                    # Never resolve buyer_hire_rate_pct to avoid turning numbers like 100 into Nuxt indexes
-                    if key == 'buyer_hire_rate_pct':
-                        continue
-                    # Don't resolve fields that were correctly extracted from targeted blocks
-                    if key in ['client_hires', 'buyer_stats_hoursCount', 'client_reviews', 'client_rating', 'buyer_stats_totalJobsWithHires']:
-                        continue
-                    if value != "Not found":
-                        resolved_value = self._resolve_nuxt_index(value, nuxt_lookup)
-                        if resolved_value != value:
-                            extracted_data[key] = resolved_value
+            job_details = self._find_nuxt_job_details(nuxt_data) if nuxt_data else None
             
-            self._extract_missing_fields(html_content, extracted_data, nuxt_lookup)
+            extracted_data = {}
+            if job_details is not None and self.payload_fast_path:
+                # Fast path: payload values plus the few rendered labels, read from raw-string slices
+                payload_data = self._extract_from_nuxt_payload(job_details)
+                rendered_data = self._extract_rendered_fields(html_content)
+                payload_data.update(rendered_data)
+                if (all(payload_data.get(field) for field in NUXT_REQUIRED_FIELDS)
+                        and not self._needs_dom_pass(html_content, payload_data, rendered_data)):
+                    extracted_data = payload_data
             
-            # Method 7.5: Targeted block extraction AFTER all Nuxt resolution is complete
-            self._extract_targeted_block(html_content, extracted_data)
+            if not extracted_data:
+                self._extract_from_dom(html_content, extracted_data, nuxt_data, job_details)
             
             # Method 7.6: Clean up any remaining random values for protected fields
             self._cleanup_protected_fields(extracted_data)
@@ -200,9 +440,9 @@ class JobAttrExtractor:
                     extracted_data['hourly_max'] = '0'
             
             # Ensure all target fields are present with default values if missing
-            for field in self.target_fields:
+            for field in self.TARGET_FIELDS:
                 if field not in extracted_data:
-                    if field in ['buyer_avgHourlyJobsRate_amount', 'client_hires', 'client_total_spent', 'hourly_min', 'hourly_max', 'fixed_budget_amount', "connects_required"]:
+                    if field in self.ZERO_DEFAULT_FIELDS:
                         extracted_data[field] = "0"
                     elif field == 'payment_verified':
                         extracted_data[field] = False
@@ -215,25 +455,201 @@ class JobAttrExtractor:
             logger.error(f"Error extracting data from HTML: {str(e)}")
             return {}
     
-    def _extract_json_from_scripts(self, soup: BeautifulSoup) -> Optional[Dict]:
+    def _extract_from_dom(self, html_content: str, extracted_data: Dict[str, Any], nuxt_data: Optional[list], job_details: Optional[Dict[str, Any]]):
+        """Full extraction: DOM passes, then payload values or the raw-HTML Nuxt fallback"""
+        soup = BeautifulSoup(html_content, self.parser)
+        
+        # Walk the tree once; the DOM extractors below only read from this scan
+        scan = self._scan_document(soup)
+        
+        # Method 1: Extract from JSON in script tags
+        json_data = self._extract_json_from_scripts(scan['scripts'])
+        if json_data:
+            extracted_data.update(self._extract_from_json(json_data))
+        
+        # Method 2: Extract from HTML attributes and text content
+        html_data = self._extract_from_html_elements(scan)
+        extracted_data.update(html_data)
+        
+        # Method 3: Extract from meta tags and other sources
+        meta_data = self._extract_from_meta_tags(scan)
+        extracted_data.update(meta_data)
+        
+        # Method 4: Extract from HTML content and text (page-text heuristics only without a payload)
+        html_content_data = self._extract_from_html_content(soup, scan, include_page_text=job_details is None)
+        extracted_data.update(html_content_data)
+        
+        if job_details is not None:
+            # Method 5: Typed values read by path from the decoded payload win over the DOM
+            for field, value in self._extract_from_nuxt_payload(job_details).items():
+                if field in NUXT_DOM_PREFERRED_FIELDS and extracted_data.get(field):
+                    continue
+                extracted_data[field] = value
+        else:
+            # Method 6: Fallback for pages without a usable payload - regex scan and index resolution
+            nuxt_lookup = {}
+            if nuxt_data:
+                nuxt_lookup = self._build_nuxt_lookup(nuxt_data)
+                # Resolve all extracted values that might be indices
+                for key, value in extracted_data.items():
+                    # Never resolve buyer_hire_rate_pct to avoid turning numbers like 100 into Nuxt indexes
+                    if key == 'buyer_hire_rate_pct':
+                        continue
+                    # Don't resolve fields that were correctly extracted from targeted blocks
+                    if key in ['client_hires', 'buyer_stats_hoursCount', 'client_reviews', 'client_rating', 'buyer_stats_totalJobsWithHires']:
+                        continue
+                    if value != "Not found":
+                        resolved_value = self._resolve_nuxt_index(value, nuxt_lookup)
+                        if resolved_value != value:
+                            extracted_data[key] = resolved_value
+            
+            self._extract_missing_fields(html_content, extracted_data, nuxt_lookup)
+            
+            # Method 7.5: Targeted block extraction AFTER all Nuxt resolution is complete
+            self._extract_targeted_block(html_content, extracted_data)
+
+    def _extract_rendered_fields(self, html_content: str) -> Dict[str, Any]:
+        """Values only the rendered page carries, read from slices of the raw HTML without a DOM"""
+        extracted = {}
+        
+        # Company size label, preferred over the payload's raw value (see NUXT_DOM_PREFERRED_FIELDS)
+        size_label = self._slice_rendered_text(html_content, 'data-qa="client-company-profile-size"')
+        if size_label:
+            extracted['client_company_size'] = size_label
+        
+        # Buyer local time from the client location block: "United States Austin 6:09 PM"
+        location_text = self._slice_rendered_text(html_content, 'data-qa="client-location"', '</li>')
+        time_token = self.TIME_TOKEN_PATTERN.search(location_text)
+        if time_token:
+            extracted['buyer_location_localTime'] = time_token.group(1).strip()
+        
+        # Hire rate from the job posting stats: "120 jobs posted 40% hire rate, 5 open jobs"
+        posting_stats = self._slice_rendered_text(html_content, 'data-qa="client-job-posting-stats"', '</li>')
+        hire_rate = self.HIRE_RATE_PATTERN.search(posting_stats)
+        if hire_rate:
+            extracted['buyer_hire_rate_pct'] = hire_rate.group(1)
+        return extracted
+
+    def _needs_dom_pass(self, html_content: str, payload_data: Dict[str, Any], rendered_data: Dict[str, Any]) -> bool:
+        """True when the DOM pass could fill a field the fast path left out (see NUXT_DOM_MARKERS)"""
+        for field, markers in NUXT_DOM_MARKERS.items():
+            # DOM-preferred fields count as found only when the rendered label was read
+            found = rendered_data if field in NUXT_DOM_PREFERRED_FIELDS else payload_data
+            if field not in found and any(marker in html_content for marker in markers):
+                return True
+        
+        # JSON assigned in inline scripts can carry any target field (see _extract_json_from_scripts)
+        script_pos = html_content.find('type="text/javascript"')
+        while script_pos != -1:
+            body_start = html_content.find('>', script_pos) + 1
+            body_end = html_content.find('</script>', body_start)
+            if not body_start or body_end == -1:
+                break
+            body = html_content[body_start:body_end]
+            stripped = body.strip()
+            if (stripped.startswith('{') and stripped.endswith('}')) or any(pattern.search(body) for pattern in self.SCRIPT_JSON_PATTERNS):
+                return True
+            script_pos = html_content.find('type="text/javascript"', body_end)
+        return False
+
+    def _slice_rendered_text(self, html_content: str, marker: str, end: str = '<') -> str:
+        """Text between the tag carrying `marker` and the next `end`, with tags stripped"""
+        marker_pos = html_content.find(marker)
+        if marker_pos == -1:
+            return ''
+        body_start = html_content.find('>', marker_pos) + 1
+        body_end = html_content.find(end, body_start)
+        if not body_start or body_end == -1:
+            return ''
+        return ' '.join(unescape(self.TAG_PATTERN.sub(' ', html_content[body_start:body_end])).split())
+
+    def _scan_document(self, soup: BeautifulSoup) -> Dict[str, Any]:
+        """Walk the parsed tree once and route each node to the buckets the DOM extractors read.
+
+        Every bucket keeps document order, so consumers see the same elements in the same
+        order a ``find_all``/``select_one`` over the whole tree would have returned.
+        """
+        scan = {
+            'title': None,               # first <title> tag
+            'meta': [],                  # all <meta> tags
+            'scripts': [],               # <script type="text/javascript"> tags
+            'data_test': [],             # (element, data-test value, stripped text)
+            'data_qa': [],               # elements carrying a data-qa attribute
+            'clock_timelog': [],         # elements with data-cy="clock-timelog"
+            'selectors': {},             # first element per description selector
+            'air3_badges': [],           # <a class="air3-badge">
+            'skills_containers': [],     # <div class="skills-list">
+            'payment_verified': False,   # any element with class payment-verified
+            'phone_verified': False,     # any element with class phone-verified
+            'payment_verified_text': False,
+            'phone_verified_text': False,
+        }
+        selectors = scan['selectors']
+        data_test_elements = []
+
+        for node in soup.descendants:
+            if not isinstance(node, Tag):
+                # Text, comments and script bodies: only the verification phrases matter
+                if not scan['payment_verified_text'] and 'Payment method verified' in node:
+                    scan['payment_verified_text'] = True
+                if not scan['phone_verified_text'] and 'Phone number verified' in node:
+                    scan['phone_verified_text'] = True
+                continue
+
+            name = node.name
+            attrs = node.attrs
+            if name == 'title':
+                if scan['title'] is None:
+                    scan['title'] = node
+            elif name == 'meta':
+                scan['meta'].append(node)
+            elif name == 'script':
+                if attrs.get('type') == 'text/javascript':
+                    scan['scripts'].append(node)
+
+            if not attrs:
+                continue
+
+            data_test = attrs.get('data-test')
+            if data_test is not None:
+                data_test_elements.append(node)
+                if name in ('div', 'section'):
+                    selectors.setdefault(f'{name}[data-test="{data_test}"]', node)
+            if 'data-qa' in attrs:
+                scan['data_qa'].append(node)
+            if attrs.get('data-cy') == 'clock-timelog':
+                scan['clock_timelog'].append(node)
+
+            classes = attrs.get('class')
+            if classes:
+                for cls in classes:
+                    if cls == 'payment-verified':
+                        scan['payment_verified'] = True
+                    elif cls == 'phone-verified':
+                        scan['phone_verified'] = True
+                    elif cls in ('job-description', 'description'):
+                        selectors.setdefault(f'.{cls}', node)
+                if name == 'a' and 'air3-badge' in classes:
+                    scan['air3_badges'].append(node)
+                elif name == 'div' and 'skills-list' in classes:
+                    scan['skills_containers'].append(node)
+
+        # Text of data-test elements is read by several extractors; compute it once
+        scan['data_test'] = [
+            (element, element.get('data-test'), element.get_text().strip())
+            for element in data_test_elements
+        ]
+        return scan
+
+    def _extract_json_from_scripts(self, scripts: list) -> Optional[Dict]:
         """Extract JSON data from script tags"""
         try:
             # Look for common patterns in script tags
-            script_patterns = [
-                r'window\.__NUXT__\s*=\s*({.*?});',
-                r'window\.__INITIAL_STATE__\s*=\s*({.*?});',
-                r'window\.data\s*=\s*({.*?});',
-                r'window\.job\s*=\s*({.*?});',
-                r'window\.jobData\s*=\s*({.*?});',
-                r'window\.__NUXT__\.data\s*=\s*({.*?});'
-            ]
-            
-            scripts = soup.find_all('script', type='text/javascript')
             for script in scripts:
                 if script.string:
                     content = script.string
-                    for pattern in script_patterns:
-                        matches = re.findall(pattern, content, re.DOTALL)
+                    for pattern in self.SCRIPT_JSON_PATTERNS:
+                        matches = pattern.findall(content)
                         for match in matches:
                             try:
                                 return json.loads(match)
@@ -260,45 +676,57 @@ class JobAttrExtractor:
         """Extract target fields from JSON data"""
         extracted = {}
         
-        def search_in_dict(data, path=""):
+        target_field_set = self.TARGET_FIELD_SET
+
+        def search_in_dict(data):
             """Recursively search for target fields in nested dictionary"""
             if isinstance(data, dict):
                 for key, value in data.items():
-                    current_path = f"{path}.{key}" if path else key
-                    
-                    # Check if this key matches any target field
-                    for target_field in self.target_fields:
-                        if key == target_field or current_path.endswith(f".{target_field}"):
-                            extracted[target_field] = value
+                    # A key matches a target field by name or by its last dotted segment ("job.title")
+                    field = key.rpartition('.')[2] if isinstance(key, str) else key
+                    if field in target_field_set:
+                        extracted[field] = value
                     
                     # Recursively search nested dictionaries
                     if isinstance(value, dict):
-                        search_in_dict(value, current_path)
+                        search_in_dict(value)
                     elif isinstance(value, list):
-                        for i, item in enumerate(value):
+                        for item in value:
                             if isinstance(item, dict):
-                                search_in_dict(item, f"{current_path}[{i}]")
+                                search_in_dict(item)
             elif isinstance(data, list):
-                for i, item in enumerate(data):
+                for item in data:
                     if isinstance(item, dict):
-                        search_in_dict(item, f"{path}[{i}]")
+                        search_in_dict(item)
         
         search_in_dict(json_data)
         return extracted
 
+    def _slice_nuxt_script(self, html_content: str) -> Optional[str]:
+        """Return the body of the __NUXT_DATA__ script tag, located by string offsets"""
+        marker = html_content.find('id="__NUXT_DATA__"')
+        if marker != -1:
+            tag_start = html_content.rfind('<', 0, marker)
+            body_start = html_content.find('>', marker) + 1
+            body_end = html_content.find('</script>', body_start)
+            if html_content.startswith('<script', tag_start) and body_start and body_end != -1:
+                return html_content[body_start:body_end]
+        # Unusual markup (attribute spacing, nested quotes): fall back to the tag regex
+        match = self.NUXT_DATA_PATTERN.search(html_content)
+        return match.group(1) if match else None
+
     def _parse_nuxt_data(self, html_content):
         """Parse the __NUXT_DATA__ script tag to extract the data array"""
         # Look for the __NUXT_DATA__ script tag
-        nuxt_pattern = r'<script[^>]*id="__NUXT_DATA__"[^>]*>(.*?)</script>'
-        match = re.search(nuxt_pattern, html_content, re.DOTALL)
+        script_body = self._slice_nuxt_script(html_content)
         
-        if not match:
+        if script_body is None:
             logger.warning("Could not find __NUXT_DATA__ script tag")
             return None
         
         try:
             # Parse the JSON data
-            nuxt_data = json.loads(match.group(1))
+            nuxt_data = json.loads(script_body)
             return nuxt_data
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse __NUXT_DATA__ JSON: {e}")
@@ -341,27 +769,193 @@ class JobAttrExtractor:
                     return value
                 return resolved
         return value
-    
-    def _extract_from_html_elements(self, soup: BeautifulSoup) -> Dict[str, Any]:
+
+    def _find_nuxt_job_details(self, nuxt_data) -> Optional[Dict[str, Any]]:
+        """Locate the job details object ({"job": ..., "buyer": ...}) in the Nuxt data array and decode it"""
+        if not isinstance(nuxt_data, list):
+            return None
+        for index, value in enumerate(nuxt_data):
+            if isinstance(value, dict) and 'job' in value and 'buyer' in value:
+                job_details = self._decode_nuxt_value(nuxt_data, index, {})
+                if isinstance(job_details.get('job'), dict):
+                    return job_details
+        logger.warning("Could not find job details in __NUXT_DATA__")
+        return None
+
+    def _decode_nuxt_value(self, nuxt_data: list, index: Any, cache: Dict[int, Any]) -> Any:
+        """Rebuild the value stored at `index` of a devalue-encoded Nuxt data array.
+
+        Objects and arrays hold indices of their children, ``[type, ...]`` arrays are
+        devalue/Nuxt special forms and negative indices are sentinels. Decoded containers
+        are cached by index so shared and cyclic references resolve to the same object.
+        """
+        if isinstance(index, bool) or not isinstance(index, int):
+            return None
+        if index < 0:
+            return NUXT_SENTINELS.get(index)
+        if index >= len(nuxt_data):
+            return None
+        if index in cache:
+            return cache[index]
+
+        raw = nuxt_data[index]
+        if isinstance(raw, dict):
+            obj = {}
+            cache[index] = obj
+            for key, child in raw.items():
+                obj[key] = self._decode_nuxt_value(nuxt_data, child, cache)
+            return obj
+        if not isinstance(raw, list):
+            return raw
+        if not raw or not isinstance(raw[0], str):
+            arr = []
+            cache[index] = arr
+            arr.extend(self._decode_nuxt_value(nuxt_data, child, cache) for child in raw)
+            return arr
+
+        kind = raw[0]
+        cache[index] = None
+        if kind in ('Date', 'RegExp', 'Object'):
+            # Literal payloads: ISO date string, regex source, boxed primitive
+            value = raw[1] if len(raw) > 1 else None
+        elif kind == 'BigInt':
+            value = int(raw[1])
+        elif kind == 'Set':
+            value = [self._decode_nuxt_value(nuxt_data, child, cache) for child in raw[1:]]
+        elif kind in ('Map', 'null'):
+            # Map stores [key, value] index pairs; 'null' is a prototype-less object with literal keys
+            value = {}
+            for key, child in zip(raw[1::2], raw[2::2]):
+                if kind == 'Map':
+                    key = self._decode_nuxt_value(nuxt_data, key, cache)
+                try:
+                    value[key] = self._decode_nuxt_value(nuxt_data, child, cache)
+                except TypeError:
+                    value[str(key)] = self._decode_nuxt_value(nuxt_data, child, cache)
+        elif kind in ('EmptyRef', 'EmptyShallowRef'):
+            data = self._decode_nuxt_value(nuxt_data, raw[1], cache) if len(raw) > 1 else None
+            try:
+                value = None if data in (None, '_') else json.loads(data)
+            except (TypeError, json.JSONDecodeError):
+                value = data
+        else:
+            # Reactive, ShallowReactive, Ref, ShallowRef, Object, NuxtError, ...: unwrap the payload
+            value = self._decode_nuxt_value(nuxt_data, raw[1], cache) if len(raw) > 1 else None
+        cache[index] = value
+        return value
+
+    def _find_nuxt_key(self, node: Any, key: str) -> Any:
+        """Breadth-first search for the first object below `node` that carries `key`"""
+        queue = [node]
+        seen = set()
+        while queue:
+            current = queue.pop(0)
+            if id(current) in seen:
+                continue
+            seen.add(id(current))
+            if isinstance(current, dict):
+                if key in current:
+                    return current[key]
+                queue.extend(v for v in current.values() if isinstance(v, (dict, list)))
+            elif isinstance(current, list):
+                queue.extend(v for v in current if isinstance(v, (dict, list)))
+        return None
+
+    def _resolve_nuxt_path(self, node: Any, path: str) -> Any:
+        """Read a dotted path such as 'buyer.stats.hoursCount' from a decoded Nuxt object"""
+        keys = path.split('.')
+        if keys[0] == '*':
+            node = self._find_nuxt_key(node, keys[1])
+            keys = keys[2:]
+        for key in keys:
+            if not isinstance(node, dict):
+                return None
+            node = node.get(key)
+        return node
+
+    def _coerce_nuxt_value(self, value: Any, kind: str) -> Any:
+        """Convert a raw payload value to the field's type; None means the value is unusable"""
+        if value is None:
+            return None
+        if kind == 'str':
+            if isinstance(value, (dict, list)):
+                return None
+            text = str(value).strip()
+            return text or None
+        if kind == 'bool':
+            if isinstance(value, bool):
+                return value
+            if isinstance(value, (int, float)):
+                return bool(value)
+            if isinstance(value, str) and value.lower() in ('true', 'false'):
+                return value.lower() == 'true'
+            return None
+        if kind in ('int', 'number'):
+            if isinstance(value, bool):
+                return None
+            if isinstance(value, str):
+                try:
+                    value = float(value.replace(',', ''))
+                except ValueError:
+                    return None
+            if not isinstance(value, (int, float)) or value != value:
+                return None
+            if kind == 'int' or float(value).is_integer():
+                return int(value)
+            return value
+        if kind == 'job_type':
+            return NUXT_JOB_TYPES.get(value.upper() if isinstance(value, str) else value)
+        if kind == 'level':
+            return NUXT_CONTRACTOR_TIERS.get(value.upper() if isinstance(value, str) else value)
+        if kind == 'questions':
+            if not isinstance(value, list):
+                return None
+            questions = [q.get('question') if isinstance(q, dict) else q for q in value]
+            questions = [str(q).strip() for q in questions if q]
+            return questions or None
+        if kind == 'skills':
+            # job.sandsData holds ontology/additional skill lists; job.skills is a plain list
+            if isinstance(value, dict):
+                value = [item for key in NUXT_SKILL_KEYS if isinstance(value.get(key), list) for item in value[key]]
+            if not isinstance(value, list):
+                return None
+            skills = [s.get('prefLabel') or s.get('name') if isinstance(s, dict) else s for s in value]
+            skills = [str(s).strip() for s in skills if isinstance(s, str) and s.strip()]
+            return list(dict.fromkeys(skills)) or None
+        return value
+
+    def _extract_from_nuxt_payload(self, job_details: Dict[str, Any]) -> Dict[str, Any]:
+        """Extract target fields from the decoded job details object by path"""
+        extracted = {}
+        for field, (paths, kind) in NUXT_FIELD_PATHS.items():
+            for path in paths:
+                value = self._coerce_nuxt_value(self._resolve_nuxt_path(job_details, path), kind)
+                if value is not None:
+                    extracted[field] = value
+                    break
+
+        # Older payloads omit the job type; the hourly budget range implies it
+        if 'type' not in extracted and (extracted.get('hourly_min') or extracted.get('hourly_max')):
+            extracted['type'] = 'Hourly'
+        return extracted
+
+    def _extract_from_html_elements(self, scan: Dict[str, Any]) -> Dict[str, Any]:
         """Extract data from HTML elements"""
         extracted = {}
         
         # Extract title from title tag
-        title_tag = soup.find('title')
+        title_tag = scan['title']
         if title_tag:
             extracted['title'] = title_tag.get_text().strip()
         
         # Extract description from meta description
-        meta_desc = soup.find('meta', attrs={'name': 'description'})
+        meta_desc = next((meta for meta in scan['meta'] if meta.get('name') == 'description'), None)
         if meta_desc:
             extracted['description'] = meta_desc.get('content', '').strip()
         
         # Look for job-specific data in various HTML elements
-        data_elements = soup.find_all(attrs={'data-test': True})
-        for element in data_elements:
-            data_test = element.get('data-test')
+        for element, data_test, text_content in scan['data_test']:
             if data_test in ['job-title', 'job-description', 'job-budget', 'job-duration']:
-                text_content = element.get_text().strip()
                 if text_content:
                     if data_test == 'job-title':
                         extracted['title'] = text_content
@@ -370,13 +964,12 @@ class JobAttrExtractor:
         
         return extracted
     
-    def _extract_from_meta_tags(self, soup: BeautifulSoup) -> Dict[str, Any]:
+    def _extract_from_meta_tags(self, scan: Dict[str, Any]) -> Dict[str, Any]:
         """Extract data from meta tags"""
         extracted = {}
         
         # Look for job-related meta tags
-        meta_tags = soup.find_all('meta')
-        for meta in meta_tags:
+        for meta in scan['meta']:
             name = meta.get('name', '').lower()
             content = meta.get('content', '')
             
@@ -388,36 +981,16 @@ class JobAttrExtractor:
         
         return extracted
     
-    def _extract_from_data_attributes(self, soup: BeautifulSoup) -> Dict[str, Any]:
-        """Extract data from data attributes"""
-        extracted = {}
-        
-        # Look for elements with data attributes that might contain job data
-        elements_with_data = soup.find_all(attrs=lambda x: x and isinstance(x, dict) and any(
-            attr.startswith('data-') for attr in x.keys()
-        ))
-        
-        for element in elements_with_data:
-            for attr, value in element.attrs.items():
-                if attr.startswith('data-'):
-                    # Check if this data attribute might contain job information
-                    if any(field in attr.lower() for field in ['job', 'title', 'description', 'budget', 'duration']):
-                        # Try to extract meaningful data
-                        if isinstance(value, str) and value.strip():
-                            # Map common data attributes to our target fields
-                            if 'title' in attr.lower():
-                                extracted['title'] = value
-                            elif 'description' in attr.lower():
-                                extracted['description'] = value
-        
-        return extracted
-    
-    def _extract_from_html_content(self, soup: BeautifulSoup) -> Dict[str, Any]:
-        """Extract data from HTML content and text"""
+    def _extract_from_html_content(self, soup: BeautifulSoup, scan: Dict[str, Any], include_page_text: bool = True) -> Dict[str, Any]:
+        """Extract data from HTML content and text
+
+        The keyword/regex heuristics over the serialized page only run when
+        `include_page_text` is set (i.e. there is no Nuxt payload to read from).
+        """
         extracted = {}
         
         # Extract title from title tag
-        title_tag = soup.find('title')
+        title_tag = scan['title']
         if title_tag:
             extracted['title'] = title_tag.get_text().strip()
         
@@ -433,7 +1006,7 @@ class JobAttrExtractor:
         ]
         
         for selector in description_selectors:
-            desc_element = soup.select_one(selector)
+            desc_element = scan['selectors'].get(selector)
             if desc_element:
                 # For the specific Description structure, look for the p tag inside
                 if 'data-test="Description"' in selector:
@@ -459,11 +1032,7 @@ class JobAttrExtractor:
                     break
         
         # Look for job details in various data-test attributes
-        data_test_elements = soup.find_all(attrs={'data-test': True})
-        for element in data_test_elements:
-            data_test = element.get('data-test', '')
-            text_content = element.get_text().strip()
-            
+        for element, data_test, text_content in scan['data_test']:
             if text_content:
                 if 'job-title' in data_test or 'title' in data_test:
                     extracted['title'] = text_content
@@ -499,8 +1068,7 @@ class JobAttrExtractor:
                     extracted['qualifications'].append(text_content)
         
         # Look for specific client/buyer data using data-qa attributes
-        data_qa_elements = soup.find_all(attrs={'data-qa': True})
-        for element in data_qa_elements:
+        for element in scan['data_qa']:
             data_qa = element.get('data-qa', '')
             text_content = element.get_text().strip()
             
@@ -512,7 +1080,7 @@ class JobAttrExtractor:
                         extracted['buyer_avgHourlyJobsRate_amount'] = rate_match.group(1)
                 elif data_qa == 'client-job-posting-stats':
                     # Extract hire rate: "40% hire rate, 5 open jobs"
-                    hire_rate_match = re.search(r'(\d+)% hire rate', text_content)
+                    hire_rate_match = self.HIRE_RATE_PATTERN.search(text_content)
                     if hire_rate_match:
                         extracted['buyer_hire_rate_pct'] = hire_rate_match.group(1)
                 elif data_qa == 'client-location':
@@ -525,13 +1093,13 @@ class JobAttrExtractor:
                         city_text = city_div.get_text().strip()
                         if city_text and city_text != 'United States':
                             # If the entire text looks like a time (e.g., "6:09" or "12:09 PM"), store as localTime only
-                            if re.match(r'^\s*\d{1,2}:\d{2}(\s*[AP]M)?\s*$', city_text, re.IGNORECASE):
+                            if self.TIME_ONLY_PATTERN.match(city_text):
                                 extracted['buyer_location_localTime'] = city_text.strip()
                                 # Don't set city in this case
                                 continue
                             # Handle cases where city and time are concatenated, possibly with stray letters like "Vs10:35 PM"
                             # Strategy 1: direct split by locating the time token anywhere in the string
-                            time_token = re.search(r'(\d{1,2}:\d{2}\s*(?:[AP]M)?)', city_text, re.IGNORECASE)
+                            time_token = self.TIME_TOKEN_PATTERN.search(city_text)
                             if time_token:
                                 city_part = city_text[:time_token.start()].strip()
                                 time_part = time_token.group(1).strip()
@@ -540,7 +1108,7 @@ class JobAttrExtractor:
                                 extracted['buyer_location_localTime'] = time_part
                             else:
                                 # Strategy 2: pattern city + optional non-digits + time at end
-                                time_match = re.search(r'^(.*?)(?:\D{0,4})?(\d{1,2}:\d{2}\s*(?:[AP]M)?)$', city_text, re.IGNORECASE)
+                                time_match = self.CITY_TIME_PATTERN.search(city_text)
                                 if time_match:
                                     city_part = time_match.group(1).strip()
                                     time_part = time_match.group(2).strip()
@@ -553,7 +1121,7 @@ class JobAttrExtractor:
                                     if len(parts) >= 2:
                                         # Detect a time token anywhere in the remainder
                                         remainder = ' '.join(parts[1:])
-                                        m = re.search(r'(\d{1,2}:\d{2}\s*(?:[AP]M)?)', remainder, re.IGNORECASE)
+                                        m = self.TIME_TOKEN_PATTERN.search(remainder)
                                         if m:
                                             extracted['buyer_location_city'] = parts[0]
                                             extracted['buyer_location_localTime'] = m.group(1).strip()
@@ -561,7 +1129,7 @@ class JobAttrExtractor:
                                             extracted['buyer_location_city'] = city_text
                                     else:
                                         # Single token: ensure it's not just a time before assigning as city
-                                        if re.match(r'^\s*\d{1,2}:\d{2}(\s*[AP]M)?\s*$', city_text, re.IGNORECASE):
+                                        if self.TIME_ONLY_PATTERN.match(city_text):
                                             extracted['buyer_location_localTime'] = city_text.strip()
                                         else:
                                             extracted['buyer_location_city'] = city_text
@@ -595,30 +1163,17 @@ class JobAttrExtractor:
         
         # Look for payment verification status
         # Check for payment verification icon and text
-        payment_verified_elements = soup.find_all(class_='payment-verified')
-        if payment_verified_elements:
+        if scan['payment_verified'] or scan['payment_verified_text']:
             extracted['payment_verified'] = True
-        else:
-            # Alternative check: look for "Payment method verified" text
-            payment_text_elements = soup.find_all(text=lambda text: text and 'Payment method verified' in text)
-            if payment_text_elements:
-                extracted['payment_verified'] = True
         
         # Look for phone verification status
         # Check for phone verification icon and text
-        phone_verified_elements = soup.find_all(class_='phone-verified')
-        if phone_verified_elements:
+        if scan['phone_verified'] or scan['phone_verified_text']:
             extracted['phone_verified'] = True
-        else:
-            # Alternative check: look for "Phone number verified" text
-            phone_text_elements = soup.find_all(text=lambda text: text and 'Phone number verified' in text)
-            if phone_text_elements:
-                extracted['phone_verified'] = True
         
         # Look for hourly rate ranges in specific HTML structure
         # Pattern: $10.00 - $25.00
-        hourly_rate_elements = soup.find_all(attrs={'data-cy': 'clock-timelog'})
-        for element in hourly_rate_elements:
+        for element in scan['clock_timelog']:
             # Look for the rate structure in the parent element
             parent = element.find_parent()
             if parent:
@@ -631,78 +1186,54 @@ class JobAttrExtractor:
                     break
         
         # Look for category information in various formats
-        category_elements = soup.find_all(attrs={'data-test': 'category'})
-        for element in category_elements:
-            text_content = element.get_text().strip()
-            if text_content:
+        for element, data_test, text_content in scan['data_test']:
+            if data_test == 'category' and text_content:
                 extracted['category'] = text_content
         
         # Look for skills in various formats
-        skills_elements = soup.find_all(attrs={'data-test': 'skills'})
-        if skills_elements:
-            skills_list = []
-            for element in skills_elements:
-                text_content = element.get_text().strip()
-                if text_content:
-                    skills_list.append(text_content)
-            if skills_list:
-                extracted['skills'] = skills_list
+        skills_list = [text for _, data_test, text in scan['data_test'] if data_test == 'skills' and text]
+        if skills_list:
+            extracted['skills'] = skills_list
         
         # Look for skills in the specific HTML structure with air3-badge
-        skills_badges = soup.find_all('a', class_='air3-badge')
-        if skills_badges:
-            skills_list = []
-            for badge in skills_badges:
-                # Get the text content from the line-clamp div
-                line_clamp = badge.find('div', class_='air3-line-clamp')
-                if line_clamp:
-                    skill_text = line_clamp.get_text().strip()
-                    if skill_text:
-                        skills_list.append(skill_text)
-            if skills_list:
-                extracted['skills'] = skills_list
+        badge_skills = []
+        for badge in scan['air3_badges']:
+            # Get the text content from the line-clamp div
+            line_clamp = badge.find('div', class_='air3-line-clamp')
+            skill_text = line_clamp.get_text().strip() if line_clamp else ''
+            badge_skills.append((badge, skill_text))
+        skills_list = [skill_text for _, skill_text in badge_skills if skill_text]
+        if skills_list:
+            extracted['skills'] = skills_list
         
         # Also look for skills in skills-list containers
-        skills_containers = soup.find_all('div', class_='skills-list')
-        if skills_containers:
-            skills_list = []
-            for container in skills_containers:
-                # Look for all badges within this container
-                badges = container.find_all('a', class_='air3-badge')
-                for badge in badges:
-                    line_clamp = badge.find('div', class_='air3-line-clamp')
-                    if line_clamp:
-                        skill_text = line_clamp.get_text().strip()
-                        if skill_text:
-                            skills_list.append(skill_text)
-            if skills_list:
-                extracted['skills'] = skills_list
+        skills_list = []
+        for container in scan['skills_containers']:
+            # Look for all badges within this container
+            for badge, skill_text in badge_skills:
+                if skill_text and any(parent is container for parent in badge.parents):
+                    skills_list.append(skill_text)
+        if skills_list:
+            extracted['skills'] = skills_list
         
         # Look for questions
-        questions_elements = soup.find_all(attrs={'data-test': 'questions'})
-        if questions_elements:
-            questions_list = []
-            for element in questions_elements:
-                text_content = element.get_text().strip()
-                if text_content:
-                    questions_list.append(text_content)
-            if questions_list:
-                extracted['questions'] = questions_list
+        questions_list = [text for _, data_test, text in scan['data_test'] if data_test == 'questions' and text]
+        if questions_list:
+            extracted['questions'] = questions_list
         
         # Look for specific job information in the content
         # Extract deliverables
-        deliverables = soup.find_all(attrs={'data-test': 'deliverable'})
-        if deliverables:
-            qual_list = []
-            for del_item in deliverables:
-                text = del_item.get_text().strip()
-                if text:
-                    qual_list.append(text)
-            if qual_list:
-                extracted['qualifications'] = qual_list
+        qual_list = [text for _, data_test, text in scan['data_test'] if data_test == 'deliverable' and text]
+        if qual_list:
+            extracted['qualifications'] = qual_list
+        
+        if not include_page_text:
+            return extracted
         
         # Look for job type information (prefer explicit signals, avoid defaulting)
         html_content = str(soup)
+        # Lowercased once; every phrase check below reads from it
+        html_lower = html_content.lower()
         if 'type' not in extracted:
             # If we captured hourly range earlier, we already set type; as a fallback, infer from other concrete signals
             if 'hourly_min' in extracted or 'hourly_max' in extracted:
@@ -711,109 +1242,74 @@ class JobAttrExtractor:
                 extracted['type'] = 'Fixed'
             else:
                 # As a last resort, look for strong phrases
-                text_lower = html_content.lower()
-                if 'fixed price' in text_lower or 'fixed-price' in text_lower:
+                if 'fixed price' in html_lower or 'fixed-price' in html_lower:
                     extracted['type'] = 'Fixed'
-                elif '/hr' in text_lower or ' per hour' in text_lower:
+                elif '/hr' in html_lower or ' per hour' in html_lower:
                     extracted['type'] = 'Hourly'
         
         # Look for premium job indicators
-        if 'premium' in html_content.lower():
+        if 'premium' in html_lower:
             extracted['premium'] = True
         
         # Look for contract to hire indicators
-        if 'contract to hire' in html_content.lower() or 'contract-to-hire' in html_content.lower():
+        if 'contract to hire' in html_lower or 'contract-to-hire' in html_lower:
             extracted['isContractToHire'] = True
         
         # Look for enterprise job indicators
-        if 'enterprise' in html_content.lower():
+        if 'enterprise' in html_lower:
             extracted['enterpriseJob'] = True
         
         # Look for job URL
-        url_patterns = [
-            r'href="(/jobs/[^"]*)"',
-            r'href="(/freelance-jobs/[^"]*)"',
-            r'data-test="job-url"[^>]*href="([^"]*)"',
-            r'class="job-url"[^>]*href="([^"]*)"'
-        ]
-        
-        for pattern in url_patterns:
-            matches = re.findall(pattern, html_content, re.IGNORECASE)
-            if matches:
-                extracted['url'] = matches[0]
+        for pattern in self.URL_PATTERNS:
+            # Only the first hit is used, so stop scanning there
+            match = pattern.search(html_content)
+            if match:
+                extracted['url'] = match.group(1)
                 break
     
         
         # Look for skills in various formats
-        skills_patterns = [
-            r'data-test="skills"[^>]*>([^<]+)<',
-            r'class="skills"[^>]*>([^<]+)<',
-            r'<span[^>]*class="[^"]*skill[^"]*"[^>]*>([^<]+)</span>'
-        ]
-        
-        for pattern in skills_patterns:
-            matches = re.findall(pattern, html_content, re.IGNORECASE)
-            if matches:
-                skills_text = matches[0]
+        for pattern in self.SKILLS_PATTERNS:
+            match = pattern.search(html_content)
+            if match:
+                skills_text = match.group(1)
                 skills = [skill.strip() for skill in skills_text.split(',') if skill.strip()]
                 if skills:
                     extracted['skills'] = skills
                 break
         
         # Look for budget information
-        budget_patterns = [
-            r'\$(\d+(?:,\d{3})*(?:\.\d{2})?)',
-            r'(\d+(?:,\d{3})*(?:\.\d{2})?)\s*USD',
-            r'budget[^>]*>([^<]+)<'
-        ]
-        
-        for pattern in budget_patterns:
-            matches = re.findall(pattern, html_content, re.IGNORECASE)
-            if matches:
-                if 'fixed' in html_content.lower():
-                    extracted['fixed_budget_amount'] = matches[0]
-                elif 'hourly' in html_content.lower():
+        for pattern in self.BUDGET_PATTERNS:
+            match = pattern.search(html_content)
+            if match:
+                if 'fixed' in html_lower:
+                    extracted['fixed_budget_amount'] = match.group(1)
+                elif 'hourly' in html_lower:
                     if 'hourly_min' not in extracted:
-                        extracted['hourly_min'] = matches[0]
+                        extracted['hourly_min'] = match.group(1)
                     else:
-                        extracted['hourly_max'] = matches[0]
+                        extracted['hourly_max'] = match.group(1)
                 break
         
         # Look for duration information
-        duration_patterns = [
-            r'duration[^>]*>([^<]+)<',
-            r'<span[^>]*class="[^"]*duration[^"]*"[^>]*>([^<]+)</span>'
-        ]
-        
-        for pattern in duration_patterns:
-            matches = re.findall(pattern, html_content, re.IGNORECASE)
-            if matches:
-                extracted['duration'] = matches[0].strip()
+        for pattern in self.DURATION_PATTERNS:
+            match = pattern.search(html_content)
+            if match:
+                extracted['duration'] = match.group(1).strip()
                 break
 
         # Fallback: explicit duration phrases commonly used by Upwork UI
         if 'duration' not in extracted or not extracted['duration']:
-            duration_phrase_pattern = (
-                r'(More than 6 months|3 to 6 months|1 to 3 months|Less than 1 month)'
-            )
-            m = re.search(duration_phrase_pattern, html_content, re.IGNORECASE)
+            m = self.DURATION_PHRASE_PATTERN.search(html_content)
             if m:
                 # Preserve original casing from the match
                 extracted['duration'] = m.group(1)
         
         # Look for level information
-        level_patterns = [
-            r'level[^>]*>([^<]+)<',
-            r'<span[^>]*class="[^"]*level[^"]*"[^>]*>([^<]+)</span>',
-            r'(Entry|Intermediate|Expert|Advanced)',
-            r'experience[^>]*level[^>]*>([^<]+)<',
-            r'<div[^>]*class="[^"]*level[^"]*"[^>]*>([^<]+)</div>'
-        ]
-        
-        for pattern in level_patterns:
-            matches = re.findall(pattern, html_content, re.IGNORECASE)
-            if matches:
-                level_value = matches[0].strip()
+        for pattern in self.LEVEL_PATTERNS:
+            match = pattern.search(html_content)
+            if match:
+                level_value = match.group(1).strip()
                 # Only use if it looks like a meaningful level, not CSS
                 if level_value and not any(css_indicator in level_value for css_indicator in ['{', '}', ':', ';', '.', '#']):
                     extracted['level'] = level_value
@@ -821,225 +1317,117 @@ class JobAttrExtractor:
         
         return extracted
     
+    def _scan_nuxt_keys(self, html_content: str) -> Dict[tuple, str]:
+        """Single pass over the page returning the first raw value per (Nuxt key, value form).
+
+        Equivalent to running one ``re.search`` per NUXT_KEY_RULES entry: the scanner only
+        consumes the opening quote, so overlapping candidates are never hidden from each other.
+        """
+        first_matches = {}
+        for match in NUXT_KEY_SCANNER.finditer(html_content):
+            key = NUXT_KEY_CANONICAL[match.group(1).lower()]
+            text, flag, number, comma = match.group(2, 3, 4, 5)
+            for form in NUXT_KEY_FORMS[key]:
+                if (key, form) in first_matches:
+                    continue
+                if form == 'str':
+                    value = text
+                elif form == 'bool':
+                    value = flag
+                elif number is None:
+                    value = None
+                elif form == 'number':
+                    value = number
+                elif form == 'int':
+                    value = number.split('.')[0]
+                else:  # 'int,' - an integer immediately followed by a comma
+                    value = number if comma and '.' not in number else None
+                if value is not None:
+                    first_matches[(key, form)] = value
+        return first_matches
+
     def _extract_missing_fields(self, html_content: str, extracted: Dict[str, Any], nuxt_lookup: Dict = None):
         """Enhanced method to extract missing fields using various patterns"""
         
-        # Look for data in script tags with more patterns
-        script_patterns = [
-            r'window\.__NUXT__\s*=\s*({.*?});',
-            r'window\.__INITIAL_STATE__\s*=\s*({.*?});',
-            r'window\.data\s*=\s*({.*?});',
-            r'window\.job\s*=\s*({.*?});',
-            r'window\.jobData\s*=\s*({.*?});',
-            r'window\.__NUXT__\.data\s*=\s*({.*?});',
-            r'window\.__NUXT__\.state\s*=\s*({.*?});',
-            r'window\.__NUXT__\.payload\s*=\s*({.*?});'
-        ]
-        
-        # Also look for Nuxt data in the HTML content directly
-        nuxt_patterns = [
-            r'"createdOn":(\d+)',
-            r'"publishTime":(\d+)',
-            r'"totalApplicants":(\d+)',
-            r'"numberOfPositionsToHire":(\d+)',
-            r'"requiredConnects":(\d+)',
-            r'"score":(\d+(?:\.\d+)?)',
-            r'"feedbackCount":(\d+)',
-            r'"totalCharges":(\d+(?:\.\d+)?)',
-            r'"activeAssignmentsCount":(\d+)',
-            r'"hoursCount":(\d+(?:\.\d+)?)',
-            r'"totalJobsWithHires":(\d+)',
-            r'"invitationsSent":(\d+)',
-            r'"totalHired":(\d+)',
-            r'"totalInvitedToInterview":(\d+)',
-            r'"unansweredInvites":(\d+)',
-            r'"openCount":(\d+)',
-            r'"postedCount":(\d+)',
-            r'"title":"([^"]+)"',
-            r'"description":"([^"]+)"',
-            r'"category":"([^"]+)"',
-            r'"name":"([^"]+)"',
-            r'"currencyCode":"([^"]+)"',
-            r'"country":"([^"]+)"',
-            r'"industry":"([^"]+)"',
-            r'"size":"([^"]+)"',
-            r'"city":"([^"]+)"',
-            r'"countryTimezone":"([^"]+)"',
-            r'"contractorTier":"([^"]+)"',
-            r'"label":"([^"]+)"',
-            r'"isContractToHire":(true|false)',
-            r'"isPaymentMethodVerified":(true|false)',
-            r'"isPhoneVerified":(true|false)',
-            r'"isPremium":(true|false)',
-            r'"isEnterprise":(true|false)',
-            # Additional patterns for location data
-            r'"offsetFromUtcMillis":(\d+)',
-            r'"countryTimezone":"([^"]+)"',
-            r'"city":"([^"]+)"',
-            r'"country":"([^"]+)"',
-            r'"industry":"([^"]+)"',
-            r'"size":"([^"]+)"',
-            r'"contractDate":"([^"]+)"',
-            # Look for specific Nuxt data patterns
-            r'"offsetFromUtcMillis":(\d+),',
-            r'"countryTimezone":(\d+),',
-            r'"city":(\d+),',
-            r'"country":(\d+),',
-            r'"industry":(\d+),',
-            r'"size":(\d+),',
-            r'"isPhoneVerified":(\d+),',
-            r'"isContractToHire":(\d+),',
-            r'"questions":(\d+),',
-            r'"durationIdV3":(\d+),',
-            r'"durationLabel":(\d+),',
-            # Additional patterns for missing fields
-            r'"currencyCode":(\d+),',
-            r'"lastBuyerActivity":(\d+),',
-            # Category patterns
-            r'"name":"([^"]+)"',
-            r'"urlSlug":"([^"]+)"',
-            # Look for category data in the format: {"name":84,"urlSlug":85},"Scripts & Utilities","scripts-utilities"
-            r'"Scripts & Utilities"',
-            r'"scripts-utilities"',
-            r'"Web, Mobile & Software Dev"',
-            r'"web-mobile-software-dev"',
-            # Contractor tier pattern
-            r'"contractorTier":(\d+)',
-            # Hourly rate patterns
-            r'\$(\d+(?:\.\d{2})?)',
-            r'hourly[^>]*min[^>]*>(\d+(?:\.\d{2})?)<',
-            r'hourly[^>]*max[^>]*>(\d+(?:\.\d{2})?)<'
-        ]
-        
-        # Map Nuxt patterns to our target fields
-        nuxt_field_mapping = {
-            'createdOn': 'ts_create',
-            'publishTime': 'ts_publish',
-            'totalApplicants': 'applicants',
-            'numberOfPositionsToHire': 'numberOfPositionsToHire',
-            'requiredConnects': 'connects_required',
-            'score': 'client_rating',
-            'feedbackCount': 'client_reviews',
-            'totalCharges': 'client_total_spent',
-            'activeAssignmentsCount': 'buyer_stats_activeAssignmentsCount',
-            'hoursCount': 'buyer_stats_hoursCount',
-            'totalJobsWithHires': 'buyer_stats_totalJobsWithHires',
-            'invitationsSent': 'clientActivity_invitationsSent',
-            'totalHired': 'clientActivity_totalHired',
-            'totalInvitedToInterview': 'clientActivity_totalInvitedToInterview',
-            'unansweredInvites': 'clientActivity_unansweredInvites',
-            'openCount': 'buyer_jobs_openCount',
-            'postedCount': 'buyer_jobs_postedCount',
-            'title': 'title',
-            'description': 'description',
-            'category': 'category',
-            'name': 'category_name',
-            'currencyCode': 'currency',
-            'country': 'client_country',
-            'industry': 'client_industry',
-            'size': 'client_company_size',
-            'city': 'buyer_location_city',
-            'countryTimezone': 'buyer_location_countryTimezone',
-            'offsetFromUtcMillis': 'buyer_location_offsetFromUtcMillis',
-            'contractorTier': 'contractorTier',
-            'label': 'level',
-            'isContractToHire': 'isContractToHire',
-            'isPaymentMethodVerified': 'payment_verified',
-            'isPhoneVerified': 'phone_verified',
-            'isPremium': 'premium',
-            'isEnterprise': 'enterpriseJob',
-            'contractDate': 'buyer_company_contractDate',
-            # Additional mappings
-            'name': 'category_name',
-            'urlSlug': 'category_urlSlug',
-            'industry': 'client_industry',
-            'size': 'client_company_size',
-            'isPhoneVerified': 'phone_verified',
-            'isContractToHire': 'isContractToHire',
-            'lastBuyerActivity': 'lastBuyerActivity'
-        }
-        
-        # Extract Nuxt data using patterns
-        for pattern in nuxt_patterns:
-            matches = re.findall(pattern, html_content, re.IGNORECASE)
-            if matches:
-                # Find which field this pattern corresponds to
-                for nuxt_field, target_field in nuxt_field_mapping.items():
-                    if nuxt_field in pattern:
-                        # Only set if field is truly missing or has invalid value
-                        # For numeric fields, also check if current value is not a valid number
-                        should_set_value = (
-                            target_field not in extracted or 
-                            extracted[target_field] == "Not found" or 
-                            extracted[target_field] is None or 
-                            extracted[target_field] == ""
-                        )
-                        
-                        # Don't overwrite client_total_spent if it's already been correctly extracted and normalized
-                        if target_field == 'client_total_spent' and target_field in extracted:
-                            # Always prioritize HTML-extracted values over Nuxt data
-                            # Only overwrite if the current value is clearly invalid
-                            if self._is_valid_monetary_value(extracted[target_field]):
-                                should_set_value = False
-                            else:
-                                # Current value is not valid, allow overwriting
-                                pass
-                        
-                        # Don't overwrite fixed_budget_amount with random Nuxt values
-                        if target_field == 'fixed_budget_amount' and target_field in extracted:
-                            # Only allow overwriting if current value is clearly invalid
-                            if self._is_valid_monetary_value(extracted[target_field]) and extracted[target_field] != "0":
-                                should_set_value = False
-                            else:
-                                # Current value is invalid or 0, allow overwriting
-                                pass
-                        
-                        # For specific numeric fields, also check if current value is not a valid number
-                        if target_field in ['buyer_stats_hoursCount', 'buyer_stats_totalJobsWithHires', 'client_hires', 'client_reviews', 'client_rating', 'buyer_hire_rate_pct', 'buyer_avgHourlyJobsRate_amount', 'hourly_min', 'hourly_max', 'fixed_budget_amount']:
-                            if target_field in extracted and extracted[target_field] != "Not found" and extracted[target_field] is not None and extracted[target_field] != "":
-                                try:
-                                    # If current value is a valid number, don't overwrite it
-                                    float(extracted[target_field])
-                                    should_set_value = False
-                                except (ValueError, TypeError):
-                                    # Current value is not a valid number, allow overwriting
-                                    should_set_value = True
-                        
-                        if should_set_value:
-                            value = matches[0].strip()
-                            if value and self._is_valid_value(value):
-                                # Convert boolean strings to actual booleans
-                                if value.lower() in ['true', 'false']:
-                                    extracted[target_field] = value.lower() == 'true'
-                                else:
-                                    # Normalize monetary fields if needed
-                                    if target_field in ['client_total_spent', 'hourly_min', 'hourly_max', 'fixed_budget_amount']:
-                                        # Additional validation for monetary fields
-                                        if self._is_valid_monetary_value(value):
-                                            if target_field == 'client_total_spent':
-                                                extracted[target_field] = self._normalize_client_total_spent(value)
-                                            else:
-                                                # For hourly rates and fixed budget, just normalize the number
-                                                extracted[target_field] = self._normalize_monetary_value(value)
-                                    else:
-                                        extracted[target_field] = value
+        # Collect the first value of every Nuxt key in one pass over the page
+        first_matches = self._scan_nuxt_keys(html_content)
+        
+        # Extract Nuxt data in rule order; each rule only fills its field when the current value allows it
+        for nuxt_field, value_form, target_field in NUXT_KEY_RULES:
+            raw_value = first_matches.get((nuxt_field, value_form))
+            if raw_value is not None:
+                # Only set if field is truly missing or has invalid value
+                # For numeric fields, also check if current value is not a valid number
+                should_set_value = (
+                    target_field not in extracted or 
+                    extracted[target_field] == "Not found" or 
+                    extracted[target_field] is None or 
+                    extracted[target_field] == ""
+                )
+                
+                # Don't overwrite client_total_spent if it's already been correctly extracted and normalized
+                if target_field == 'client_total_spent' and target_field in extracted:
+                    # Always prioritize HTML-extracted values over Nuxt data
+                    # Only overwrite if the current value is clearly invalid
+                    if self._is_valid_monetary_value(extracted[target_field]):
+                        should_set_value = False
+                    else:
+                        # Current value is not valid, allow overwriting
+                        pass
+                
+                # Don't overwrite fixed_budget_amount with random Nuxt values
+                if target_field == 'fixed_budget_amount' and target_field in extracted:
+                    # Only allow overwriting if current value is clearly invalid
+                    if self._is_valid_monetary_value(extracted[target_field]) and extracted[target_field] != "0":
+                        should_set_value = False
+                    else:
+                        # Current value is invalid or 0, allow overwriting
+                        pass
+                
+                # For specific numeric fields, also check if current value is not a valid number
+                if target_field in ['buyer_stats_hoursCount', 'buyer_stats_totalJobsWithHires', 'client_hires', 'client_reviews', 'client_rating', 'buyer_hire_rate_pct', 'buyer_avgHourlyJobsRate_amount', 'hourly_min', 'hourly_max', 'fixed_budget_amount']:
+                    if target_field in extracted and extracted[target_field] != "Not found" and extracted[target_field] is not None and extracted[target_field] != "":
+                        try:
+                            # If current value is a valid number, don't overwrite it
+                            float(extracted[target_field])
+                            should_set_value = False
+                        except (ValueError, TypeError):
+                            # Current value is not a valid number, allow overwriting
+                            should_set_value = True
+                
+                if should_set_value:
+                    value = raw_value.strip()
+                    if value and self._is_valid_value(value):
+                        # Convert boolean strings to actual booleans
+                        if value.lower() in ['true', 'false']:
+                            extracted[target_field] = value.lower() == 'true'
                         else:
-                            # Field already has a value - check if we should skip overwriting it
-                            if target_field == 'buyer_hire_rate_pct':
-                                pass  # Skip hire rate from Nuxt
-                            elif target_field in ['client_hires', 'buyer_stats_hoursCount', 'client_reviews', 'client_rating', 'buyer_stats_totalJobsWithHires']:
-                                pass  # Skip targeted block fields from Nuxt
+                            # Normalize monetary fields if needed
+                            if target_field in ['client_total_spent', 'hourly_min', 'hourly_max', 'fixed_budget_amount']:
+                                # Additional validation for monetary fields
+                                if self._is_valid_monetary_value(value):
+                                    if target_field == 'client_total_spent':
+                                        extracted[target_field] = self._normalize_client_total_spent(value)
+                                    else:
+                                        # For hourly rates and fixed budget, just normalize the number
+                                        extracted[target_field] = self._normalize_monetary_value(value)
                             else:
-                                pass
-                        break
+                                extracted[target_field] = value
+                else:
+                    # Field already has a value - check if we should skip overwriting it
+                    if target_field == 'buyer_hire_rate_pct':
+                        pass  # Skip hire rate from Nuxt
+                    elif target_field in ['client_hires', 'buyer_stats_hoursCount', 'client_reviews', 'client_rating', 'buyer_stats_totalJobsWithHires']:
+                        pass  # Skip targeted block fields from Nuxt
+                    else:
+                        pass
         
         # Search for location data via Nuxt index mapping present in HTML
         # Example pattern: {"offsetFromUtcMillis":139,"countryTimezone":140,"city":141,"country":142}
-        loc_map_pattern = r'\{"offsetFromUtcMillis":(\d+),"countryTimezone":(\d+),"city":(\d+),"country":(\d+)\}'
-        loc_map_matches = re.findall(loc_map_pattern, html_content)
-        if loc_map_matches:
+        loc_map_match = self.LOC_MAP_PATTERN.search(html_content)
+        if loc_map_match:
             try:
-                off_idx, tz_idx, city_idx, country_idx = [int(x) for x in loc_map_matches[0]]
+                off_idx, tz_idx, city_idx, country_idx = [int(x) for x in loc_map_match.groups()]
                 if nuxt_lookup:
                     if off_idx in nuxt_lookup:
                         extracted['buyer_location_offsetFromUtcMillis'] = nuxt_lookup[off_idx]
@@ -1047,7 +1435,7 @@ class JobAttrExtractor:
                         extracted['buyer_location_countryTimezone'] = nuxt_lookup[tz_idx]
                     if city_idx in nuxt_lookup:
                         city_candidate = nuxt_lookup[city_idx]
-                        if not (isinstance(city_candidate, str) and re.match(r'^\s*\d{1,2}:\d{2}(\s*[AP]M)?\s*$', city_candidate, re.IGNORECASE)):
+                        if not (isinstance(city_candidate, str) and self.TIME_ONLY_PATTERN.match(city_candidate)):
                             extracted['buyer_location_city'] = city_candidate
                     if country_idx in nuxt_lookup:
                         extracted['client_country'] = nuxt_lookup[country_idx]
@@ -1064,7 +1452,7 @@ class JobAttrExtractor:
                         extracted['buyer_location_countryTimezone'] = nuxt_lookup[idx + 1]
                     if idx + 2 in nuxt_lookup and 'buyer_location_city' not in extracted:
                         city_candidate = nuxt_lookup[idx + 2]
-                        if not (isinstance(city_candidate, str) and re.match(r'^\s*\d{1,2}:\d{2}(\s*[AP]M)?\s*$', city_candidate, re.IGNORECASE)):
+                        if not (isinstance(city_candidate, str) and self.TIME_ONLY_PATTERN.match(city_candidate)):
                             extracted['buyer_location_city'] = city_candidate
                     if idx + 3 in nuxt_lookup and 'client_country' not in extracted:
                         extracted['client_country'] = nuxt_lookup[idx + 3]
@@ -1072,10 +1460,9 @@ class JobAttrExtractor:
         
         
         # Pattern: {"industry":13,"size":13}
-        nuxt_industry_pattern = r'\{"industry":(\d+),"size":(\d+)\}'
-        industry_matches = re.findall(nuxt_industry_pattern, html_content)
-        if industry_matches:
-            industry_idx, size_idx = industry_matches[0]
+        industry_match = self.INDUSTRY_PATTERN.search(html_content)
+        if industry_match:
+            industry_idx, size_idx = industry_match.groups()
             # Convert string indices to integers
             industry_idx = int(industry_idx)
             size_idx = int(size_idx)
@@ -1087,10 +1474,9 @@ class JobAttrExtractor:
                     extracted['client_company_size'] = nuxt_lookup[size_idx]
         
         # Pattern: "currencyCode":91},0,"USD"
-        currency_pattern = r'"currencyCode":(\d+)\},[^,]*,"([^"]+)"'
-        currency_matches = re.findall(currency_pattern, html_content)
-        if currency_matches:
-            currency_idx, currency_value = currency_matches[0]
+        currency_match = self.CURRENCY_PATTERN.search(html_content)
+        if currency_match:
+            currency_idx, currency_value = currency_match.groups()
             # Always resolve the currency index to actual value if we have Nuxt lookup
             if nuxt_lookup and currency_idx in nuxt_lookup:
                 extracted['currency'] = nuxt_lookup[currency_idx]
@@ -1100,8 +1486,7 @@ class JobAttrExtractor:
         
         # Look for category and category group data
         # Pattern: {"name":84,"urlSlug":85},"Scripts & Utilities","scripts-utilities"
-        category_pattern = r'\{"name":(\d+),"urlSlug":(\d+)\},"([^"]+)","([^"]+)"'
-        category_matches = re.findall(category_pattern, html_content)
+        category_matches = self.CATEGORY_PATTERN.findall(html_content)
         if category_matches:
             name_id, url_slug_id, category_name, category_url_slug = category_matches[0]
             # Always override category fields with the correct values from the pattern
@@ -1109,10 +1494,9 @@ class JobAttrExtractor:
             extracted['category_name'] = category_name
             extracted['category_urlSlug'] = category_url_slug
         
-        # Look for category group data
+        # Look for category group data (same block shape, so reuse the category matches)
         # Pattern: {"name":87,"urlSlug":88},"Web, Mobile & Software Dev","web-mobile-software-dev"
-        category_group_pattern = r'\{"name":(\d+),"urlSlug":(\d+)\},"([^"]+)","([^"]+)"'
-        category_group_matches = re.findall(category_group_pattern, html_content)
+        category_group_matches = category_matches
         if category_group_matches:
             # Get the second match (category group)
             if len(category_group_matches) > 1:
@@ -1123,8 +1507,8 @@ class JobAttrExtractor:
                     extracted['categoryGroup_urlSlug'] = category_group_url_slug
 
         
-        for pattern in script_patterns:
-            matches = re.findall(pattern, html_content, re.DOTALL)
+        for pattern in NUXT_SCRIPT_PATTERNS:
+            matches = pattern.findall(html_content)
             for match in matches:
                 try:
                     json_data = json.loads(match)
@@ -1182,7 +1566,7 @@ class JobAttrExtractor:
         cleaned = str(value).strip().replace('$', '').replace(',', '')
         
         # Check if it's a valid number (with optional K suffix)
-        if re.match(r'^[\d]+(?:\.\d+)?[Kk]?$', cleaned):
+        if self.MONEY_VALUE_PATTERN.match(cleaned):
             # Additional validation for reasonable monetary values
             try:
                 if cleaned.endswith(('K', 'k')):
@@ -1221,7 +1605,7 @@ class JobAttrExtractor:
             text = str(value).strip()
             # Remove currency symbol and commas
             text = text.replace('$', '').replace(',', '').strip()
-            m = re.match(r'^([\d]+(?:\.\d+)?)([Kk])?$', text)
+            m = self.MONEY_VALUE_PATTERN.match(text)
             if not m:
                 return value
             number_part = float(m.group(1))
@@ -1238,11 +1622,7 @@ class JobAttrExtractor:
         """Extract values from targeted Nuxt mapping block - runs AFTER all Nuxt resolution"""
         # Targeted extraction for buyer_stats_hoursCount from Nuxt mapping with trailing values
         # Example: {"totalAssignments":130,"activeAssignmentsCount":102,"hoursCount":131,"feedbackCount":132,"score":133,"totalJobsWithHires":134,"totalCharges":135},108,3582.33,73,4.35,92,
-        hours_block_pattern = (
-            r'\{"totalAssignments":(\d+),"activeAssignmentsCount":(\d+),"hoursCount":(\d+),"feedbackCount":(\d+),"score":(\d+),"totalJobsWithHires":(\d+),"totalCharges":(\d+)\}'
-            r'\s*,\s*(\d+)\s*,\s*([\d\.]+)\s*,\s*(\d+)\s*,\s*([\d\.]+)\s*,\s*(\d+)'  # captures: totalAssignmentsVal, hoursVal, feedbackVal, scoreVal, totalJobsWithHiresVal
-        )
-        hours_block_match = re.search(hours_block_pattern, html_content)
+        hours_block_match = self.HOURS_BLOCK_PATTERN.search(html_content)
         if hours_block_match:
             try:
                 total_assignments_str = hours_block_match.group(8)
@@ -1296,13 +1676,8 @@ class JobAttrExtractor:
                 # by looking for patterns like "167K", "19000", etc.
                 if isinstance(value, str):
                     # Look for monetary patterns in the string
-                    monetary_patterns = [
-                        r'(\d+(?:\.\d+)?[Kk]?)',  # Numbers with optional K
-                        r'(\d+(?:,\d{3})*(?:\.\d{2})?)',  # Numbers with commas
-                    ]
-                    
-                    for pattern in monetary_patterns:
-                        matches = re.findall(pattern, value)
+                    for pattern in self.MONEY_CANDIDATE_PATTERNS:
+                        matches = pattern.findall(value)
                         for match in matches:
                             if self._is_valid_monetary_value(match):
                                 extracted['client_total_spent'] = self._normalize_client_total_spent(match)
@@ -1332,13 +1707,8 @@ class JobAttrExtractor:
                 # If the value is not valid, try to find the first valid monetary value
                 if isinstance(value, str):
                     # Look for monetary patterns in the string
-                    monetary_patterns = [
-                        r'(\d+(?:\.\d+)?[Kk]?)',  # Numbers with optional K
-                        r'(\d+(?:,\d{3})*(?:\.\d{2})?)',  # Numbers with commas
-                    ]
-                    
-                    for pattern in monetary_patterns:
-                        matches = re.findall(pattern, value)
+                    for pattern in self.MONEY_CANDIDATE_PATTERNS:
+                        matches = pattern.findall(value)
                         for match in matches:
                             if self._is_valid_monetary_value(match):
                                 extracted['fixed_budget_amount'] = self._normalize_monetary_value(match)
@@ -1401,7 +1771,7 @@ class JobAttrExtractor:
             text = str(value).strip()
             # Remove currency symbol and commas
             text = text.replace('$', '').replace(',', '').strip()
-            m = re.match(r'^([\d]+(?:\.\d+)?)([Kk])?$', text)
+            m = self.MONEY_VALUE_PATTERN.match(text)
             if not m:
                 return value
             number_part = float(m.group(1))
@@ -1415,16 +1785,23 @@ class JobAttrExtractor:
             return value
 
 
+_shared_extractors: Dict[str, JobAttrExtractor] = {}
+
+
 # Convenience function for easy import and use
-def extract_job_attributes(html_content: str) -> Dict[str, Any]:
+def extract_job_attributes(html_content: str, parser: str = DEFAULT_PARSER_BACKEND) -> Dict[str, Any]:
     """
     Extract job attributes from HTML content string
     
     Args:
         html_content: HTML content as string
+        parser: BeautifulSoup tree builder, one of PARSER_BACKENDS
         
     Returns:
         Dictionary containing extracted job attributes
     """
-    extractor = JobAttrExtractor()
+    # One extractor per process and backend: the instance holds no per-page state, so threads can share it
+    extractor = _shared_extractors.get(parser)
+    if extractor is None:
+        extractor = _shared_extractors.setdefault(parser, JobAttrExtractor(parser))
     return extractor.extract_from_html(html_content)
@@ -0,0 +1,118 @@
+"""
+Benchmark script for the job attribute extractor.
+
+Times extract_job_attributes() over saved Upwork job detail pages (by default the fixture pages in
+tests/fixtures/job_pages) and reports the per-page cost.
+With --compare it also diffs the chosen parser backend against html.parser, and with --baseline
+it times another version of attr_extractor.py on the same pages and reports the speedup.
+"""
+
+import argparse
+import glob
+import importlib.util
+import inspect
+import os
+import statistics
+import sys
+import time
+
+# Add parent directory to sys.path for execution package imports
+execution_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(execution_dir)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+
+try:
+    from attr_extractor import DEFAULT_PARSER_BACKEND, PARSER_BACKENDS, extract_job_attributes
+    from logger import Logger
+except ImportError:
+    from execution.attr_extractor import DEFAULT_PARSER_BACKEND, PARSER_BACKENDS, extract_job_attributes
+    from execution.logger import Logger
+
+logger = Logger(level="INFO").get_logger()
+
+# Anonymised job detail pages shipped with the tests, used when no pages are given
+DEFAULT_PAGES = os.path.join(parent_dir, 'tests', 'fixtures', 'job_pages', '*.html')
+
+
+def load_baseline(path: str):
+    """
+    extract_job_attributes of another attr_extractor.py, e.g. an older version saved with
+    `git show <rev>:execution/attr_extractor.py > old_attr_extractor.py`. Versions without a
+    parser argument are called with the page only.
+    """
+    spec = importlib.util.spec_from_file_location('baseline_attr_extractor', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    extract = module.extract_job_attributes
+    if len(inspect.signature(extract).parameters) < 2:
+        return lambda html, parser: extract(html)
+    return extract
+
+
+def benchmark_pages(paths: list[str], repeat: int = 5, parser: str = DEFAULT_PARSER_BACKEND, extract=extract_job_attributes) -> dict[str, float]:
+    """
+    Run `extract` (the extractor by default) `repeat` times over each page and return the median milliseconds per page.
+    """
+    timings = {}
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            html = f.read()
+        runs = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            extract(html, parser)
+            runs.append((time.perf_counter() - start) * 1000)
+        timings[path] = statistics.median(runs)
+        logger.info(f"{os.path.basename(path)} ({len(html) / 1024:.0f} KB): {timings[path]:.1f} ms/page")
+    return timings
+
+
+def compare_backends(paths: list[str], parser: str) -> dict[str, list[str]]:
+    """
+    Extract each page with html.parser and with `parser`, returning the differing fields per page.
+    """
+    differences = {}
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            html = f.read()
+        expected = extract_job_attributes(html, DEFAULT_PARSER_BACKEND)
+        actual = extract_job_attributes(html, parser)
+        fields = sorted(k for k in set(expected) | set(actual) if expected.get(k) != actual.get(k))
+        if fields:
+            differences[path] = fields
+            logger.warning(f"{os.path.basename(path)}: {parser} differs on {', '.join(fields)}")
+    return differences
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark job attribute extraction on saved HTML pages")
+    parser.add_argument('pages', nargs='*', default=[DEFAULT_PAGES], help='HTML files or glob patterns of saved job detail pages (default: the test fixture pages)')
+    parser.add_argument('--repeat', type=int, default=5, help='Extraction runs per page (median is reported)')
+    parser.add_argument('--parser', type=str, default=DEFAULT_PARSER_BACKEND, choices=PARSER_BACKENDS, help='HTML parser backend to time')
+    parser.add_argument('--compare', action='store_true', help='Check the backend output matches html.parser on every page')
+    parser.add_argument('--baseline', type=str, default=None, help='Another attr_extractor.py (e.g. from an older commit) to time on the same pages for the speedup')
+    args = parser.parse_args()
+
+    page_paths = sorted({p for pattern in args.pages for p in glob.glob(pattern)})
+    if not page_paths:
+        logger.error("No HTML pages matched.")
+        sys.exit(1)
+
+    results = benchmark_pages(page_paths, repeat=args.repeat, parser=args.parser)
+    mean_ms = statistics.mean(results.values())
+    logger.info(f"🏁 {len(results)} pages, mean {mean_ms:.1f} ms/page ({args.parser})")
+
+    if args.baseline:
+        logger.info(f"⏱️ Baseline: {args.baseline}")
+        baseline_results = benchmark_pages(page_paths, repeat=args.repeat, parser=args.parser, extract=load_baseline(args.baseline))
+        baseline_ms = statistics.mean(baseline_results.values())
+        per_page = statistics.median(baseline_results[path] / results[path] for path in page_paths)
+        logger.info(f"🚀 Baseline mean {baseline_ms:.1f} ms/page: {baseline_ms / mean_ms:.2f}x faster overall, {per_page:.2f}x median per page")
+
+    if args.compare:
+        mismatched = compare_backends(page_paths, args.parser)
+        if mismatched:
+            logger.error(f"❌ {len(mismatched)} of {len(page_paths)} pages differ from {DEFAULT_PARSER_BACKEND}")
+            sys.exit(1)
+        logger.info(f"✅ {args.parser} output matches {DEFAULT_PARSER_BACKEND} on all {len(page_paths)} pages")
@@ -0,0 +1,171 @@
+"""
+Long-lived Camoufox browser shared by every login of a run.
+
+Starting AsyncCamoufox (with its geoip lookup) is the slowest part of a login. BrowserPool starts
+the browser once, on its own thread and event loop, and keeps `size` fresh contexts with an open
+page warmed up. camoufox_login_flow borrows one, logs in (solving the Cloudflare captcha on that
+page) and hands it back; the used context is closed, since it holds that login's cookies, and a
+new one is warmed in its place. Because the browser lives on its own loop, it can be borrowed from
+the main run, from the account pool logins and from the background session refresher alike.
+"""
+
+import asyncio
+import threading
+import time
+from typing import Awaitable, Callable, Optional
+
+try:
+    from logger import Logger
+except ImportError:
+    from execution.logger import Logger
+
+logger = Logger(level="DEBUG").get_logger()
+
+DEFAULT_POOL_SIZE = 1
+CLOSE_TIMEOUT = 30
+
+
+def _launch_options(headless: bool, proxy_details: Optional[dict]) -> dict:
+    """Same AsyncCamoufox options as a one-off camoufox_login_flow browser."""
+    return dict(headless=headless, geoip=True, humanize=True, i_know_what_im_doing=True,
+                config={'forceScopeAccess': True}, disable_coop=True, proxy=proxy_details)
+
+
+class BrowserPool:
+    """
+    One Camoufox browser with up to `size` warmed (context, page) pairs. The browser starts in the
+    background as soon as the pool is created; run() waits for it if needed.
+    """
+
+    def __init__(self, size: int = DEFAULT_POOL_SIZE, headless: bool = True, proxy_details: Optional[dict] = None,
+                 launcher: Optional[Callable] = None):
+        self.size = max(1, int(size))
+        self.headless = headless
+        self.proxy_details = proxy_details
+        # Returns an async context manager yielding a playwright Browser (AsyncCamoufox by default)
+        self._launcher = launcher or self._camoufox
+        self.launches = 0
+        self.borrows = 0
+        self.warm_hits = 0
+        self._manager = None
+        self._browser = None
+        self._idle = []
+        self._warming = 0
+        self._closed = False
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name='browser-pool', daemon=True)
+        self._thread.start()
+        self._lock = None
+        self._submit(self._init())
+
+    def _camoufox(self):
+        from camoufox import AsyncCamoufox
+        return AsyncCamoufox(**_launch_options(self.headless, self.proxy_details))
+
+    def _submit(self, coro):
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    # --- running on the pool loop ---
+
+    async def _init(self):
+        self._lock = asyncio.Lock()
+        await self._fill()
+
+    async def _ensure_browser(self):
+        async with self._lock:
+            if self._browser is not None and self._browser.is_connected():
+                return self._browser
+            if self._browser is not None:
+                logger.warning("⚠️ Pooled browser disconnected. Starting a new one...")
+                await self._stop_browser()
+            start = time.monotonic()
+            logger.info(f"🌐 Starting pooled Camoufox browser [Headless={self.headless}]...")
+            manager = self._launcher()
+            self._browser = await manager.__aenter__()
+            self._manager = manager
+            self.launches += 1
+            logger.info(f"🌐 Browser ready in {time.monotonic() - start:.1f}s")
+            return self._browser
+
+    async def _new_pair(self):
+        browser = await self._ensure_browser()
+        context = await browser.new_context()
+        page = await context.new_page()
+        return context, page
+
+    async def _fill(self):
+        """Warm contexts until `size` are idle."""
+        while not self._closed and len(self._idle) + self._warming < self.size:
+            self._warming += 1
+            try:
+                self._idle.append(await self._new_pair())
+            except Exception as e:
+                logger.warning(f"⚠️ Failed to warm a browser context: {e}")
+                return
+            finally:
+                self._warming -= 1
+
+    async def _borrow(self, fn):
+        self.borrows += 1
+        if self._idle:
+            self.warm_hits += 1
+            context, page = self._idle.pop()
+        else:
+            context, page = await self._new_pair()
+        try:
+            return await fn(context, page)
+        finally:
+            try:
+                await context.close()
+            except Exception as e:
+                logger.debug(f"Failed to close borrowed context: {e}")
+            if not self._closed:
+                asyncio.ensure_future(self._fill())
+
+    async def _stop_browser(self):
+        manager, self._manager, self._browser = self._manager, None, None
+        self._idle.clear()
+        if manager is not None:
+            try:
+                await manager.__aexit__(None, None, None)
+            except Exception as e:
+                logger.debug(f"Failed to stop pooled browser: {e}")
+
+    async def _shutdown(self):
+        self._closed = True
+        for context, _ in self._idle:
+            try:
+                await context.close()
+            except Exception:
+                pass
+        await self._stop_browser()
+
+    # --- callable from any thread or event loop ---
+
+    async def run(self, fn: Callable[..., Awaitable]):
+        """Await `fn(context, page)` on a warmed context of the pooled browser and return its result."""
+        if self._closed:
+            raise RuntimeError("BrowserPool is closed")
+        return await asyncio.wrap_future(self._submit(self._borrow(fn)))
+
+    def stats(self) -> dict:
+        return {'launches': self.launches, 'borrows': self.borrows, 'warm_hits': self.warm_hits}
+
+    def close(self):
+        """Close the browser and stop the pool thread."""
+        if self._closed or not self._thread.is_alive():
+            return
+        try:
+            self._submit(self._shutdown()).result(CLOSE_TIMEOUT)
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to close the browser pool cleanly: {e}")
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(CLOSE_TIMEOUT)
+
+
+def open_browser_pool(pool_params: Optional[dict], headless: bool, proxy_details: Optional[dict]) -> Optional[BrowserPool]:
+    """BrowserPool configured from general.browser_pool ({"enabled", "size"}), or None when disabled."""
+    pool_params = pool_params or {}
+    if not pool_params.get('enabled', True):
+        return None
+    return BrowserPool(size=pool_params.get('size', DEFAULT_POOL_SIZE), headless=headless, proxy_details=proxy_details)
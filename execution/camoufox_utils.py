@@ -330,10 +330,29 @@ async def get_requests_session_from_playwright(context, page, max_retries=3, ret
         logger.debug(f"session.proxies updated to: {proxy_url}")
     return session
 
-async def camoufox_login_flow(username, password, login_url, search_url, credentials_provided, proxy_details=None, headless=False) -> requests.Session:
+async def _login_in_context(context, page, username, password, login_url, search_url, credentials_provided, proxy_details=None) -> requests.Session:
+    """
+    Solve the captcha and log in on an open page, then build the requests.Session from its context.
+    """
+    try:
+        logger.info("🔒 Solving Captcha and Logging in (Camoufox)...")
+        page, context = await login_and_solve(page, context, username, password, search_url, login_url, credentials_provided)
+    except Exception as e:
+        logger.error(f"⚠️ Error logging in: {e}")
+        raise e
+    # Extract cookies and user-agent, build requests session
+    return await get_requests_session_from_playwright(context, page, proxy_details=proxy_details)
+
+async def camoufox_login_flow(username, password, login_url, search_url, credentials_provided, proxy_details=None, headless=False, browser_pool=None) -> requests.Session:
     """
     Executes the Camoufox login flow and returns a requests.Session.
+    With a browser_pool.BrowserPool the login borrows one of its warmed contexts instead of starting a browser.
     """
+    if browser_pool is not None:
+        logger.info("🌐 Borrowing a warmed browser context for login (Camoufox)...")
+        return await browser_pool.run(
+            lambda context, page: _login_in_context(context, page, username, password, login_url, search_url, credentials_provided, proxy_details)
+        )
     # Browser Login
     async with AsyncCamoufox(headless=headless, geoip=True, humanize=True, i_know_what_im_doing=True, config={'forceScopeAccess': True}, disable_coop=True, proxy=proxy_details) as browser:
         logger.info(f"🌐 Creating browser/context/page for login (Camoufox) [Headless={headless}]...")
@@ -343,12 +362,4 @@ async def camoufox_login_flow(username, password, login_url, search_url, credent
         except Exception as e:
             logger.error(f"⚠️ Error creating browser: {e}")
             raise e
-        try:
-            logger.info("🔒 Solving Captcha and Logging in (Camoufox)...")
-            page, context = await login_and_solve(page, context, username, password, search_url, login_url, credentials_provided)
-        except Exception as e:
-            logger.error(f"⚠️ Error logging in: {e}")
-            raise e
-        # Extract cookies and user-agent, build requests session
-        session = await get_requests_session_from_playwright(context, page, proxy_details=proxy_details)
-        return session
+        return await _login_in_context(context, page, username, password, login_url, search_url, credentials_provided, proxy_details)
@@ -0,0 +1,171 @@
+"""
+Adaptive (AIMD) concurrency control for Upwork fetches.
+
+The controller owns a concurrency window. Fast 200 responses grow it additively (about +1 per
+window's worth of successes); 429/403 responses and Cloudflare challenge pages cut it in half, and
+responses much slower than the running latency baseline cut it by a quarter. Every successful
+response, slow or not, feeds the baseline, so it follows a lasting shift in latency. Only one cut is
+made per round trip: responses to requests started before the last cut do not cut again.
+"""
+
+import asyncio
+import threading
+from contextlib import asynccontextmanager, contextmanager
+from typing import Optional
+
+try:
+    from logger import Logger
+except ImportError:
+    from execution.logger import Logger
+
+logger = Logger(level="DEBUG").get_logger()
+
+# Markers of a Cloudflare interstitial served instead of the requested page
+CLOUDFLARE_MARKERS = ('Just a moment...', 'cf-chl', 'challenge-platform', 'Attention Required! | Cloudflare')
+
+# Status codes Upwork uses to push back on a client
+THROTTLE_STATUS_CODES = (403, 429)
+
+
+def is_cloudflare_challenge(text: Optional[str]) -> bool:
+    """True when a response body is a Cloudflare challenge page rather than Upwork content."""
+    if not text:
+        return False
+    head = text[:5000]
+    return any(marker in head for marker in CLOUDFLARE_MARKERS)
+
+
+class AIMDController:
+    """Concurrency window shared by the fetch workers of one engine (threads or coroutines)."""
+
+    def __init__(self, initial: int = 5, minimum: int = 1, maximum: int = 20,
+                 decrease_factor: float = 0.5, slow_decrease_factor: float = 0.75,
+                 latency_factor: float = 3.0, latency_alpha: float = 0.1, warmup_samples: int = 5):
+        self.minimum = max(1, int(minimum))
+        self.maximum = max(self.minimum, int(maximum))
+        self.window = float(min(self.maximum, max(self.minimum, initial)))
+        self.decrease_factor = decrease_factor
+        self.slow_decrease_factor = slow_decrease_factor
+        self.latency_factor = latency_factor
+        self.latency_alpha = latency_alpha
+        self.warmup_samples = warmup_samples
+        self.latency_baseline = None
+        self.in_flight = 0
+        # Bumped on every cut; a response only cuts if its request started in the current epoch
+        self.epoch = 0
+        self.counts = {'ok': 0, 'throttled': 0, 'slow': 0, 'error': 0, 'increases': 0, 'decreases': 0}
+        self._lock = threading.Lock()
+        self._thread_cond = threading.Condition(self._lock)
+        self._async_cond = None
+        self._async_loop = None
+        self._wake_tasks = set()
+
+    @property
+    def limit(self) -> int:
+        """Requests allowed in flight right now."""
+        return max(self.minimum, int(self.window))
+
+    @contextmanager
+    def slot(self):
+        """Blocking slot for thread workers; yields the epoch to pass to record()."""
+        with self._thread_cond:
+            self._thread_cond.wait_for(lambda: self.in_flight < self.limit)
+            self.in_flight += 1
+            epoch = self.epoch
+        try:
+            yield epoch
+        finally:
+            with self._thread_cond:
+                self.in_flight -= 1
+                self._thread_cond.notify_all()
+
+    @asynccontextmanager
+    async def slot_async(self):
+        """Slot for coroutines on one event loop; yields the epoch to pass to record()."""
+        if self._async_cond is None:
+            self._async_cond = asyncio.Condition()
+            self._async_loop = asyncio.get_running_loop()
+        async with self._async_cond:
+            await self._async_cond.wait_for(lambda: self.in_flight < self.limit)
+            self.in_flight += 1
+            epoch = self.epoch
+        try:
+            yield epoch
+        finally:
+            async with self._async_cond:
+                self.in_flight -= 1
+                self._async_cond.notify_all()
+
+    def classify(self, status_code: Optional[int], latency: float, text: Optional[str] = None) -> str:
+        """Map a response to 'ok', 'throttled', 'slow' or 'error' (status None means the request failed)."""
+        if status_code in THROTTLE_STATUS_CODES or is_cloudflare_challenge(text):
+            return 'throttled'
+        if status_code is None or status_code >= 400:
+            return 'error'
+        if (self.latency_baseline is not None and self.counts['ok'] >= self.warmup_samples
+                and latency > self.latency_baseline * self.latency_factor):
+            return 'slow'
+        return 'ok'
+
+    def record(self, epoch: int, status_code: Optional[int], latency: float, text: Optional[str] = None, url: str = '') -> str:
+        """Feed one response back into the window and return its classification."""
+        outcome = self.classify(status_code, latency, text)
+        with self._lock:
+            self.counts[outcome] += 1
+            before = self.limit
+            if outcome == 'ok':
+                self._update_baseline(latency)
+                # Additive increase: about +1 per window's worth of fast successes
+                self.window = min(self.maximum, self.window + 1.0 / self.window)
+                if self.limit > before:
+                    self.counts['increases'] += 1
+                    logger.debug(f"📈 AIMD window {before} -> {self.limit} (latency {latency:.2f}s, baseline {self.latency_baseline:.2f}s)")
+            elif outcome in ('throttled', 'slow') and epoch == self.epoch:
+                factor = self.decrease_factor if outcome == 'throttled' else self.slow_decrease_factor
+                self.window = max(self.minimum, self.window * factor)
+                self.epoch += 1
+                self.counts['decreases'] += 1
+                reason = f"HTTP {status_code}" if status_code in THROTTLE_STATUS_CODES else (
+                    'Cloudflare challenge' if outcome == 'throttled' else f"latency {latency:.2f}s vs baseline {self.latency_baseline:.2f}s")
+                logger.info(f"📉 AIMD window {before} -> {self.limit} ({reason}{' on ' + url if url else ''})")
+            if outcome == 'slow':
+                # Slow successes still move the baseline, so a lasting latency rise becomes the new normal
+                self._update_baseline(latency)
+            widened = self.limit > before
+            self._thread_cond.notify_all()
+        if widened:
+            self._wake_async_waiters()
+        return outcome
+
+    def _wake_async_waiters(self):
+        """Let coroutines waiting in slot_async() re-check the window; record() may run on any thread."""
+        loop = self._async_loop
+        if loop is None or loop.is_closed():
+            return
+        try:
+            loop.call_soon_threadsafe(self._start_async_notify)
+        except RuntimeError:
+            # The loop closed since the check above
+            pass
+
+    def _start_async_notify(self):
+        # Runs on the event loop; keep a reference so the task is not garbage collected mid-flight
+        task = self._async_loop.create_task(self._notify_async())
+        self._wake_tasks.add(task)
+        task.add_done_callback(self._wake_tasks.discard)
+
+    async def _notify_async(self):
+        async with self._async_cond:
+            self._async_cond.notify_all()
+
+    def _update_baseline(self, latency: float):
+        """Fold one successful response's latency into the EWMA baseline (caller holds the lock)."""
+        self.latency_baseline = latency if self.latency_baseline is None else (
+            (1 - self.latency_alpha) * self.latency_baseline + self.latency_alpha * latency)
+
+    def stats(self) -> dict:
+        """Current window and outcome counters, for logging at the end of a run."""
+        with self._lock:
+            return {'window': self.limit, 'in_flight': self.in_flight,
+                    'latency_baseline': round(self.latency_baseline, 3) if self.latency_baseline is not None else None,
+                    **self.counts}
@@ -0,0 +1,203 @@
+"""
+Persistent cache of job detail pages.
+
+Each entry is keyed by the Upwork job id (the `~...` part of the job URL) and holds the
+zlib-compressed HTML of the detail page together with the attributes extracted from it.
+Entries older than the TTL are treated as misses, and the database is kept under a size
+bound by evicting the least recently used entries. Recurring runs over the same search then
+only download and parse jobs they have not seen recently.
+"""
+
+import argparse
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Optional
+
+try:
+    from logger import Logger
+except ImportError:
+    from execution.logger import Logger
+
+logger = Logger(level="DEBUG").get_logger()
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'cache', 'job_cache.sqlite3')
+DEFAULT_CACHE_TTL_HOURS = 24
+DEFAULT_CACHE_MAX_MB = 256
+
+JOB_ID_PATTERN = re.compile(r'~([0-9a-zA-Z]+)')
+
+CACHE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS job_cache (
+    job_id TEXT PRIMARY KEY,
+    url TEXT,
+    html BLOB,
+    attrs TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    fetched_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_job_cache_accessed ON job_cache (accessed_at);
+"""
+
+
+def job_id_from_url(url: str) -> Optional[str]:
+    """Upwork job id from a job URL (`.../jobs/~0123abc`), or None if it has none."""
+    match = JOB_ID_PATTERN.search(url or '')
+    return match.group(1) if match else None
+
+
+class JobCache:
+    """SQLite-backed job detail cache, safe to share between the fetch/parse threads of one run."""
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, ttl_hours: float = DEFAULT_CACHE_TTL_HOURS,
+                 max_mb: float = DEFAULT_CACHE_MAX_MB, store_html: bool = True):
+        self.path = path
+        self.ttl = float(ttl_hours) * 3600
+        self.max_bytes = int(float(max_mb) * 1024 * 1024)
+        self.store_html = store_html
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(CACHE_SCHEMA)
+        logger.debug(f"Job cache at {path} (ttl {ttl_hours}h, max {max_mb} MB)")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Apply the TTL and size bound, then close the database."""
+        if self._conn is None:
+            return
+        self.prune()
+        with self._lock:
+            self._conn.close()
+            self._conn = None
+
+    def get(self, job_id: str) -> Optional[dict]:
+        """Cached attributes for `job_id` if a fresh entry exists, else None. Hits refresh the LRU clock."""
+        if not job_id:
+            return None
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT attrs FROM job_cache WHERE job_id = ? AND fetched_at >= ?",
+                (job_id, now - self.ttl),
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self._conn.execute("UPDATE job_cache SET accessed_at = ? WHERE job_id = ?", (now, job_id))
+            self._conn.commit()
+            self.hits += 1
+        return json.loads(row[0])
+
+    def get_html(self, job_id: str) -> Optional[str]:
+        """Stored HTML for `job_id` regardless of age, e.g. to re-extract after an extractor change."""
+        with self._lock:
+            row = self._conn.execute("SELECT html FROM job_cache WHERE job_id = ?", (job_id,)).fetchone()
+        if row is None or row[0] is None:
+            return None
+        return zlib.decompress(row[0]).decode('utf-8')
+
+    def put(self, job_id: str, url: str, html: Optional[str], attrs: dict):
+        """Store (or replace) the page and attributes of one job."""
+        if not job_id or not attrs:
+            return
+        blob = zlib.compress(html.encode('utf-8'), 6) if html and self.store_html else None
+        payload = json.dumps(attrs, default=str)
+        size = len(payload) + (len(blob) if blob else 0)
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO job_cache (job_id, url, html, attrs, size, fetched_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (job_id, url, blob, payload, size, now, now),
+            )
+            self._conn.commit()
+            self.writes += 1
+
+    def prune(self) -> int:
+        """Drop expired entries, then least recently used ones until the size bound holds. Returns rows removed."""
+        with self._lock:
+            removed = self._conn.execute("DELETE FROM job_cache WHERE fetched_at < ?", (time.time() - self.ttl,)).rowcount
+            total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM job_cache").fetchone()[0]
+            if total > self.max_bytes:
+                excess = total - self.max_bytes
+                freed = 0
+                stale = []
+                for job_id, size in self._conn.execute("SELECT job_id, size FROM job_cache ORDER BY accessed_at"):
+                    if freed >= excess:
+                        break
+                    stale.append((job_id,))
+                    freed += size
+                self._conn.executemany("DELETE FROM job_cache WHERE job_id = ?", stale)
+                removed += len(stale)
+            self._conn.commit()
+        if removed:
+            logger.debug(f"Job cache pruned {removed} entries")
+        return removed
+
+    def clear(self):
+        """Remove every entry."""
+        with self._lock:
+            self._conn.execute("DELETE FROM job_cache")
+            self._conn.commit()
+            self._conn.execute("VACUUM")
+
+    def stats(self) -> dict:
+        """Entry count, stored bytes and this run's hit/miss/write counters."""
+        with self._lock:
+            entries, size = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM job_cache").fetchone()
+        return {'entries': entries, 'size_mb': round(size / (1024 * 1024), 2),
+                'hits': self.hits, 'misses': self.misses, 'writes': self.writes}
+
+
+def open_job_cache(cache_params: Optional[dict]) -> Optional[JobCache]:
+    """
+    JobCache configured from general.cache ({"enabled", "path", "ttl_hours", "max_mb"}),
+    or None when caching is disabled or the database cannot be opened.
+    """
+    cache_params = cache_params or {}
+    if not cache_params.get('enabled', True):
+        return None
+    try:
+        return JobCache(
+            path=cache_params.get('path') or DEFAULT_CACHE_PATH,
+            ttl_hours=cache_params.get('ttl_hours', DEFAULT_CACHE_TTL_HOURS),
+            max_mb=cache_params.get('max_mb', DEFAULT_CACHE_MAX_MB),
+        )
+    except sqlite3.Error as e:
+        logger.warning(f"⚠️ Job cache unavailable ({e}). Fetching every job.")
+        return None
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Inspect or maintain the job detail cache")
+    parser.add_argument('--path', type=str, default=DEFAULT_CACHE_PATH, help='Cache database path')
+    parser.add_argument('--ttl_hours', type=float, default=DEFAULT_CACHE_TTL_HOURS, help='Entry lifetime in hours')
+    parser.add_argument('--max_mb', type=float, default=DEFAULT_CACHE_MAX_MB, help='Size bound in MB')
+    parser.add_argument('--prune', action='store_true', help='Drop expired and least recently used entries')
+    parser.add_argument('--clear', action='store_true', help='Remove every entry')
+    args = parser.parse_args()
+
+    cache = JobCache(args.path, ttl_hours=args.ttl_hours, max_mb=args.max_mb)
+    if args.clear:
+        cache.clear()
+        logger.info("🧹 Job cache cleared")
+    elif args.prune:
+        logger.info(f"🧹 Pruned {cache.prune()} entries")
+    logger.info(f"🗄️ Job cache: {cache.stats()}")
+    cache.close()
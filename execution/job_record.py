@@ -0,0 +1,235 @@
+"""
+Typed, compact representation of one scraped job.
+
+The extractor produces a dict of ~60 mostly textual values ("0", "", "1,234.5", ISO dates).
+JobRecord holds the same fields in a slotted dataclass with real types: counts as ints, money
+and ratings as floats, flags as booleans, timestamps as aware UTC datetimes and skills or
+questions as lists, with None for anything missing. A record takes a fraction of the memory of
+the dict, date filters compare datetimes directly, and whole result sets convert to Arrow or
+pandas column by column.
+
+JobRecord keeps the dict interface the rest of the pipeline uses (get, [], in, keys, items), so
+code written against record dicts keeps working. Fields the extractor returns outside
+OUTPUT_FIELDS are kept in `extras`.
+"""
+
+import dataclasses
+import datetime
+from typing import Iterable, Optional
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+try:
+    from attr_extractor import JobAttrExtractor
+except ImportError:
+    from execution.attr_extractor import JobAttrExtractor
+
+# Columns of every job record: the extractor's target fields (url and job_id included), then
+# anything parse_job_detail adds that is not a target field
+OUTPUT_FIELDS = tuple(JobAttrExtractor.TARGET_FIELDS) + tuple(
+    field for field in ('url', 'job_id') if field not in JobAttrExtractor.TARGET_FIELD_SET
+)
+
+# Column types of the typed records and sinks; every other output field is a string
+INT_FIELDS = frozenset({
+    'applicants', 'buyer_hire_rate_pct', 'buyer_jobs_openCount', 'buyer_jobs_postedCount',
+    'buyer_location_offsetFromUtcMillis', 'buyer_stats_activeAssignmentsCount', 'buyer_stats_totalJobsWithHires',
+    'clientActivity_invitationsSent', 'clientActivity_totalHired', 'clientActivity_totalInvitedToInterview',
+    'clientActivity_unansweredInvites', 'client_hires', 'client_reviews', 'connects_required', 'contractorTier',
+    'numberOfPositionsToHire',
+})
+FLOAT_FIELDS = frozenset({
+    'buyer_avgHourlyJobsRate_amount', 'buyer_stats_hoursCount', 'client_rating', 'client_total_spent',
+    'fixed_budget_amount', 'hourly_max', 'hourly_min',
+})
+BOOL_FIELDS = frozenset({'enterpriseJob', 'isContractToHire', 'payment_verified', 'phone_verified', 'premium'})
+# buyer_company_contractDate stays text: the payload has an ISO date, the rendered page "Oct 26, 2022"
+TIMESTAMP_FIELDS = frozenset({'lastBuyerActivity', 'ts_create', 'ts_publish'})
+LIST_FIELDS = frozenset({'skills', 'questions', 'qualifications'})
+
+PYTHON_TYPES = {'int': int, 'float': float, 'bool': bool, 'timestamp': datetime.datetime, 'list': list, 'str': str}
+
+
+def field_type(field: str) -> str:
+    """Logical type of an output column: 'int', 'float', 'bool', 'timestamp', 'list' or 'str'."""
+    if field in INT_FIELDS:
+        return 'int'
+    if field in FLOAT_FIELDS:
+        return 'float'
+    if field in BOOL_FIELDS:
+        return 'bool'
+    if field in TIMESTAMP_FIELDS:
+        return 'timestamp'
+    if field in LIST_FIELDS:
+        return 'list'
+    return 'str'
+
+
+def coerce_value(value, kind: str):
+    """
+    `value` as the Python value of a `kind` column, or None when it is missing or unparseable.
+    Handles the extractor's text forms ("0", "", "1,234.5", "true", ISO dates with a Z suffix).
+    """
+    if value is None or (isinstance(value, str) and not value.strip()):
+        return None
+    try:
+        if kind == 'int':
+            if isinstance(value, bool):
+                return int(value)
+            if isinstance(value, int):
+                return value
+            return int(float(str(value).replace(',', '').strip()))
+        if kind == 'float':
+            if isinstance(value, bool):
+                return float(value)
+            number = float(str(value).replace(',', '').replace('$', '').strip())
+            return number if number == number else None
+        if kind == 'bool':
+            if isinstance(value, bool):
+                return value
+            text = str(value).strip().lower()
+            if text in ('true', '1', 'yes'):
+                return True
+            if text in ('false', '0', 'no'):
+                return False
+            return None
+        if kind == 'timestamp':
+            if isinstance(value, datetime.datetime):
+                moment = value
+            else:
+                moment = datetime.datetime.fromisoformat(str(value).strip().replace('Z', '+00:00'))
+            return moment if moment.tzinfo else moment.replace(tzinfo=datetime.timezone.utc)
+        if kind == 'list':
+            if isinstance(value, (list, tuple)):
+                return [str(item) for item in value]
+            return [str(value)]
+    except (TypeError, ValueError, OverflowError):
+        return None
+    if isinstance(value, (list, tuple)):
+        return ', '.join(str(item) for item in value)
+    return str(value)
+
+
+def format_text(value) -> str:
+    """Text form of a record value for CSV: '' for missing, whole floats without '.0', ISO timestamps with a Z suffix."""
+    if value is None:
+        return ''
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    if isinstance(value, datetime.datetime):
+        return _iso(value)
+    return str(value)
+
+
+def json_value(value):
+    """JSON-serializable form of a record value (timestamps as ISO text, everything else unchanged)."""
+    if isinstance(value, datetime.datetime):
+        return _iso(value)
+    return value
+
+
+def _iso(moment: datetime.datetime) -> str:
+    return moment.isoformat(timespec='milliseconds').replace('+00:00', 'Z')
+
+
+_FIELD_KINDS = tuple((field, field_type(field)) for field in OUTPUT_FIELDS)
+_FIELD_SET = frozenset(OUTPUT_FIELDS)
+
+
+class _JobRecordBase:
+    """Dict-style access shared by JobRecord; missing (None) fields behave like absent keys for get()."""
+
+    __slots__ = ()
+
+    @classmethod
+    def from_dict(cls, data):
+        """JobRecord of an extractor or tile dict; values are coerced to their field types. JobRecords pass through."""
+        if isinstance(data, cls):
+            return data
+        values = {field: coerce_value(data.get(field), kind) for field, kind in _FIELD_KINDS}
+        extras = {key: value for key, value in data.items() if key not in _FIELD_SET}
+        return cls(**values, extras=extras or None)
+
+    def get(self, key: str, default=None):
+        if key in _FIELD_SET:
+            value = getattr(self, key)
+        else:
+            value = self.extras.get(key) if self.extras else None
+        return default if value is None else value
+
+    def __getitem__(self, key: str):
+        if key in _FIELD_SET:
+            return getattr(self, key)
+        if self.extras and key in self.extras:
+            return self.extras[key]
+        raise KeyError(key)
+
+    def __contains__(self, key) -> bool:
+        return key in _FIELD_SET or (bool(self.extras) and key in self.extras)
+
+    def keys(self) -> list:
+        return list(OUTPUT_FIELDS) + (list(self.extras) if self.extras else [])
+
+    def items(self) -> list:
+        return [(key, self[key]) for key in self.keys()]
+
+    def to_dict(self) -> dict:
+        return dict(self.items())
+
+
+JobRecord = dataclasses.make_dataclass(
+    'JobRecord',
+    [(field, Optional[PYTHON_TYPES[kind]], None) for field, kind in _FIELD_KINDS] + [('extras', Optional[dict], None)],
+    bases=(_JobRecordBase,),
+    slots=True,
+)
+JobRecord.__module__ = __name__
+JobRecord.__doc__ = "One job with typed fields (see field_type); build it with JobRecord.from_dict."
+
+
+def arrow_schema(fields: tuple = OUTPUT_FIELDS):
+    """Typed Arrow schema of the output `fields` (see field_type)."""
+    if pa is None:
+        raise ImportError("pyarrow is required for Parquet output (pip install pyarrow)")
+    arrow_types = {
+        'int': pa.int64(),
+        'float': pa.float64(),
+        'bool': pa.bool_(),
+        'timestamp': pa.timestamp('us', tz='UTC'),
+        'list': pa.list_(pa.string()),
+        'str': pa.string(),
+    }
+    return pa.schema([pa.field(field, arrow_types[field_type(field)]) for field in fields])
+
+
+def _column(records: list, field: str) -> list:
+    if field in _FIELD_SET:
+        return [getattr(record, field) for record in records]
+    kind = field_type(field)
+    return [coerce_value(record.get(field), kind) for record in records]
+
+
+def records_to_arrow(records: Iterable, fields: tuple = OUTPUT_FIELDS):
+    """pyarrow Table of `records` (JobRecords or dicts) with the typed schema, built column by column."""
+    records = [JobRecord.from_dict(record) for record in records]
+    schema = arrow_schema(tuple(fields))
+    return pa.Table.from_arrays(
+        [pa.array(_column(records, field.name), type=field.type) for field in schema], schema=schema
+    )
+
+
+def records_to_dataframe(records: Iterable, fields: tuple = OUTPUT_FIELDS):
+    """
+    pandas DataFrame of `records`: nullable Int64/boolean columns, UTC datetimes and float money
+    columns, so missing values stay missing instead of becoming 0 or ''.
+    """
+    import pandas as pd
+
+    if pa is None:
+        records = [JobRecord.from_dict(record) for record in records]
+        return pd.DataFrame({field: _column(records, field) for field in fields}, columns=list(fields))
+    nullable = {pa.int64(): pd.Int64Dtype(), pa.bool_(): pd.BooleanDtype()}
+    return records_to_arrow(records, fields).to_pandas(types_mapper=nullable.get)
@@ -0,0 +1,286 @@
+"""
+Persistent store of every job scraped across runs.
+
+One SQLite row per Upwork job id with a typed column per output field (see
+job_record.field_type). Later runs upsert: new values replace old ones, values a run did not
+collect (e.g. tile-only records) keep what an earlier run stored, and first_seen_at /
+last_seen_at / seen_count track when the job was scraped. Whenever the competition fields
+(applicants, invitations, hires, interviews) change, a snapshot goes to job_history. Indexed
+columns make cross-run questions ("fixed-price jobs published since yesterday") a single query
+instead of a scan over every CSV.
+"""
+
+import argparse
+import datetime
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+try:
+    from logger import Logger
+    from job_record import OUTPUT_FIELDS, coerce_value, field_type
+    from output_sinks import JobSink
+except ImportError:
+    from execution.logger import Logger
+    from execution.job_record import OUTPUT_FIELDS, coerce_value, field_type
+    from execution.output_sinks import JobSink
+
+logger = Logger(level="DEBUG").get_logger()
+
+DEFAULT_JOB_STORE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'outputs', 'jobs', 'job_store.sqlite3')
+
+# Fields whose changes are kept in job_history
+HISTORY_FIELDS = (
+    'applicants', 'clientActivity_invitationsSent', 'clientActivity_totalHired',
+    'clientActivity_totalInvitedToInterview', 'clientActivity_unansweredInvites',
+)
+INDEXED_FIELDS = ('ts_publish', 'category_name', 'client_country', 'fixed_budget_amount', 'hourly_min', 'hourly_max')
+
+SQL_TYPES = {'int': 'INTEGER', 'float': 'REAL', 'bool': 'INTEGER', 'timestamp': 'TEXT', 'list': 'TEXT', 'str': 'TEXT'}
+SEEN_COLUMNS = ('first_seen_at', 'last_seen_at', 'seen_count')
+
+HISTORY_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS job_history (
+    job_id TEXT NOT NULL,
+    seen_at TEXT NOT NULL,
+    {', '.join(f'"{field}" INTEGER' for field in HISTORY_FIELDS)}
+);
+CREATE INDEX IF NOT EXISTS idx_job_history_job ON job_history (job_id, seen_at);
+"""
+
+
+def _now_iso() -> str:
+    return datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds')
+
+
+def to_sql_value(value, kind: str):
+    """A record value as stored in its SQLite column: typed via coerce_value, timestamps as UTC ISO text, lists as JSON."""
+    value = coerce_value(value, kind)
+    if value is None:
+        return None
+    if kind == 'bool':
+        return int(value)
+    if kind == 'timestamp':
+        return value.astimezone(datetime.timezone.utc).isoformat()
+    if kind == 'list':
+        return json.dumps(value)
+    return value
+
+
+def from_sql_value(value, kind: str):
+    """Inverse of to_sql_value for query results (timestamps stay ISO text)."""
+    if value is None:
+        return None
+    if kind == 'bool':
+        return bool(value)
+    if kind == 'list':
+        return json.loads(value)
+    return value
+
+
+class JobStore:
+    """SQLite job table plus change history, safe to share between the threads of one run."""
+
+    def __init__(self, path: str = DEFAULT_JOB_STORE_PATH, fields: tuple = OUTPUT_FIELDS):
+        self.path = path
+        self.fields = tuple(field for field in fields if field != 'job_id')
+        self.kinds = {field: field_type(field) for field in self.fields}
+        self.inserted = 0
+        self.updated = 0
+        self.changes = 0
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._create_schema()
+        self._upsert_sql = self._build_upsert()
+        logger.debug(f"Job store at {path}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _create_schema(self):
+        columns = ', '.join(f'"{field}" {SQL_TYPES[kind]}' for field, kind in self.kinds.items())
+        self._conn.executescript(f"""
+            CREATE TABLE IF NOT EXISTS jobs (
+                job_id TEXT PRIMARY KEY,
+                {columns},
+                first_seen_at TEXT NOT NULL,
+                last_seen_at TEXT NOT NULL,
+                seen_count INTEGER NOT NULL DEFAULT 1
+            );
+            {HISTORY_SCHEMA}
+        """)
+        # Fields added to the extractor after the table was created become new nullable columns
+        existing = {row[1] for row in self._conn.execute("PRAGMA table_info(jobs)")}
+        for field, kind in self.kinds.items():
+            if field not in existing:
+                self._conn.execute(f'ALTER TABLE jobs ADD COLUMN "{field}" {SQL_TYPES[kind]}')
+        for field in INDEXED_FIELDS + ('first_seen_at',):
+            if field in self.kinds or field in SEEN_COLUMNS:
+                self._conn.execute(f'CREATE INDEX IF NOT EXISTS "idx_jobs_{field}" ON jobs ("{field}")')
+        self._conn.commit()
+
+    def _build_upsert(self) -> str:
+        columns = ('job_id',) + self.fields + ('first_seen_at', 'last_seen_at')
+        updates = ', '.join(f'"{field}" = COALESCE(excluded."{field}", jobs."{field}")' for field in self.fields)
+        return (
+            f'INSERT INTO jobs ({", ".join(f"{chr(34)}{c}{chr(34)}" for c in columns)}) '
+            f'VALUES ({", ".join("?" for _ in columns)}) '
+            f'ON CONFLICT(job_id) DO UPDATE SET {updates}, '
+            f'last_seen_at = excluded.last_seen_at, seen_count = jobs.seen_count + 1'
+        )
+
+    def close(self):
+        if self._conn is None:
+            return
+        with self._lock:
+            self._conn.close()
+            self._conn = None
+
+    def upsert(self, record: dict) -> Optional[str]:
+        """Insert or update the job of `record`; returns 'inserted', 'updated', or None without a job id."""
+        job_id = record.get('job_id')
+        if not job_id:
+            return None
+        values = [to_sql_value(record.get(field), kind) for field, kind in self.kinds.items()]
+        tracked = [to_sql_value(record.get(field), 'int') for field in HISTORY_FIELDS]
+        now = _now_iso()
+        history_columns = ', '.join(f'"{field}"' for field in HISTORY_FIELDS)
+        with self._lock:
+            previous = self._conn.execute(f'SELECT {history_columns} FROM jobs WHERE job_id = ?', (job_id,)).fetchone()
+            self._conn.execute(self._upsert_sql, [job_id] + values + [now, now])
+            changed = any(value is not None and (previous is None or value != old) for value, old in zip(tracked, previous or [None] * len(tracked)))
+            if changed:
+                self._conn.execute(
+                    f'INSERT INTO job_history (job_id, seen_at, {history_columns}) VALUES (?, ?, {", ".join("?" for _ in HISTORY_FIELDS)})',
+                    [job_id, now] + tracked,
+                )
+                if previous is not None:
+                    self.changes += 1
+            self._conn.commit()
+        if previous is None:
+            self.inserted += 1
+            return 'inserted'
+        self.updated += 1
+        return 'updated'
+
+    def _rows(self, sql: str, params: list) -> list:
+        with self._lock:
+            cursor = self._conn.execute(sql, params)
+            names = [column[0] for column in cursor.description]
+            rows = cursor.fetchall()
+        kinds = dict(self.kinds, job_id='str')
+        return [{name: from_sql_value(value, kinds.get(name, 'str')) for name, value in zip(names, row)} for row in rows]
+
+    def query(self, job_type: Optional[str] = None, published_since: Optional[str] = None, first_seen_since: Optional[str] = None,
+              category: Optional[str] = None, country: Optional[str] = None, min_budget: Optional[float] = None,
+              min_hourly: Optional[float] = None, min_client_spent: Optional[float] = None, limit: Optional[int] = 100) -> list:
+        """
+        Jobs matching every given condition, newest published first. `published_since` and
+        `first_seen_since` are ISO timestamps; min_hourly compares against hourly_max.
+        """
+        conditions, params = [], []
+        for sql, value in (
+            ('type = ?', job_type),
+            ('ts_publish >= ?', published_since),
+            ('first_seen_at >= ?', first_seen_since),
+            ('category_name = ?', category),
+            ('client_country = ?', country),
+            ('fixed_budget_amount >= ?', min_budget),
+            ('hourly_max >= ?', min_hourly),
+            ('client_total_spent >= ?', min_client_spent),
+        ):
+            if value is not None:
+                conditions.append(sql)
+                params.append(value)
+        sql = 'SELECT * FROM jobs'
+        if conditions:
+            sql += ' WHERE ' + ' AND '.join(conditions)
+        sql += ' ORDER BY ts_publish DESC'
+        if limit:
+            sql += ' LIMIT ?'
+            params.append(int(limit))
+        return self._rows(sql, params)
+
+    def history(self, job_id: str) -> list:
+        """Snapshots of the HISTORY_FIELDS of one job, oldest first."""
+        return self._rows('SELECT * FROM job_history WHERE job_id = ? ORDER BY seen_at', [job_id])
+
+    def stats(self) -> dict:
+        """Stored jobs and history rows, plus this run's insert/update/change counters."""
+        with self._lock:
+            jobs = self._conn.execute('SELECT COUNT(*) FROM jobs').fetchone()[0]
+            snapshots = self._conn.execute('SELECT COUNT(*) FROM job_history').fetchone()[0]
+        return {'jobs': jobs, 'history_rows': snapshots, 'inserted': self.inserted, 'updated': self.updated, 'changed': self.changes}
+
+
+class JobStoreSink(JobSink):
+    """
+    Output sink that upserts every record into a JobStore, committing each one. Only `fields`
+    (general.output_fields) are written; the table keeps every column, so query() works and
+    the other columns keep what earlier runs stored.
+    """
+
+    def __init__(self, path: str = DEFAULT_JOB_STORE_PATH, fields: tuple = OUTPUT_FIELDS):
+        super().__init__(path)
+        self.fields = tuple(fields)
+        self.store = JobStore(path)
+
+    def write(self, record: dict):
+        selected = {field: record.get(field) for field in self.fields}
+        selected['job_id'] = record.get('job_id')
+        if self.store.upsert(selected) is not None:
+            self.count += 1
+
+    def close(self):
+        if self.store._conn is not None:
+            logger.info(f"🗃️ Job store: {self.store.stats()}")
+            self.store.close()
+
+
+def _hours_ago(hours: Optional[float]) -> Optional[str]:
+    if hours is None:
+        return None
+    return (datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(hours=hours)).isoformat(timespec='seconds')
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Query the persistent job store")
+    parser.add_argument('--path', type=str, default=DEFAULT_JOB_STORE_PATH, help='Job store database path')
+    parser.add_argument('--type', type=str, default=None, choices=['Fixed', 'Hourly'], help='Job type')
+    parser.add_argument('--since', type=float, default=None, help='Published within the last N hours')
+    parser.add_argument('--new_since', type=float, default=None, help='First scraped within the last N hours')
+    parser.add_argument('--category', type=str, default=None, help='Exact category_name')
+    parser.add_argument('--country', type=str, default=None, help='Exact client_country')
+    parser.add_argument('--min_budget', type=float, default=None, help='Minimum fixed budget')
+    parser.add_argument('--min_hourly', type=float, default=None, help='Minimum top hourly rate')
+    parser.add_argument('--min_client_spent', type=float, default=None, help='Minimum client total spent')
+    parser.add_argument('--limit', type=int, default=50, help='Max jobs to list (0: all)')
+    parser.add_argument('--fields', type=str, default='job_id,ts_publish,type,title,fixed_budget_amount,hourly_max,applicants,url',
+                        help='Comma-separated columns to print')
+    parser.add_argument('--history', type=str, default=None, help='Print the applicant/invitation history of a job id')
+    args = parser.parse_args()
+
+    store = JobStore(args.path)
+    start = time.perf_counter()
+    if args.history:
+        rows = store.history(args.history)
+        fields = ['seen_at', *HISTORY_FIELDS]
+    else:
+        rows = store.query(job_type=args.type, published_since=_hours_ago(args.since), first_seen_since=_hours_ago(args.new_since),
+                           category=args.category, country=args.country, min_budget=args.min_budget, min_hourly=args.min_hourly,
+                           min_client_spent=args.min_client_spent, limit=args.limit)
+        fields = [field.strip() for field in args.fields.split(',') if field.strip()]
+    elapsed = (time.perf_counter() - start) * 1000
+    for row in rows:
+        print(json.dumps({field: row.get(field) for field in fields}, ensure_ascii=False))
+    logger.info(f"🗃️ {len(rows)} rows in {elapsed:.1f} ms. Store: {store.stats()}")
+    store.close()
@@ -0,0 +1,134 @@
+"""
+Keyword qualification for scraped jobs.
+
+Reads the `filtering` block of the search parameters (qualify_keywords / disqualify_keywords)
+and compiles each list into one case-insensitive regex, so a job's text is scanned once per
+list whatever the number of keywords. Keywords match at the start of a word ('teach' also
+matches 'teaching', 'api' does not match 'capital').
+
+Jobs are checked twice: on the search tile (title, description snippet, skills) before the
+detail page is requested, where only disqualify keywords drop a job because the snippet is
+truncated; and on the extracted record (title, full description, skills), where a job must
+also contain a qualify keyword if any are configured. Every final decision is recorded with
+the keywords that caused it.
+"""
+
+import json
+import re
+import threading
+from typing import Optional
+
+try:
+    from logger import Logger
+except ImportError:
+    from execution.logger import Logger
+
+logger = Logger(level="DEBUG").get_logger()
+
+QUALIFIED = 'qualified'
+DISQUALIFIED = 'disqualified'
+UNQUALIFIED = 'unqualified'
+
+# Text fields scanned at each stage
+TILE_TEXT_FIELDS = ('title', 'snippet', 'skills')
+RECORD_TEXT_FIELDS = ('title', 'description', 'skills')
+
+
+def compile_keywords(keywords) -> Optional[re.Pattern]:
+    """One alternation over `keywords` (longest first, so 'rest api' wins over 'api'), or None if empty."""
+    words = sorted({str(word).strip().lower() for word in keywords or [] if str(word).strip()}, key=len, reverse=True)
+    if not words:
+        return None
+    return re.compile(r'(?<!\w)(?:' + '|'.join(re.escape(word) for word in words) + ')', re.IGNORECASE)
+
+
+def _job_text(job: dict, fields: tuple) -> str:
+    parts = []
+    for field in fields:
+        value = job.get(field)
+        if isinstance(value, (list, tuple)):
+            parts.extend(str(item) for item in value)
+        elif value:
+            parts.append(str(value))
+    return '\n'.join(parts)
+
+
+class KeywordFilter:
+    """Compiled qualify/disqualify rules plus the per-job decisions taken during a run."""
+
+    def __init__(self, qualify_keywords=None, disqualify_keywords=None):
+        self.qualify_pattern = compile_keywords(qualify_keywords)
+        self.disqualify_pattern = compile_keywords(disqualify_keywords)
+        self.decisions = []
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_search_params(cls, search_params: dict) -> Optional['KeywordFilter']:
+        """KeywordFilter from search_params['filtering'], or None when it has no keywords."""
+        filtering = search_params.get('filtering') or {}
+        if filtering.get('use_ai_filter'):
+            logger.warning("⚠️ filtering.use_ai_filter is not supported. Applying the keyword rules only.")
+        keyword_filter = cls(filtering.get('qualify_keywords'), filtering.get('disqualify_keywords'))
+        if keyword_filter.qualify_pattern is None and keyword_filter.disqualify_pattern is None:
+            return None
+        logger.info(f"🔎 Keyword filter: {len(filtering.get('qualify_keywords') or [])} qualify, {len(filtering.get('disqualify_keywords') or [])} disqualify keywords")
+        return keyword_filter
+
+    @staticmethod
+    def _matches(pattern, text: str) -> list:
+        if pattern is None:
+            return []
+        return sorted({match.group(0).lower() for match in pattern.finditer(text)})
+
+    def evaluate(self, text: str, require_qualify: bool = True) -> tuple:
+        """(decision, reason) for `text`. Without `require_qualify` a text with no keywords at all passes."""
+        disqualifying = self._matches(self.disqualify_pattern, text)
+        if disqualifying:
+            return DISQUALIFIED, f"disqualify keywords: {', '.join(disqualifying)}"
+        qualifying = self._matches(self.qualify_pattern, text)
+        if qualifying:
+            return QUALIFIED, f"qualify keywords: {', '.join(qualifying)}"
+        if self.qualify_pattern is not None and require_qualify:
+            return UNQUALIFIED, "no qualify keyword"
+        return QUALIFIED, "no disqualify keyword"
+
+    def _record(self, job: dict, stage: str, decision: str, reason: str):
+        with self._lock:
+            self.decisions.append({
+                'job_id': job.get('job_id'),
+                'url': job.get('url'),
+                'stage': stage,
+                'decision': decision,
+                'reason': reason,
+            })
+
+    def check_tile(self, tile: dict, final: bool = False) -> Optional[str]:
+        """
+        Tile pre-filter (see upwork_core._tile_prefilters): the drop reason, or None to keep the job.
+        With `final` (tile-only runs, no detail page to come) the tile also needs a qualify keyword.
+        """
+        decision, reason = self.evaluate(_job_text(tile, TILE_TEXT_FIELDS), require_qualify=final)
+        if decision != QUALIFIED or final:
+            self._record(tile, 'tile', decision, reason)
+        return None if decision == QUALIFIED else decision
+
+    def accept_record(self, record: dict) -> bool:
+        """Final check on an extracted record; the decision is recorded either way."""
+        decision, reason = self.evaluate(_job_text(record, RECORD_TEXT_FIELDS))
+        self._record(record, 'detail', decision, reason)
+        return decision == QUALIFIED
+
+    def summary(self) -> dict:
+        """Decision counts of this run, e.g. {'qualified': 40, 'disqualified': 7}."""
+        counts = {}
+        with self._lock:
+            for entry in self.decisions:
+                counts[entry['decision']] = counts.get(entry['decision'], 0) + 1
+        return counts
+
+    def save_decisions(self, path: str):
+        """Write every decision as one JSON object per line."""
+        with self._lock, open(path, 'w', encoding='utf-8') as f:
+            for entry in self.decisions:
+                f.write(json.dumps(entry) + '\n')
+        logger.debug(f"Saved {len(self.decisions)} keyword filter decisions to {path}")
@@ -0,0 +1,268 @@
+"""
+Output sinks for scraped job records.
+
+Records are written as the detail pipeline finishes them instead of being collected and
+dumped at the end of a run, so results reach disk early and a run does not need to hold
+every record to save them.
+
+CSV keeps every value as text. The Parquet sink writes the same columns with a typed Arrow
+schema (counts as integers, money and ratings as floats, flags as booleans, timestamps as UTC
+datetimes, skills and questions as lists), compressed and batched into row groups.
+"""
+
+import csv
+import datetime
+import json
+import os
+from typing import Optional
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+try:
+    from logger import Logger
+    from job_record import OUTPUT_FIELDS, arrow_schema, coerce_value, field_type, format_text, json_value
+except ImportError:
+    from execution.logger import Logger
+    from execution.job_record import OUTPUT_FIELDS, arrow_schema, coerce_value, field_type, format_text, json_value
+
+logger = Logger(level="DEBUG").get_logger()
+
+DEFAULT_OUTPUT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'outputs', 'jobs', 'csv')
+PARQUET_OUTPUT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'outputs', 'jobs', 'parquet')
+JSONL_OUTPUT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'outputs', 'jobs', 'jsonl')
+
+OUTPUT_FORMATS = ('csv', 'jsonl', 'parquet', 'sqlite')
+# Formats a resumed run appends to instead of starting a new file
+APPENDABLE_FORMATS = ('csv', 'jsonl')
+
+DEFAULT_ROW_GROUP_SIZE = 1000
+DEFAULT_PARQUET_COMPRESSION = 'zstd'
+
+
+def timestamped_output_path(extension: str = 'csv', output_dir: Optional[str] = None, timestamp: Optional[datetime.datetime] = None) -> str:
+    """job_results_YYYYMMDD_HHMMSS.<extension> in the jobs output directory (created if needed)."""
+    output_dir = output_dir or DEFAULT_OUTPUT_DIR
+    os.makedirs(output_dir, exist_ok=True)
+    return os.path.join(output_dir, f'job_results_{(timestamp or datetime.datetime.now()).strftime("%Y%m%d_%H%M%S")}.{extension}')
+
+
+def _end_torn_line(path: str, file):
+    """Start appends to `path` on a new line when a crash left its last line unterminated."""
+    with open(path, 'rb') as f:
+        f.seek(-1, os.SEEK_END)
+        if f.read(1) != b'\n':
+            file.write('\n')
+
+
+class JobSink:
+    """A destination for job records: write() each record as it completes, close() at the end of the run."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.count = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @property
+    def paths(self) -> list:
+        return [self.path]
+
+    def write(self, record: dict):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class CsvJobSink(JobSink):
+    """
+    Appends one CSV row per record and flushes it, so finished rows survive a crash. With
+    `append`, rows are added to an existing file (a resumed run) without a second header.
+    """
+
+    def __init__(self, path: str, fields: tuple = OUTPUT_FIELDS, append: bool = False):
+        super().__init__(path)
+        self.fields = list(fields)
+        has_rows = append and os.path.exists(path) and os.path.getsize(path) > 0
+        self._file = open(path, 'a' if has_rows else 'w', newline='', encoding='utf-8')
+        self._writer = csv.DictWriter(self._file, fieldnames=self.fields, restval='', extrasaction='ignore')
+        if has_rows:
+            _end_torn_line(path, self._file)
+        else:
+            self._writer.writeheader()
+        logger.debug(f"Streaming job records to {path}{' (appending)' if has_rows else ''}")
+
+    def write(self, record: dict):
+        self._writer.writerow({field: format_text(record.get(field)) for field in self.fields})
+        self._file.flush()
+        self.count += 1
+
+    def close(self):
+        if not self._file.closed:
+            self._file.close()
+            logger.debug(f"Wrote {self.count} job records to {self.path}")
+
+
+class JsonlJobSink(JobSink):
+    """One JSON object per line, flushed per record; numbers, lists and booleans keep their JSON types, missing values are null."""
+
+    def __init__(self, path: str, fields: tuple = OUTPUT_FIELDS, append: bool = False):
+        super().__init__(path)
+        self.fields = list(fields)
+        self._file = open(path, 'a' if append else 'w', encoding='utf-8')
+        if append and os.path.getsize(path) > 0:
+            _end_torn_line(path, self._file)
+        logger.debug(f"Streaming job records to {path}{' (appending)' if append else ''}")
+
+    def write(self, record: dict):
+        self._file.write(json.dumps({field: json_value(record.get(field)) for field in self.fields}, ensure_ascii=False, default=str) + '\n')
+        self._file.flush()
+        self.count += 1
+
+    def close(self):
+        if not self._file.closed:
+            self._file.close()
+            logger.debug(f"Wrote {self.count} job records to {self.path}")
+
+
+class ParquetJobSink(JobSink):
+    """
+    Typed, compressed Parquet file. Records are coerced to the Arrow schema as they arrive and
+    written one row group per `row_group_size` records, so at most one row group is held in memory.
+    """
+
+    def __init__(self, path: str, fields: tuple = OUTPUT_FIELDS, row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+                 compression: str = DEFAULT_PARQUET_COMPRESSION):
+        super().__init__(path)
+        self.fields = list(fields)
+        self.schema = arrow_schema(tuple(self.fields))
+        self.kinds = [field_type(field) for field in self.fields]
+        self.row_group_size = max(1, int(row_group_size))
+        self._columns = [[] for _ in self.fields]
+        self._writer = pq.ParquetWriter(path, self.schema, compression=compression)
+        logger.debug(f"Streaming job records to {path} ({compression}, {self.row_group_size} rows per group)")
+
+    def write(self, record: dict):
+        self._append(record)
+        self.count += 1
+
+    def copy_jsonl(self, path: str) -> int:
+        """
+        Add the records of a JSONL output (an interrupted run's, see open_job_sink) without
+        counting them as written by this run; a torn last line is skipped. Returns the rows copied.
+        """
+        copied = 0
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                self._append(record)
+                copied += 1
+        return copied
+
+    def _append(self, record: dict):
+        for column, field, kind in zip(self._columns, self.fields, self.kinds):
+            column.append(coerce_value(record.get(field), kind))
+        if len(self._columns[0]) >= self.row_group_size:
+            self._flush()
+
+    def _flush(self):
+        if not self._columns or not self._columns[0]:
+            return
+        self._writer.write_table(pa.Table.from_arrays(
+            [pa.array(column, type=field.type) for column, field in zip(self._columns, self.schema)], schema=self.schema
+        ))
+        self._columns = [[] for _ in self.fields]
+
+    def close(self):
+        if self._writer is not None:
+            self._flush()
+            self._writer.close()
+            self._writer = None
+            logger.debug(f"Wrote {self.count} job records to {self.path}")
+
+
+class TeeJobSink(JobSink):
+    """Writes every record to several sinks; `path` is the first sink's."""
+
+    def __init__(self, sinks: list):
+        super().__init__(sinks[0].path)
+        self.sinks = sinks
+
+    @property
+    def paths(self) -> list:
+        return [sink.path for sink in self.sinks]
+
+    def write(self, record: dict):
+        for sink in self.sinks:
+            sink.write(record)
+        self.count += 1
+
+    def close(self):
+        for sink in self.sinks:
+            sink.close()
+
+
+def open_job_sink(output_format='csv', fields: tuple = OUTPUT_FIELDS, parquet_params: Optional[dict] = None,
+                  store_params: Optional[dict] = None, resume_paths: Optional[list] = None) -> JobSink:
+    """
+    Sink for general.output_format: 'csv', 'jsonl', 'parquet', 'sqlite' (the persistent
+    job_store.JobStore) or a list / comma-separated string of them. All files of one run share
+    the same timestamped name. CSV and JSONL files listed in `resume_paths` (an interrupted
+    run's outputs, see run_checkpoint) are appended to instead. A Parquet file cannot be
+    appended to (an interrupted one has no footer), so a resumed run starts a new one and copies
+    the interrupted run's rows into it from its JSONL output; without one the Parquet output
+    stays split. Parquet needs pyarrow; without it the run falls back to CSV.
+    """
+    formats = [name.strip().lower() for name in (output_format.split(',') if isinstance(output_format, str) else output_format or ['csv'])]
+    unknown = [name for name in formats if name not in OUTPUT_FORMATS]
+    if unknown:
+        logger.warning(f"⚠️ Ignoring unknown output formats: {', '.join(unknown)}")
+    formats = [name for name in OUTPUT_FORMATS if name in formats] or ['csv']
+    if 'parquet' in formats and pa is None:
+        logger.warning("⚠️ pyarrow is not installed (pip install pyarrow). Writing CSV instead of Parquet.")
+        formats = [name for name in formats if name != 'parquet'] or ['csv']
+    parquet_params = parquet_params or {}
+    store_params = store_params or {}
+    timestamp = datetime.datetime.now()
+    resume = {os.path.splitext(path)[1].lstrip('.'): path for path in resume_paths or []}
+    sinks = []
+    for name in formats:
+        if name in APPENDABLE_FORMATS:
+            sink_class = CsvJobSink if name == 'csv' else JsonlJobSink
+            if name in resume:
+                sinks.append(sink_class(resume[name], fields=fields, append=True))
+            else:
+                output_dir = DEFAULT_OUTPUT_DIR if name == 'csv' else JSONL_OUTPUT_DIR
+                sinks.append(sink_class(timestamped_output_path(name, output_dir, timestamp=timestamp), fields=fields))
+        elif name == 'sqlite':
+            # job_store builds on this module, so it is imported only when the store is used
+            try:
+                from job_store import DEFAULT_JOB_STORE_PATH, JobStoreSink
+            except ImportError:
+                from execution.job_store import DEFAULT_JOB_STORE_PATH, JobStoreSink
+            sinks.append(JobStoreSink(store_params.get('path') or DEFAULT_JOB_STORE_PATH, fields=fields))
+        else:
+            sink = ParquetJobSink(
+                timestamped_output_path('parquet', PARQUET_OUTPUT_DIR, timestamp=timestamp), fields=fields,
+                row_group_size=parquet_params.get('row_group_size', DEFAULT_ROW_GROUP_SIZE),
+                compression=parquet_params.get('compression', DEFAULT_PARQUET_COMPRESSION),
+            )
+            if 'jsonl' in resume:
+                copied = sink.copy_jsonl(resume['jsonl'])
+                logger.info(f"⏯️ Copied {copied} jobs of the interrupted run from {resume['jsonl']} into {sink.path}")
+            elif resume:
+                logger.warning(f"⚠️ Parquet files cannot be resumed: {sink.path} only holds the jobs of this run. "
+                               f"The interrupted run's jobs are in {', '.join(resume.values())}.")
+            sinks.append(sink)
+    return sinks[0] if len(sinks) == 1 else TeeJobSink(sinks)
@@ -0,0 +1,101 @@
+"""
+Request rate limiting for Upwork fetches.
+
+Every search and detail request takes a token from its endpoint's bucket before it is sent, so
+throughput is set by configured budgets instead of fixed worst-case sleeps. Buckets are shared by
+the fetch threads and by the async engine.
+"""
+
+import asyncio
+import random
+import threading
+import time
+from typing import Optional
+
+try:
+    from logger import Logger
+except ImportError:
+    from execution.logger import Logger
+
+logger = Logger(level="DEBUG").get_logger()
+
+# Per-endpoint budgets: sustained requests per second, burst size and a random extra delay
+# (seconds) added to every request so the timing does not look machine-generated.
+# Override any of them with general.rate_limits, e.g. {"detail": {"rate": 1.0}}.
+DEFAULT_RATE_BUDGETS = {
+    'search': {'rate': 0.2, 'burst': 1, 'jitter': (0.0, 2.0)},
+    'detail': {'rate': 0.5, 'burst': 5, 'jitter': (0.0, 1.0)},
+}
+
+
+class TokenBucket:
+    """Thread-safe token bucket. Callers reserve a token and sleep until it becomes available."""
+
+    def __init__(self, rate: float, burst: int = 1, jitter: tuple = (0.0, 0.0)):
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, got {rate}")
+        self.rate = float(rate)
+        self.burst = max(1, int(burst))
+        self.jitter = tuple(jitter)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take one token and return how long the caller must wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # Tokens may go negative: later callers queue behind earlier reservations
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        return wait + random.uniform(*self.jitter)
+
+
+class RateLimiter:
+    """Named token buckets, one per endpoint ('search', 'detail', ...)."""
+
+    def __init__(self, budgets: Optional[dict] = None):
+        self.buckets = {}
+        merged = {name: dict(budget) for name, budget in DEFAULT_RATE_BUDGETS.items()}
+        for name, budget in (budgets or {}).items():
+            merged.setdefault(name, dict(DEFAULT_RATE_BUDGETS['detail'])).update(budget)
+        for name, budget in merged.items():
+            self.buckets[name] = TokenBucket(budget['rate'], budget.get('burst', 1), budget.get('jitter', (0.0, 0.0)))
+            logger.debug(f"Rate budget '{name}': {budget['rate']} req/s, burst {budget.get('burst', 1)}, jitter {tuple(budget.get('jitter', (0.0, 0.0)))}")
+
+    def bucket(self, endpoint: str) -> TokenBucket:
+        """Bucket for `endpoint`; unknown endpoints share the detail budget."""
+        return self.buckets.get(endpoint) or self.buckets['detail']
+
+    def acquire(self, endpoint: str = 'detail'):
+        """Block the calling thread until a request to `endpoint` may be sent."""
+        time.sleep(self.bucket(endpoint).reserve())
+
+    async def acquire_async(self, endpoint: str = 'detail'):
+        """Suspend the calling coroutine until a request to `endpoint` may be sent."""
+        await asyncio.sleep(self.bucket(endpoint).reserve())
+
+    def scaled(self, factor: float) -> 'RateLimiter':
+        """
+        Limiter whose rates and bursts are `factor` times these, without jitter: the aggregate
+        cap over several accounts that each pace (and jitter) their own requests with this budget.
+        """
+        return RateLimiter({
+            name: {'rate': bucket.rate * factor, 'burst': max(1, int(bucket.burst * factor)), 'jitter': (0.0, 0.0)}
+            for name, bucket in self.buckets.items()
+        })
+
+
+_default_limiter = None
+_default_lock = threading.Lock()
+
+
+def get_default_limiter() -> RateLimiter:
+    """Process-wide limiter with the default budgets, for callers that were not handed one."""
+    global _default_limiter
+    with _default_lock:
+        if _default_limiter is None:
+            _default_limiter = RateLimiter()
+        return _default_limiter
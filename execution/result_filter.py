@@ -0,0 +1,339 @@
+"""
+Threshold filters and batch clean-up for job result sets.
+
+The `filtering` block of the search JSON can set numeric thresholds next to the keywords:
+min_client_spent, min_client_rating, min_client_reviews, min_hire_rate and max_applicants.
+A scraping run checks them on each record as it streams (ResultFilter.check). For whole result
+sets, e.g. a backfill over earlier CSV/JSONL/Parquet outputs, post_process works on columns
+instead: money text such as "$19K" is normalized, timestamps parsed, the hire rate recomputed
+and clamped, and days_posted plus the thresholds applied as one vectorized mask, so tens of
+thousands of jobs filter in milliseconds.
+"""
+
+import argparse
+import ast
+import datetime
+import json
+import operator
+import os
+import time
+from typing import Iterable, Optional
+
+try:
+    from logger import Logger
+    from job_record import BOOL_FIELDS, FLOAT_FIELDS, INT_FIELDS, LIST_FIELDS, OUTPUT_FIELDS, TIMESTAMP_FIELDS, coerce_value, field_type, records_to_dataframe
+except ImportError:
+    from execution.logger import Logger
+    from execution.job_record import BOOL_FIELDS, FLOAT_FIELDS, INT_FIELDS, LIST_FIELDS, OUTPUT_FIELDS, TIMESTAMP_FIELDS, coerce_value, field_type, records_to_dataframe
+
+logger = Logger(level="DEBUG").get_logger()
+
+# filtering.<param>: (column, comparison a job must pass). The operator functions work on single
+# values and on NumPy arrays alike, so the streaming and the batch filter share this table.
+FILTER_PREDICATES = {
+    'min_client_spent': ('client_total_spent', operator.ge),
+    'min_client_rating': ('client_rating', operator.ge),
+    'min_client_reviews': ('client_reviews', operator.ge),
+    'min_hire_rate': ('buyer_hire_rate_pct', operator.ge),
+    'max_applicants': ('applicants', operator.le),
+}
+
+# Plausible ranges; values outside are extraction noise and become 0 (as in JobAttrExtractor)
+VALID_RANGES = {
+    'buyer_stats_hoursCount': (0, 1_000_000),
+    'client_hires': (0, 10_000),
+    'buyer_stats_totalJobsWithHires': (0, 10_000),
+    'client_reviews': (0, 10_000),
+    'client_rating': (0, 5),
+}
+
+MONEY_PATTERN = r'^\$?\s*([\d,]*\.?\d+)\s*([KkMm]?)\+?$'
+MONEY_SCALES = {'K': 1_000.0, 'M': 1_000_000.0}
+BOOL_TEXT = {'true': True, '1': True, 'yes': True, 'false': False, '0': False, 'no': False}
+
+
+def days_posted_cutoff(days, now: Optional[datetime.datetime] = None) -> Optional[datetime.datetime]:
+    """UTC cutoff for a days_posted value, or None if it is missing or not a number."""
+    if days is None or days == '':
+        return None
+    try:
+        days = int(days)
+    except (TypeError, ValueError):
+        logger.warning(f"Invalid days_posted value: {days}")
+        return None
+    return (now or datetime.datetime.now(datetime.timezone.utc)) - datetime.timedelta(days=days)
+
+
+class ResultFilter:
+    """Numeric thresholds from filtering.<param> (see FILTER_PREDICATES). Jobs missing a value are kept."""
+
+    def __init__(self, thresholds: dict):
+        self.thresholds = dict(thresholds)
+        self.checks = [(param, *FILTER_PREDICATES[param], threshold) for param, threshold in self.thresholds.items()]
+
+    @classmethod
+    def from_search_params(cls, search_params: dict) -> Optional['ResultFilter']:
+        """ResultFilter from search_params['filtering'], or None when no threshold is set."""
+        filtering = search_params.get('filtering') or {}
+        thresholds = {}
+        for param in FILTER_PREDICATES:
+            value = filtering.get(param)
+            if value is None or value == '':
+                continue
+            try:
+                thresholds[param] = float(value)
+            except (TypeError, ValueError):
+                logger.warning(f"⚠️ Ignoring filtering.{param}: {value!r} is not a number")
+        if not thresholds:
+            return None
+        logger.info(f"📏 Result thresholds: {', '.join(f'{param}={value:g}' for param, value in thresholds.items())}")
+        return cls(thresholds)
+
+    def check(self, record) -> Optional[str]:
+        """The threshold `record` (a JobRecord or dict) fails, or None to keep it."""
+        for param, column, compare, threshold in self.checks:
+            value = coerce_value(record.get(column), field_type(column))
+            if value is not None and not compare(value, threshold):
+                return param
+        return None
+
+    def mask(self, frame, cutoff_time: Optional[datetime.datetime] = None):
+        """
+        Boolean NumPy mask of the rows of a normalized DataFrame (see normalize_frame) that pass
+        days_posted and every threshold, plus the number of rows each one dropped.
+        """
+        import numpy as np
+        import pandas as pd
+
+        keep = np.ones(len(frame), dtype=bool)
+        dropped = {}
+        if cutoff_time is not None and 'ts_create' in frame:
+            fails = (frame['ts_create'] < pd.Timestamp(cutoff_time)).to_numpy(dtype=bool, na_value=False)
+            dropped['days_posted'] = int(np.count_nonzero(fails & keep))
+            keep &= ~fails
+        for param, column, compare, threshold in self.checks:
+            if column not in frame:
+                continue
+            values = frame[column].to_numpy(dtype='float64', na_value=np.nan)
+            with np.errstate(invalid='ignore'):
+                fails = ~compare(values, threshold) & ~np.isnan(values)
+            dropped[param] = int(np.count_nonzero(fails & keep))
+            keep &= ~fails
+        return keep, dropped
+
+
+def _parse_distinct(column, parse):
+    """
+    Apply `parse` (Series of distinct text values -> float64 array) once per distinct value and
+    broadcast the results back; result columns repeat the same amounts, counts and flags a lot.
+    """
+    import numpy as np
+    import pandas as pd
+
+    codes, uniques = pd.factorize(column.astype('string').str.strip())
+    parsed = np.append(parse(pd.Series(uniques, dtype='string')), np.nan)
+    return parsed[codes]
+
+
+def _parse_money(text):
+    import numpy as np
+    import pandas as pd
+
+    parts = text.str.extract(MONEY_PATTERN)
+    number = pd.to_numeric(parts[0].str.replace(',', '', regex=False), errors='coerce').to_numpy(dtype='float64', na_value=np.nan)
+    scale = parts[1].str.upper().map(MONEY_SCALES).to_numpy(dtype='float64', na_value=1.0)
+    return number * np.nan_to_num(scale, nan=1.0)
+
+
+def _parse_number(text):
+    import numpy as np
+    import pandas as pd
+
+    return pd.to_numeric(text.str.replace(',', '', regex=False), errors='coerce').to_numpy(dtype='float64', na_value=np.nan)
+
+
+def _parse_bool(text):
+    import numpy as np
+
+    return text.str.lower().map(BOOL_TEXT).to_numpy(dtype='float64', na_value=np.nan)
+
+
+def _is_number_column(column) -> bool:
+    import pandas as pd
+
+    return pd.api.types.is_numeric_dtype(column) and not pd.api.types.is_bool_dtype(column)
+
+
+def _money_column(column):
+    """Money values as float64: numbers pass through, text like "$1,234.5", "19K" or "$1.2M+" is scaled."""
+    import numpy as np
+
+    if _is_number_column(column):
+        return column.to_numpy(dtype='float64', na_value=np.nan)
+    return _parse_distinct(column, _parse_money)
+
+
+def _number_column(column):
+    import numpy as np
+
+    if _is_number_column(column):
+        return column.to_numpy(dtype='float64', na_value=np.nan)
+    return _parse_distinct(column, _parse_number)
+
+
+def _bool_column(column):
+    import pandas as pd
+
+    if pd.api.types.is_bool_dtype(column):
+        return column.astype('boolean')
+    return pd.array(_parse_distinct(column, _parse_bool), dtype='Float64').astype('boolean')
+
+
+def _as_list(value) -> Optional[list]:
+    """A list column value: lists as they are, CSV text such as "['Python', 'Scrapy']" parsed back."""
+    if value is None or isinstance(value, float):
+        return None
+    if isinstance(value, str):
+        text = value.strip()
+        if not text:
+            return None
+        if text.startswith('['):
+            try:
+                value = ast.literal_eval(text)
+            except (ValueError, SyntaxError):
+                return [text]
+        else:
+            return [text]
+    return [str(item) for item in value]
+
+
+def normalize_frame(frame):
+    """
+    Vectorized clean-up of a result set, in place and returned: money columns to floats (K/M
+    suffixes scaled), counts to nullable ints, flags to booleans, timestamps to UTC datetimes,
+    skills and questions to lists, out-of-range values to 0, the hire rate recomputed from jobs with hires / jobs posted and
+    clamped to 0-100, and budgets made consistent with the job type.
+    """
+    import numpy as np
+    import pandas as pd
+
+    columns = {}
+    for field in frame.columns:
+        if field in FLOAT_FIELDS:
+            columns[field] = _money_column(frame[field])
+        elif field in INT_FIELDS:
+            columns[field] = _number_column(frame[field])
+    for field, (low, high) in VALID_RANGES.items():
+        if field in columns:
+            values = columns[field]
+            with np.errstate(invalid='ignore'):
+                columns[field] = np.where((values < low) | (values > high), 0.0, values)
+
+    if 'buyer_hire_rate_pct' in columns and 'buyer_stats_totalJobsWithHires' in columns and 'buyer_jobs_postedCount' in columns:
+        posted = columns['buyer_jobs_postedCount']
+        with np.errstate(invalid='ignore', divide='ignore'):
+            rate = np.round(columns['buyer_stats_totalJobsWithHires'] / np.where(posted > 0, posted, np.nan) * 100)
+        columns['buyer_hire_rate_pct'] = np.where(np.isnan(rate), columns['buyer_hire_rate_pct'], rate)
+    if 'buyer_hire_rate_pct' in columns:
+        columns['buyer_hire_rate_pct'] = np.clip(columns['buyer_hire_rate_pct'], 0, 100)
+
+    if 'type' in frame:
+        job_type = frame['type'].astype('string').to_numpy(dtype=object, na_value='')
+        is_fixed = job_type == 'Fixed'
+        is_hourly = job_type == 'Hourly'
+        for field in ('hourly_min', 'hourly_max'):
+            if field in columns:
+                with np.errstate(invalid='ignore'):
+                    is_hourly |= ~is_fixed & (columns[field] > 0)
+                columns[field] = np.where(is_fixed, 0.0, columns[field])
+        if 'fixed_budget_amount' in columns:
+            columns['fixed_budget_amount'] = np.where(is_hourly, 0.0, columns['fixed_budget_amount'])
+
+    for field, values in columns.items():
+        frame[field] = pd.array(np.round(values), dtype='Int64') if field in INT_FIELDS else values
+    for field in frame.columns:
+        if field in BOOL_FIELDS:
+            frame[field] = _bool_column(frame[field])
+        elif field in LIST_FIELDS:
+            frame[field] = frame[field].map(_as_list)
+        elif field in TIMESTAMP_FIELDS and not isinstance(frame[field].dtype, pd.DatetimeTZDtype):
+            frame[field] = pd.to_datetime(frame[field].replace('', None), utc=True, errors='coerce', format='ISO8601')
+    return frame
+
+
+def post_process(results, search_params: Optional[dict] = None, now: Optional[datetime.datetime] = None):
+    """
+    Normalize and filter a whole result set: `results` is a DataFrame or an iterable of
+    JobRecords/dicts. Applies days_posted and the filtering thresholds of `search_params`.
+    Returns the kept rows and the number of rows each check dropped.
+    """
+    import pandas as pd
+
+    search_params = search_params or {}
+    frame = results.copy() if isinstance(results, pd.DataFrame) else records_to_dataframe(results)
+    normalize_frame(frame)
+    result_filter = ResultFilter.from_search_params(search_params) or ResultFilter({})
+    keep, dropped = result_filter.mask(frame, days_posted_cutoff(search_params.get('days_posted'), now))
+    return frame[keep].reset_index(drop=True), {reason: count for reason, count in dropped.items() if count}
+
+
+def load_results(paths: Iterable[str]):
+    """One DataFrame of earlier CSV, JSONL or Parquet outputs (CSV read as text; see normalize_frame)."""
+    import pandas as pd
+
+    frames = []
+    for path in paths:
+        extension = os.path.splitext(path)[1].lower()
+        if extension == '.parquet':
+            frames.append(pd.read_parquet(path))
+        elif extension == '.jsonl':
+            frames.append(pd.read_json(path, lines=True, dtype=False))
+        else:
+            frames.append(pd.read_csv(path, dtype=str, keep_default_na=False))
+    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=list(OUTPUT_FIELDS))
+
+
+def save_results(frame, path: str):
+    """Write a result set as CSV, JSONL or Parquet, chosen by the file extension."""
+    extension = os.path.splitext(path)[1].lower()
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    if extension == '.parquet':
+        frame.to_parquet(path, index=False)
+    elif extension == '.jsonl':
+        frame.to_json(path, orient='records', lines=True, date_format='iso', force_ascii=False)
+    else:
+        frame.to_csv(path, index=False)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Normalize and filter earlier job results (CSV, JSONL or Parquet)")
+    parser.add_argument('paths', nargs='+', help='Result files to load')
+    parser.add_argument('--search', type=str, help='Search JSON (file or string) whose days_posted and filtering thresholds apply')
+    parser.add_argument('--days_posted', type=int, help='Keep jobs created in the last N days')
+    for param in FILTER_PREDICATES:
+        parser.add_argument(f'--{param}', type=float, help=f'filtering.{param}')
+    parser.add_argument('--output', type=str, help='Write the kept jobs here (.csv, .jsonl or .parquet)')
+    args = parser.parse_args()
+
+    search_params = {}
+    if args.search:
+        if os.path.isfile(args.search):
+            with open(args.search, 'r') as f:
+                search_params = json.load(f)
+        else:
+            search_params = json.loads(args.search)
+    if args.days_posted is not None:
+        search_params['days_posted'] = args.days_posted
+    filtering = dict(search_params.get('filtering') or {})
+    filtering.update({param: getattr(args, param) for param in FILTER_PREDICATES if getattr(args, param) is not None})
+    search_params['filtering'] = filtering
+
+    start = time.perf_counter()
+    results = load_results(args.paths)
+    loaded = time.perf_counter()
+    kept, dropped = post_process(results, search_params)
+    logger.info(f"📂 Loaded {len(results)} jobs from {len(args.paths)} files in {loaded - start:.2f}s")
+    logger.info(f"📏 Kept {len(kept)} jobs in {(time.perf_counter() - loaded) * 1000:.1f}ms. Dropped: {dropped or 'none'}")
+    if args.output:
+        save_results(kept, args.output)
+        logger.info(f"💾 Saved {len(kept)} jobs to {args.output}")
@@ -0,0 +1,148 @@
+"""
+Crash-safe progress of a scraping run, for resuming it.
+
+While a run streams records to its output files, every job whose detail page has been
+processed is appended to a per-search checkpoint (`<search key>.ids`, one `job_id<TAB>0|1` line
+per job, 1 when the record was written), next to a small JSON file with the output paths. A run
+that is killed, crashes or loses its session leaves the checkpoint behind; the next run of the
+same search skips the processed jobs, counts the written ones toward the limit and appends to
+the same CSV/JSONL files. A run that finishes removes its checkpoint.
+"""
+
+import argparse
+import datetime
+import json
+import os
+import threading
+from typing import Optional
+
+try:
+    from logger import Logger
+    from search_watermark import search_key
+except ImportError:
+    from execution.logger import Logger
+    from execution.search_watermark import search_key
+
+logger = Logger(level="DEBUG").get_logger()
+
+DEFAULT_CHECKPOINT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'cache', 'checkpoints')
+
+
+class RunCheckpoint:
+    """Checkpoint of one saved search (keyed like its watermark)."""
+
+    def __init__(self, search_url: str, directory: str = DEFAULT_CHECKPOINT_DIR, resume: bool = True):
+        self.key = search_key(search_url)
+        self.search_url = search_url
+        self.meta_path = os.path.join(directory, f'{self.key}.json')
+        self.ids_path = os.path.join(directory, f'{self.key}.ids')
+        self.processed = set()
+        self.written = 0
+        self.outputs = []
+        self._file = None
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        if resume:
+            self._load()
+        else:
+            self.discard()
+
+    def _load(self):
+        try:
+            with open(self.meta_path, 'r') as f:
+                meta = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"⚠️ Could not read checkpoint {self.meta_path} ({e}). Starting fresh.")
+            return
+        try:
+            with open(self.ids_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    job_id, _, accepted = line.rstrip('\n').partition('\t')
+                    if job_id and job_id not in self.processed:
+                        self.processed.add(job_id)
+                        self.written += accepted == '1'
+        except FileNotFoundError:
+            pass
+        self.outputs = [path for path in meta.get('outputs', []) if os.path.exists(path)]
+        logger.info(f"⏯️ Resuming interrupted run from {meta.get('started_at')}: {len(self.processed)} jobs processed, "
+                    f"{self.written} written to {', '.join(self.outputs) or 'no output file'}")
+
+    @property
+    def resuming(self) -> bool:
+        return bool(self.processed)
+
+    def start(self, outputs: list):
+        """Record the run's output files and open the id log for appending."""
+        meta = {
+            'search_url': self.search_url,
+            'outputs': list(outputs),
+            'started_at': datetime.datetime.now().replace(microsecond=0).isoformat(),
+        }
+        tmp_path = f"{self.meta_path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(meta, f, indent=2)
+        os.replace(tmp_path, self.meta_path)
+        self._file = open(self.ids_path, 'a', encoding='utf-8')
+
+    def is_processed(self, job_id: Optional[str]) -> bool:
+        return job_id in self.processed
+
+    def record(self, job_id: Optional[str], written: bool):
+        """Append one processed job; flushed at once so it survives a crash."""
+        if not job_id or self._file is None:
+            return
+        with self._lock:
+            self._file.write(f"{job_id}\t{int(written)}\n")
+            self._file.flush()
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def discard(self):
+        """Remove the checkpoint, e.g. once the run has finished."""
+        self.close()
+        for path in (self.meta_path, self.ids_path):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+
+def open_run_checkpoint(checkpoint_params: Optional[dict], search_url: str) -> Optional[RunCheckpoint]:
+    """RunCheckpoint configured from general.checkpoint ({"enabled", "resume", "path"}), or None when disabled."""
+    checkpoint_params = checkpoint_params or {}
+    if not checkpoint_params.get('enabled', True):
+        return None
+    try:
+        return RunCheckpoint(search_url, checkpoint_params.get('path') or DEFAULT_CHECKPOINT_DIR,
+                             resume=checkpoint_params.get('resume', True))
+    except OSError as e:
+        logger.warning(f"⚠️ Run checkpoint unavailable ({e}). This run cannot be resumed.")
+        return None
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="List or clear checkpoints of interrupted runs")
+    parser.add_argument('--path', type=str, default=DEFAULT_CHECKPOINT_DIR, help='Checkpoint directory')
+    parser.add_argument('--clear', action='store_true', help='Remove every checkpoint')
+    args = parser.parse_args()
+
+    names = sorted(name for name in os.listdir(args.path) if name.endswith('.json')) if os.path.isdir(args.path) else []
+    for name in names:
+        meta_path = os.path.join(args.path, name)
+        ids_path = meta_path[:-len('.json')] + '.ids'
+        with open(meta_path, 'r') as f:
+            meta = json.load(f)
+        processed = sum(1 for _ in open(ids_path, 'r', encoding='utf-8')) if os.path.exists(ids_path) else 0
+        logger.info(f"⏯️ {name[:-5]}: {processed} jobs processed since {meta.get('started_at')} -> {', '.join(meta.get('outputs', []))}")
+        if args.clear:
+            os.remove(meta_path)
+            if os.path.exists(ids_path):
+                os.remove(ids_path)
+    if args.clear:
+        logger.info(f"🧹 Removed {len(names)} checkpoints")
@@ -19,7 +19,7 @@ import scrape_upwork
 # Setup Logging
 logger = Logger(level="DEBUG").get_logger()
 
-async def run_directive(search_params_input: str, browser_type: str = 'camoufox', headless: bool = True, max_workers: int = 5, limit: int = 50):
+async def run_directive(search_params_input: str, browser_type: str = 'camoufox', headless: bool = True, max_workers: int = 5, limit: int = 50, parse_workers: int = None, parser: str = 'html.parser', http_engine: str = 'requests', concurrency: int = 10, rate_limits: dict = None, adaptive_concurrency: bool = True, max_concurrency: int = None, cache: dict = None, incremental: bool = False, search_workers: int = 4, output_fields: list = None, session_store: dict = None, accounts: dict = None, session_refresh: dict = None, browser_pool: dict = None, output_format: str = 'csv', checkpoint: dict = None):
     logger.info("🚀 Starting Job Search Scraping...")
 
     try:
@@ -34,7 +34,25 @@ async def run_directive(search_params_input: str, browser_type: str = 'camoufox'
             browser_type=browser_type,
             headless=headless,
             max_workers=max_workers,
-            limit=limit
+            limit=limit,
+            parse_workers=parse_workers,
+            parser=parser,
+            http_engine=http_engine,
+            concurrency=concurrency,
+            rate_limits=rate_limits,
+            adaptive_concurrency=adaptive_concurrency,
+            max_concurrency=max_concurrency,
+            cache=cache,
+            incremental=incremental,
+            search_workers=search_workers,
+            output_fields=output_fields,
+            session_store=session_store,
+            accounts=accounts,
+            session_refresh=session_refresh,
+            browser_pool=browser_pool,
+            output_format=output_format,
+            checkpoint=checkpoint,
+            keep_records=False
         )
     except Exception as e:
         logger.error(f"❌ Scraping process failed: {e}")
@@ -50,6 +68,26 @@ if __name__ == "__main__":
     parser.add_argument('--no-headless', action='store_true', help='Run browser visible')
     parser.add_argument('--max_workers', type=int, default=5, help='Worker threads')
     parser.add_argument('--limit', type=int, default=10, help='Max jobs to scrape')
+    parser.add_argument('--parse_workers', type=int, default=None, help='Parse processes (default: CPU count)')
+    parser.add_argument('--parser', type=str, default='html.parser', choices=['html.parser', 'lxml'], help='HTML parser backend')
+    parser.add_argument('--http_engine', type=str, default='requests', choices=['requests', 'async'], help='HTTP engine')
+    parser.add_argument('--concurrency', type=int, default=10, help='Concurrent requests (async engine)')
+    parser.add_argument('--search_rate', type=float, default=None, help='Search page requests per second')
+    parser.add_argument('--detail_rate', type=float, default=None, help='Job detail requests per second')
+    parser.add_argument('--no-adaptive', action='store_true', help='Disable adaptive concurrency')
+    parser.add_argument('--max_concurrency', type=int, default=None, help='Adaptive concurrency ceiling')
+    parser.add_argument('--no-cache', action='store_true', help='Ignore the job detail cache')
+    parser.add_argument('--cache_ttl', type=float, default=None, help='Job cache freshness in hours')
+    parser.add_argument('--incremental', action='store_true', help='Only new jobs since the last run')
+    parser.add_argument('--search_workers', type=int, default=4, help='Search pages prefetched per query')
+    parser.add_argument('--output_fields', type=str, default=None, help='Comma-separated CSV columns (tile-only when possible)')
+    parser.add_argument('--fresh_login', action='store_true', help='Ignore the saved login session')
+    parser.add_argument('--session_max_age', type=float, default=None, help='Saved session lifetime in hours')
+    parser.add_argument('--accounts', type=int, default=0, help='Accounts from the status file to scrape with (0: single account)')
+    parser.add_argument('--max_relogins', type=int, default=3, help='Background re-logins allowed when the session expires (0: never)')
+    parser.add_argument('--output_format', type=str, default='csv', help='csv, jsonl, parquet, sqlite or a comma-separated mix')
+    parser.add_argument('--no_resume', action='store_true', help='Ignore the checkpoint of an interrupted run')
+    parser.add_argument('--browser_pool', type=int, default=1, help='Warm Camoufox contexts kept ready for logins (0: new browser per login)')
 
     args = parser.parse_args()
 
@@ -58,6 +96,32 @@ if __name__ == "__main__":
         browser_type=args.browser,
         headless=not args.no_headless,
         max_workers=args.max_workers,
-        limit=args.limit
+        limit=args.limit,
+        parse_workers=args.parse_workers,
+        parser=args.parser,
+        http_engine=args.http_engine,
+        concurrency=args.concurrency,
+        rate_limits={
+            **({'search': {'rate': args.search_rate}} if args.search_rate else {}),
+            **({'detail': {'rate': args.detail_rate}} if args.detail_rate else {}),
+        },
+        adaptive_concurrency=not args.no_adaptive,
+        max_concurrency=args.max_concurrency,
+        cache={
+            'enabled': not args.no_cache,
+            **({'ttl_hours': args.cache_ttl} if args.cache_ttl is not None else {}),
+        },
+        incremental=args.incremental,
+        search_workers=args.search_workers,
+        output_fields=args.output_fields.split(',') if args.output_fields else None,
+        session_store={
+            'reuse': not args.fresh_login,
+            **({'max_age_hours': args.session_max_age} if args.session_max_age is not None else {}),
+        },
+        accounts={'enabled': args.accounts > 0, 'max_accounts': args.accounts},
+        session_refresh={'enabled': args.max_relogins > 0, 'max_refreshes': args.max_relogins},
+        browser_pool={'enabled': args.browser_pool > 0, 'size': max(1, args.browser_pool)},
+        output_format=args.output_format,
+        checkpoint={'resume': not args.no_resume}
     ))
 
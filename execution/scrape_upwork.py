@@ -34,7 +34,7 @@ load_dotenv(os.path.join(env_dir, '.env'))
 # Setup Logging
 logger = Logger(level="DEBUG").get_logger()
 
-async def run_workflow(search_params_input: str, browser_type: str = 'camoufox', headless: bool = True, max_workers: int = 5, limit: int = 50):
+async def run_workflow(search_params_input: str, browser_type: str = 'camoufox', headless: bool = True, max_workers: int = 5, limit: int = 50, parse_workers: int = None, parser: str = 'html.parser', http_engine: str = 'requests', concurrency: int = 10, rate_limits: dict = None, adaptive_concurrency: bool = True, max_concurrency: int = None, cache: dict = None, incremental: bool = False, search_workers: int = 4, output_fields: list = None, session_store: dict = None, accounts: dict = None, session_refresh: dict = None, browser_pool: dict = None, output_format: str = 'csv', checkpoint: dict = None, keep_records: bool = True):
     """
     Main workflow execution function.
     """
@@ -75,7 +75,25 @@ async def run_workflow(search_params_input: str, browser_type: str = 'camoufox',
             "save_csv": True, # Always save CSV in this refactored version
             "browser_type": browser_type,
             "headless": headless,
-            "max_workers": max_workers
+            "max_workers": max_workers,
+            "parse_workers": parse_workers,
+            "parser": parser,
+            "http_engine": http_engine,
+            "concurrency": concurrency,
+            "rate_limits": rate_limits or {},
+            "adaptive_concurrency": adaptive_concurrency,
+            "max_concurrency": max_concurrency,
+            "cache": cache or {},
+            "incremental": incremental,
+            "search_workers": search_workers,
+            "output_fields": output_fields,
+            "session_store": session_store or {},
+            "accounts": accounts or {},
+            "session_refresh": session_refresh or {},
+            "browser_pool": browser_pool or {},
+            "output_format": output_format,
+            "checkpoint": checkpoint or {},
+            "keep_records": keep_records
         }
     }
     
@@ -86,21 +104,14 @@ async def run_workflow(search_params_input: str, browser_type: str = 'camoufox',
         logger.error(f"Scraping failed: {e}")
         return []
 
-    if not jobs:
+    # Without keep_records the jobs were only streamed to the output files
+    if not jobs and keep_records:
         logger.warning("No jobs found.")
         return []
 
-    logger.info(f"Scraping Complete. Found {len(jobs)} jobs.")
-    
-    # Identify the latest CSV created by the scraper
-    execution_dir = os.path.dirname(os.path.abspath(__file__))
-    data_dir = os.path.join(execution_dir, 'data', 'outputs', 'jobs', 'csv')
-    if os.path.exists(data_dir):
-        files = [os.path.join(data_dir, f) for f in os.listdir(data_dir) if f.endswith('.csv')]
-        if files:
-            latest_file = max(files, key=os.path.getctime)
-            logger.info(f"✅ Jobs saved to CSV: {latest_file}")
-    
+    # The scraper logs the files its output sink wrote ("💾 Saved ... to ...")
+    logger.info(f"Scraping Complete. Found {len(jobs)} jobs." if keep_records else "Scraping Complete.")
+
     return jobs
 
 if __name__ == "__main__":
@@ -111,13 +122,75 @@ if __name__ == "__main__":
     parser.add_argument('--no-headless', action='store_true', help='Run browser in headful mode (visible). Default is headless.')
     parser.add_argument('--max_workers', type=int, default=5, help='Max workers for threaded requests')
     parser.add_argument('--limit', type=int, default=10, help='Max jobs to scrape')
+    parser.add_argument('--parse_workers', type=int, default=None, help='Processes for HTML parsing (default: CPU count)')
+    parser.add_argument('--parser', type=str, default='html.parser', choices=['html.parser', 'lxml'],
+                        help='HTML parser backend: html.parser (default) or lxml (faster, falls back to html.parser if missing)')
+    parser.add_argument('--http_engine', type=str, default='requests', choices=['requests', 'async'],
+                        help='HTTP engine for search/detail pages: requests threads (default) or async httpx')
+    parser.add_argument('--concurrency', type=int, default=10, help='Max concurrent requests for the async engine')
+    parser.add_argument('--search_rate', type=float, default=None, help='Search page requests per second (default: 0.2)')
+    parser.add_argument('--detail_rate', type=float, default=None, help='Job detail requests per second (default: 0.5)')
+    parser.add_argument('--no-adaptive', action='store_true', help='Keep concurrency fixed instead of adapting it to 429/403/Cloudflare and latency')
+    parser.add_argument('--max_concurrency', type=int, default=None, help='Ceiling for the adaptive concurrency window (default: 4x the starting value)')
+    parser.add_argument('--no-cache', action='store_true', help='Fetch every job detail page instead of reusing the on-disk job cache')
+    parser.add_argument('--cache_ttl', type=float, default=None, help='Hours a cached job detail stays fresh (default: 24)')
+    parser.add_argument('--incremental', action='store_true', help='Only scrape jobs not seen by earlier runs of the same search')
+    parser.add_argument('--search_workers', type=int, default=4, help='Search result pages prefetched at once per query (requests engine)')
+    parser.add_argument('--output_fields', type=str, default=None,
+                        help='Comma-separated CSV columns; detail pages are skipped when the search tiles carry all of them')
+    parser.add_argument('--fresh_login', action='store_true', help='Log in with the browser even if a saved session is still valid')
+    parser.add_argument('--session_max_age', type=float, default=None, help='Hours a saved login session is reused (default: 24)')
+    parser.add_argument('--accounts', type=int, default=0,
+                        help='Log in this many accounts from execution/data/status/email_status.json and spread requests over them (default: 0, single account)')
+    parser.add_argument('--max_relogins', type=int, default=3,
+                        help='Times the session may be renewed with a background browser login when it expires mid-run (0: never)')
+    parser.add_argument('--output_format', type=str, default='csv',
+                        help='Output formats, comma-separated: csv (default), jsonl, parquet (typed columns, needs pyarrow), sqlite (cross-run job store)')
+    parser.add_argument('--no_resume', action='store_true',
+                        help='Start over instead of resuming an interrupted run of the same search from its checkpoint')
+    parser.add_argument('--browser_pool', type=int, default=1,
+                        help='Warm Camoufox contexts kept ready on one long-lived browser for logins and re-logins (0: a new browser per login)')
     
     args = parser.parse_args()
+
+    cli_session_store = {'reuse': not args.fresh_login}
+    if args.session_max_age is not None:
+        cli_session_store['max_age_hours'] = args.session_max_age
+
+    cli_cache = {'enabled': not args.no_cache}
+    if args.cache_ttl is not None:
+        cli_cache['ttl_hours'] = args.cache_ttl
+
+    # Only override the budgets that were given on the command line
+    cli_rate_limits = {}
+    if args.search_rate:
+        cli_rate_limits['search'] = {'rate': args.search_rate}
+    if args.detail_rate:
+        cli_rate_limits['detail'] = {'rate': args.detail_rate}
     
     asyncio.run(run_workflow(
         args.search_params, 
         args.browser, 
         headless=not args.no_headless, 
         max_workers=args.max_workers,
-        limit=args.limit
+        limit=args.limit,
+        parse_workers=args.parse_workers,
+        parser=args.parser,
+        http_engine=args.http_engine,
+        concurrency=args.concurrency,
+        rate_limits=cli_rate_limits,
+        adaptive_concurrency=not args.no_adaptive,
+        max_concurrency=args.max_concurrency,
+        cache=cli_cache,
+        incremental=args.incremental,
+        search_workers=args.search_workers,
+        output_fields=args.output_fields.split(',') if args.output_fields else None,
+        session_store=cli_session_store,
+        accounts={'enabled': args.accounts > 0, 'max_accounts': args.accounts},
+        session_refresh={'enabled': args.max_relogins > 0, 'max_refreshes': args.max_relogins},
+        browser_pool={'enabled': args.browser_pool > 0, 'size': max(1, args.browser_pool)},
+        output_format=args.output_format,
+        checkpoint={'resume': not args.no_resume},
+        # Records are streamed to the output files; the CLI does not need them in memory
+        keep_records=False
     ))
@@ -0,0 +1,136 @@
+"""
+Seen-jobs watermark for incremental ("new since last run") scraping.
+
+For every saved search (identified by its search URL) the watermark keeps the ids of the jobs
+already scraped and the newest publish time seen. Search pagination stops at the first page
+that has no unseen jobs, so a frequent poll costs requests proportional to the new jobs
+rather than to the configured limit.
+"""
+
+import datetime
+import hashlib
+import json
+import os
+import re
+from typing import Optional
+
+try:
+    from logger import Logger
+    from job_cache import job_id_from_url
+except ImportError:
+    from execution.logger import Logger
+    from execution.job_cache import job_id_from_url
+
+logger = Logger(level="DEBUG").get_logger()
+
+WATERMARK_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'status', 'search_watermarks.json')
+
+# Seen ids kept per search; older ids are covered by the publish-time watermark
+MAX_SEEN_IDS = 2000
+
+PAGE_PARAM_PATTERN = re.compile(r'&page=\d+')
+
+
+def search_key(search_url: str) -> str:
+    """Stable key of a saved search: a short hash of its URL without the page parameter."""
+    return hashlib.sha1(PAGE_PARAM_PATTERN.sub('', search_url).encode('utf-8')).hexdigest()[:16]
+
+
+def _parse_ts(value) -> Optional[datetime.datetime]:
+    """ISO timestamp from the extractor (e.g. 2026-01-11T17:44:16.509Z) or a JobRecord datetime, as an aware datetime."""
+    if not value:
+        return None
+    if isinstance(value, datetime.datetime):
+        return value if value.tzinfo else value.replace(tzinfo=datetime.timezone.utc)
+    try:
+        ts = datetime.datetime.fromisoformat(str(value).replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    return ts if ts.tzinfo else ts.replace(tzinfo=datetime.timezone.utc)
+
+
+def published_at(record: dict) -> Optional[datetime.datetime]:
+    """Publish time of a job record (creation time as a fallback)."""
+    return _parse_ts(record.get('ts_publish') or record.get('ts_create'))
+
+
+class SearchWatermark:
+    """Watermark of one saved search, persisted next to email_status.json."""
+
+    def __init__(self, search_url: str, path: str = WATERMARK_PATH, max_seen: int = MAX_SEEN_IDS):
+        self.search_url = search_url
+        self.key = search_key(search_url)
+        self.path = path
+        self.max_seen = max_seen
+        entry = self._load_all().get(self.key, {})
+        # Most recent first
+        self.seen_order = list(entry.get('seen_ids', []))
+        self.seen_ids = set(self.seen_order)
+        self.last_ts_publish = entry.get('last_ts_publish')
+        self.updated_at = entry.get('updated_at')
+        if self.updated_at:
+            logger.info(f"🔖 Incremental mode: {len(self.seen_ids)} seen jobs, newest published {self.last_ts_publish} (last run {self.updated_at})")
+        else:
+            logger.info("🔖 Incremental mode: no watermark yet for this search, scraping a full run")
+
+    def _load_all(self) -> dict:
+        try:
+            with open(self.path, 'r') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"⚠️ Could not read watermarks from {self.path} ({e}). Starting fresh.")
+            return {}
+
+    def is_seen(self, url: str) -> bool:
+        return job_id_from_url(url) in self.seen_ids
+
+    def filter_new(self, hrefs: list) -> list:
+        """Job URLs from `hrefs` that were not scraped by an earlier run."""
+        return [href for href in hrefs if not self.is_seen(href)]
+
+    def filter_new_tiles(self, tiles: list) -> list:
+        """Job tiles (see tile_extractor) from `tiles` that were not scraped by an earlier run."""
+        return [tile for tile in tiles if not self.is_seen(tile['url'])]
+
+    def is_newer(self, record: dict) -> bool:
+        """
+        False only for records published at or before the watermark once the seen list is full,
+        i.e. jobs an earlier run covered whose id has aged out of the list. Until then the ids
+        alone decide, so late-indexed jobs published just before the watermark are kept.
+        """
+        if len(self.seen_order) < self.max_seen:
+            return True
+        watermark = _parse_ts(self.last_ts_publish)
+        published = published_at(record)
+        return watermark is None or published is None or published > watermark
+
+    def advance(self, job_urls: list, records: list):
+        """Mark `job_urls` as seen and move the publish-time watermark to the newest record."""
+        new_ids = [job_id for job_id in (job_id_from_url(url) for url in job_urls) if job_id and job_id not in self.seen_ids]
+        self.seen_order = (new_ids + self.seen_order)[:self.max_seen]
+        self.seen_ids = set(self.seen_order)
+        newest = _parse_ts(self.last_ts_publish)
+        for record in records:
+            published = published_at(record)
+            if published is not None and (newest is None or published > newest):
+                newest = published
+                self.last_ts_publish = published.isoformat(timespec='milliseconds').replace('+00:00', 'Z')
+        self.updated_at = datetime.datetime.now(datetime.timezone.utc).isoformat()
+
+    def save(self):
+        """Write this search's watermark back, leaving the other searches untouched."""
+        watermarks = self._load_all()
+        watermarks[self.key] = {
+            'search_url': PAGE_PARAM_PATTERN.sub('', self.search_url),
+            'seen_ids': self.seen_order,
+            'last_ts_publish': self.last_ts_publish,
+            'updated_at': self.updated_at,
+        }
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(watermarks, f, indent=2)
+        os.replace(tmp_path, self.path)
+        logger.debug(f"Saved watermark {self.key} ({len(self.seen_order)} seen ids) to {self.path}")
@@ -0,0 +1,178 @@
+"""
+Mid-run re-authentication.
+
+RefreshingSession wraps the requests.Session of a run. Every response is checked for the login
+page (the session was logged out) and for Cloudflare challenges (the clearance cookie expired).
+When the session has gone bad, one caller runs the browser login again on a background thread
+while every other request waits at a gate; the new cookies and headers are then swapped into
+the shared session and the affected requests are sent again. Long runs keep going instead of
+silently losing pages or stopping.
+"""
+
+import asyncio
+import threading
+from typing import Callable, Optional
+
+import requests
+
+try:
+    from logger import Logger
+    from concurrency_controller import is_cloudflare_challenge
+    from session_store import is_login_page
+except ImportError:
+    from execution.logger import Logger
+    from execution.concurrency_controller import is_cloudflare_challenge
+    from execution.session_store import is_login_page
+
+logger = Logger(level="DEBUG").get_logger()
+
+DEFAULT_MAX_REFRESHES = 3
+# Cloudflare challenges in a row before a re-login; single ones are usually throttling
+CLOUDFLARE_STRIKES = 3
+LOGIN_TIMEOUT = 600
+
+
+def session_problem(status_code: Optional[int], text: Optional[str], logged_in: bool = True) -> Optional[str]:
+    """'login' if a logged-in session got the login page, 'cloudflare' for a challenge page, else None."""
+    if text is None:
+        return None
+    if is_cloudflare_challenge(text):
+        return 'cloudflare'
+    if logged_in and status_code == 200 and is_login_page(text):
+        return 'login'
+    return None
+
+
+class RefreshingSession:
+    """
+    requests.Session stand-in that re-authenticates when responses show the session went bad.
+    `login` is an async callable returning a fresh requests.Session (e.g. camoufox_login_flow).
+    """
+
+    def __init__(self, session: requests.Session, login: Callable, logged_in: bool = True,
+                 max_refreshes: int = DEFAULT_MAX_REFRESHES, on_refresh: Optional[Callable] = None):
+        self.session = session
+        self.login = login
+        self.logged_in = logged_in
+        self.max_refreshes = max_refreshes
+        self.on_refresh = on_refresh
+        self.generation = 0
+        self.refreshes = 0
+        self.retried = 0
+        self._cloudflare_strikes = 0
+        self._refreshing = False
+        self._ready = threading.Event()
+        self._ready.set()
+        self._cond = threading.Condition()
+
+    # requests.Session attributes read by the rest of the pipeline
+    @property
+    def headers(self):
+        return self.session.headers
+
+    @property
+    def cookies(self):
+        return self.session.cookies
+
+    @property
+    def proxies(self):
+        return self.session.proxies
+
+    def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        """Gate for request senders: blocks while a re-login is in progress."""
+        return self._ready.wait(timeout)
+
+    def is_ready(self) -> bool:
+        return self._ready.is_set()
+
+    def check(self, status_code: Optional[int], text: Optional[str]) -> Optional[str]:
+        """Problem that warrants a re-login ('login' or 'cloudflare'), or None. Counts Cloudflare strikes."""
+        problem = session_problem(status_code, text, self.logged_in)
+        with self._cond:
+            if problem == 'cloudflare':
+                self._cloudflare_strikes += 1
+                if self._cloudflare_strikes < CLOUDFLARE_STRIKES:
+                    return None
+            elif problem is None:
+                self._cloudflare_strikes = 0
+        return problem
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """GET through the shared session; on a bad-session response, re-login (once for all callers) and retry once."""
+        self.wait_ready()
+        generation = self.generation
+        resp = self.session.get(url, **kwargs)
+        problem = self.check(resp.status_code, resp.text)
+        if problem is not None and self.refresh(generation, problem, url):
+            self.retried += 1
+            resp = self.session.get(url, **kwargs)
+        return resp
+
+    def refresh(self, generation: int, reason: str, url: str = '') -> bool:
+        """
+        Re-login unless another caller already replaced session `generation`. Blocks until the
+        new session is in place; returns True if the request should be retried.
+        """
+        with self._cond:
+            if self.generation != generation:
+                return True
+            if self._refreshing:
+                self._cond.wait_for(lambda: not self._refreshing)
+                return self.generation != generation
+            if self.refreshes >= self.max_refreshes:
+                logger.error(f"❌ Session went bad ({reason}) but the {self.max_refreshes} re-logins of this run are used up.")
+                return False
+            self._refreshing = True
+            self._ready.clear()
+
+        logger.warning(f"🔄 Session went bad ({reason} on {url}). Pausing requests and logging in again...")
+        new_session = None
+        try:
+            new_session = self._run_login()
+            self._swap(new_session)
+        except Exception as e:
+            logger.error(f"❌ Re-login failed: {e}")
+            new_session = None
+        finally:
+            with self._cond:
+                self.refreshes += 1
+                if new_session is not None:
+                    self.generation += 1
+                    self._cloudflare_strikes = 0
+                self._refreshing = False
+                self._ready.set()
+                self._cond.notify_all()
+        if new_session is None:
+            return False
+        logger.info(f"✅ Re-login {self.refreshes}/{self.max_refreshes} done. Resuming requests.")
+        if self.on_refresh is not None:
+            self.on_refresh(self)
+        return True
+
+    def _run_login(self) -> requests.Session:
+        """Run the async login on its own thread and event loop, so neither worker threads nor a running loop are blocked on it."""
+        result = {}
+
+        def target():
+            try:
+                result['session'] = asyncio.run(self.login())
+            except BaseException as e:
+                result['error'] = e
+
+        thread = threading.Thread(target=target, name='session-refresh', daemon=True)
+        thread.start()
+        thread.join(LOGIN_TIMEOUT)
+        if thread.is_alive():
+            raise TimeoutError(f"login did not finish within {LOGIN_TIMEOUT}s")
+        if 'error' in result:
+            raise result['error']
+        return result['session']
+
+    def _swap(self, new_session: requests.Session):
+        """Move the new cookies and headers into the shared session object everybody holds."""
+        self.session.cookies.clear()
+        self.session.cookies.update(new_session.cookies)
+        self.session.headers.update(new_session.headers)
+
+    def stats(self) -> dict:
+        return {'refreshes': self.refreshes, 'retried_requests': self.retried}
@@ -0,0 +1,182 @@
+"""
+Saved login sessions, reused across runs.
+
+After a successful browser login the requests.Session cookie jar and headers (User-Agent
+included) are stored per account. The next run restores them and checks them with a single
+search page request; only when that check fails (expired cookies, login page, Cloudflare
+challenge) does it launch a browser and log in again.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import time
+from typing import Optional
+
+import requests
+
+try:
+    from logger import Logger
+    from concurrency_controller import is_cloudflare_challenge
+except ImportError:
+    from execution.logger import Logger
+    from execution.concurrency_controller import is_cloudflare_challenge
+
+logger = Logger(level="DEBUG").get_logger()
+
+# Cookies are credentials: kept next to the job cache, outside version control
+DEFAULT_SESSION_STORE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'cache', 'sessions.json')
+DEFAULT_SESSION_MAX_AGE_HOURS = 24
+SESSION_CHECK_TIMEOUT = 15
+
+
+def account_key(username: Optional[str]) -> str:
+    """Store key of an account: a short hash of the username ('anonymous' without credentials)."""
+    if not username:
+        return 'anonymous'
+    return hashlib.sha1(username.strip().lower().encode('utf-8')).hexdigest()[:16]
+
+
+def is_login_page(html: str) -> bool:
+    """Same heuristic as the search page check: log in / sign up links and no user menu."""
+    html = (html or '').lower()
+    return "log in" in html and "sign up" in html and "user menu" not in html
+
+
+def session_to_dict(session: requests.Session) -> dict:
+    """Cookies and headers of `session` as JSON-serialisable data."""
+    cookies = [
+        {'name': c.name, 'value': c.value, 'domain': c.domain, 'path': c.path, 'expires': c.expires, 'secure': c.secure}
+        for c in session.cookies
+    ]
+    return {'cookies': cookies, 'headers': dict(session.headers)}
+
+
+def session_from_dict(data: dict, proxies: Optional[dict] = None) -> requests.Session:
+    """requests.Session rebuilt from session_to_dict output, with the run's proxies applied."""
+    session = requests.Session()
+    session.headers.update(data.get('headers') or {})
+    now = time.time()
+    for c in data.get('cookies') or []:
+        if c.get('expires') and c['expires'] < now:
+            continue
+        session.cookies.set(c['name'], c['value'], domain=c.get('domain'), path=c.get('path') or '/',
+                            expires=c.get('expires'), secure=bool(c.get('secure')))
+    if proxies:
+        session.proxies.update(proxies)
+    return session
+
+
+def check_session(session: requests.Session, url: str, logged_in: bool = True, timeout: float = SESSION_CHECK_TIMEOUT) -> bool:
+    """One GET of `url` (a search page): True if it succeeds without a Cloudflare challenge or, when `logged_in`, the login page."""
+    try:
+        resp = session.get(url, timeout=timeout)
+    except requests.RequestException as e:
+        logger.debug(f"Session check request failed: {e}")
+        return False
+    if resp.status_code != 200 or is_cloudflare_challenge(resp.text):
+        logger.debug(f"Session check failed: status {resp.status_code}")
+        return False
+    if logged_in and is_login_page(resp.text):
+        logger.debug("Session check failed: login page returned")
+        return False
+    return True
+
+
+class SessionStore:
+    """
+    JSON file of saved sessions keyed by account_key, readable only by the current user.
+    With `reuse` off, sessions are still saved after a login but never restored.
+    """
+
+    def __init__(self, path: str = DEFAULT_SESSION_STORE_PATH, max_age_hours: float = DEFAULT_SESSION_MAX_AGE_HOURS, reuse: bool = True):
+        self.path = path
+        self.max_age = float(max_age_hours) * 3600
+        self.reuse = reuse
+
+    def _load_all(self) -> dict:
+        try:
+            with open(self.path, 'r') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"⚠️ Could not read saved sessions from {self.path} ({e}).")
+            return {}
+
+    def _write_all(self, sessions: dict):
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w') as f:
+            json.dump(sessions, f, indent=2)
+        os.replace(tmp_path, self.path)
+
+    def load(self, username: Optional[str], proxies: Optional[dict] = None) -> Optional[requests.Session]:
+        """The saved session of `username` if one exists and is younger than max_age_hours, else None."""
+        entry = self._load_all().get(account_key(username))
+        if not entry:
+            return None
+        age = time.time() - entry.get('saved_at', 0)
+        if age > self.max_age:
+            logger.info(f"🔑 Saved session is {age / 3600:.1f}h old (max {self.max_age / 3600:g}h). Logging in again.")
+            return None
+        return session_from_dict(entry, proxies)
+
+    def save(self, username: Optional[str], session: requests.Session, browser_type: Optional[str] = None):
+        """Store (or replace) the session of `username`."""
+        sessions = self._load_all()
+        sessions[account_key(username)] = dict(session_to_dict(session), saved_at=time.time(), browser_type=browser_type)
+        self._write_all(sessions)
+        logger.debug(f"Saved session for {account_key(username)} to {self.path}")
+
+    def invalidate(self, username: Optional[str]):
+        """Forget the session of `username`, e.g. after it failed its check."""
+        sessions = self._load_all()
+        if sessions.pop(account_key(username), None) is not None:
+            self._write_all(sessions)
+
+
+def open_session_store(store_params: Optional[dict]) -> Optional[SessionStore]:
+    """SessionStore configured from general.session_store ({"enabled", "reuse", "path", "max_age_hours"}), or None when disabled."""
+    store_params = store_params or {}
+    if not store_params.get('enabled', True):
+        return None
+    return SessionStore(
+        path=store_params.get('path') or DEFAULT_SESSION_STORE_PATH,
+        max_age_hours=store_params.get('max_age_hours', DEFAULT_SESSION_MAX_AGE_HOURS),
+        reuse=store_params.get('reuse', True),
+    )
+
+
+def restore_session(store: Optional[SessionStore], username: Optional[str], check_url: str, logged_in: bool,
+                    proxies: Optional[dict] = None) -> Optional[requests.Session]:
+    """Saved session of `username` if it passes check_session against `check_url`; a failing one is dropped."""
+    if store is None or not store.reuse:
+        return None
+    session = store.load(username, proxies)
+    if session is None:
+        return None
+    start = time.monotonic()
+    if not check_session(session, check_url, logged_in):
+        logger.info("🔑 Saved session is no longer valid. Logging in again.")
+        store.invalidate(username)
+        return None
+    logger.info(f"♻️ Reusing saved session (checked in {time.monotonic() - start:.2f}s). Skipping browser login.")
+    return session
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Inspect or clear saved login sessions")
+    parser.add_argument('--path', type=str, default=DEFAULT_SESSION_STORE_PATH, help='Session store path')
+    parser.add_argument('--clear', action='store_true', help='Forget every saved session')
+    args = parser.parse_args()
+
+    store = SessionStore(args.path)
+    if args.clear:
+        store._write_all({})
+        logger.info("🧹 Saved sessions cleared")
+    for key, entry in store._load_all().items():
+        age = (time.time() - entry.get('saved_at', 0)) / 3600
+        logger.info(f"🔑 {key}: {len(entry.get('cookies', []))} cookies, {entry.get('browser_type')}, saved {age:.1f}h ago")
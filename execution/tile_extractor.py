@@ -0,0 +1,202 @@
+"""
+Job tile extraction for Upwork search result pages.
+
+Every `<article>` tile on a search page already shows the job's title, budget, experience
+level, duration, skills and some client facts. extract_job_tiles turns each tile into a
+partial job record using the same field names and value formats as JobAttrExtractor, so
+runs that only need those columns can skip the detail page, and jobs can be filtered before
+a detail request is spent on them.
+"""
+
+import datetime
+import re
+from typing import Iterable, Optional
+
+from bs4 import BeautifulSoup
+
+try:
+    from logger import Logger
+    from attr_extractor import DEFAULT_PARSER_BACKEND, resolve_parser_backend
+except ImportError:
+    from execution.logger import Logger
+    from execution.attr_extractor import DEFAULT_PARSER_BACKEND, resolve_parser_backend
+
+logger = Logger(level="DEBUG").get_logger()
+
+# Target fields a tile provides in full; any other requested column needs the detail page
+TILE_FIELDS = (
+    'url', 'job_id', 'title', 'type', 'hourly_min', 'hourly_max', 'fixed_budget_amount',
+    'level', 'duration', 'skills', 'payment_verified', 'client_total_spent',
+    'client_country', 'client_rating',
+)
+TILE_FIELD_SET = frozenset(TILE_FIELDS)
+
+JOB_LINK_TEST_ID = 'job-tile-title-link UpLink'
+JOB_ID_PATTERN = re.compile(r'~([0-9a-zA-Z]+)')
+AMOUNT_PATTERN = re.compile(r'\$\s*([\d,]+(?:\.\d+)?)\s*([KkMm])?')
+RATING_PATTERN = re.compile(r'(\d(?:\.\d+)?)')
+POSTED_PATTERN = re.compile(r'(\d+|an?|one)?\s*(second|minute|hour|day|week|month|year)s?\s+ago', re.I)
+DURATION_PATTERN = re.compile(r'(?:Est\. time:|Duration:)?\s*([^,]+)', re.I)
+
+POSTED_UNITS = {
+    'second': datetime.timedelta(seconds=1),
+    'minute': datetime.timedelta(minutes=1),
+    'hour': datetime.timedelta(hours=1),
+    'day': datetime.timedelta(days=1),
+    'week': datetime.timedelta(weeks=1),
+    'month': datetime.timedelta(days=30),
+    'year': datetime.timedelta(days=365),
+}
+POSTED_PHRASES = {
+    'just now': datetime.timedelta(0),
+    'yesterday': datetime.timedelta(days=1),
+    'last week': datetime.timedelta(weeks=1),
+    'last month': datetime.timedelta(days=30),
+}
+MONEY_SUFFIXES = {'k': 1_000, 'm': 1_000_000}
+
+
+def _text(node) -> str:
+    return node.get_text(' ', strip=True) if node is not None else ''
+
+
+def _by_test_id(tile, test_id: str):
+    return tile.find(attrs={'data-test': test_id})
+
+
+def _money(text: str) -> Optional[float]:
+    """First dollar amount in `text`, with K/M suffixes expanded ('$20K+ spent' -> 20000.0)."""
+    match = AMOUNT_PATTERN.search(text or '')
+    if not match:
+        return None
+    value = float(match.group(1).replace(',', ''))
+    return value * MONEY_SUFFIXES.get((match.group(2) or '').lower(), 1)
+
+
+def _number(value: float):
+    """Int when whole, like the numbers the Nuxt payload yields."""
+    return int(value) if value == int(value) else value
+
+
+def parse_posted_age(text: str) -> Optional[datetime.timedelta]:
+    """
+    Smallest age a 'Posted 3 hours ago' style label allows (the label is rounded down, so the
+    job is at least this old). None if the label is not recognised.
+    """
+    text = (text or '').lower()
+    for phrase, age in POSTED_PHRASES.items():
+        if phrase in text:
+            return age
+    match = POSTED_PATTERN.search(text)
+    if not match:
+        return None
+    count = match.group(1)
+    count = 1 if count in (None, 'a', 'an', 'one') else int(count)
+    return POSTED_UNITS[match.group(2).lower()] * count
+
+
+def _budget_fields(tile) -> dict:
+    """type, hourly_min/max and fixed_budget_amount from the job type and budget labels."""
+    fields = {}
+    type_label = _text(_by_test_id(tile, 'job-type-label'))
+    if type_label.lower().startswith('hourly'):
+        fields['type'] = 'Hourly'
+        amounts = [float(m.group(1).replace(',', '')) for m in AMOUNT_PATTERN.finditer(type_label)]
+        if amounts:
+            fields['hourly_min'] = _number(amounts[0])
+            fields['hourly_max'] = _number(amounts[-1])
+        # Same consistency rule as JobAttrExtractor
+        fields['fixed_budget_amount'] = '0'
+    elif type_label:
+        fields['type'] = 'Fixed'
+        fields['hourly_min'] = fields['hourly_max'] = '0'
+        budget = _money(_text(_by_test_id(tile, 'is-fixed-price')))
+        if budget is not None:
+            fields['fixed_budget_amount'] = _number(budget)
+    return fields
+
+
+def extract_tile(tile) -> Optional[dict]:
+    """Partial job record from one search result `<article>`, or None if it has no job link."""
+    link = tile.find('a', attrs={'data-test': JOB_LINK_TEST_ID})
+    if link is None:
+        # Fallback scan
+        link = next((a for a in tile.find_all('a', href=True) if '/jobs/' in a['href'] and '~' in a['href']), None)
+    match = JOB_ID_PATTERN.search(link.get('href', '')) if link is not None else None
+    if not match:
+        return None
+
+    record = {
+        'url': f"https://www.upwork.com/jobs/{match.group(0)}",
+        'job_id': match.group(1),
+        'title': _text(link),
+    }
+    record.update(_budget_fields(tile))
+
+    level = _text(_by_test_id(tile, 'experience-level'))
+    if level:
+        record['level'] = level.split(':')[-1].strip()
+    duration = _text(_by_test_id(tile, 'duration-label'))
+    if duration:
+        record['duration'] = DURATION_PATTERN.match(duration).group(1).strip()
+
+    skills = [_text(token) for token in tile.find_all(attrs={'data-test': 'token'})]
+    if skills:
+        record['skills'] = [skill for skill in skills if skill]
+
+    payment = _by_test_id(tile, 'payment-verified')
+    if payment is not None:
+        record['payment_verified'] = 'unverified' not in _text(payment).lower()
+    spent = _money(_text(_by_test_id(tile, 'total-spent')))
+    if spent is not None:
+        record['client_total_spent'] = str(_number(spent))
+    country = _text(_by_test_id(tile, 'location'))
+    if country:
+        record['client_country'] = country.replace('Location', '').strip()
+    rating = RATING_PATTERN.search(_text(tile.find(class_='air3-rating-value-text')))
+    if rating:
+        record['client_rating'] = float(rating.group(1))
+
+    # Not target fields: the description snippet and the approximate posting time, for pre-filters
+    snippet = _text(_by_test_id(tile, 'UpCLineClamp JobDescription')) or _text(_by_test_id(tile, 'job-description-text'))
+    if snippet:
+        record['snippet'] = snippet
+    age = parse_posted_age(_text(_by_test_id(tile, 'job-pubilshed-date')) or _text(_by_test_id(tile, 'job-published-date')))
+    if age is not None:
+        record['posted_before'] = datetime.datetime.now(datetime.timezone.utc) - age
+    return record
+
+
+def extract_job_tiles(html_content: str, parser: str = DEFAULT_PARSER_BACKEND) -> list:
+    """Partial job records for every job tile on a search result page, in page order."""
+    soup = BeautifulSoup(html_content, resolve_parser_backend(parser))
+    articles = soup.find_all('article')
+    logger.debug(f"[Parsing] Found {len(articles)} <article> elements.")
+    tiles = []
+    for i, article in enumerate(articles):
+        record = extract_tile(article)
+        if record is None:
+            logger.debug(f"[Parsing] Article {i}: No job link found in article HTML snippet: {str(article)[:200]}...")
+            continue
+        tiles.append(record)
+    return tiles
+
+
+def tiles_cover(fields: Optional[Iterable[str]]) -> bool:
+    """True when every requested output column comes from the tile, so detail pages can be skipped."""
+    return bool(fields) and all(field in TILE_FIELD_SET for field in fields)
+
+
+def tile_record(tile: dict) -> dict:
+    """Output record for a tile-only run: the tile's target fields, without the pre-filter extras."""
+    return {key: value for key, value in tile.items() if key in TILE_FIELD_SET}
+
+
+def posted_within(tile: dict, cutoff_time: Optional[datetime.datetime]) -> bool:
+    """
+    days_posted pre-filter: False only when the tile's label proves the job was posted before
+    `cutoff_time` (labels are rounded down, so borderline jobs go on to the exact check).
+    """
+    if cutoff_time is None or 'posted_before' not in tile:
+        return True
+    return tile['posted_before'] >= cutoff_time
@@ -2,16 +2,17 @@ import argparse
 import ast
 import asyncio
 import concurrent.futures
-import datetime
 import json
+import multiprocessing
 import os
+import queue
 import random
-import re
 import sys
+import threading
 import time
+from contextlib import nullcontext
 from urllib.parse import urlencode, urlparse
 
-import pandas as pd
 import requests
 
 # Import local modules - handle both execution contexts
@@ -19,12 +20,42 @@ try:
     # Try importing from current directory (running from execution/)
     import camoufox_utils
     import uchrome_utils
-    from attr_extractor import extract_job_attributes
+    from async_http import AsyncUpworkClient, async_engine_available
+    from rate_limiter import RateLimiter, get_default_limiter
+    from concurrency_controller import AIMDController, is_cloudflare_challenge
+    from job_cache import job_id_from_url, open_job_cache
+    from search_watermark import SearchWatermark, published_at
+    from run_checkpoint import open_run_checkpoint
+    from output_sinks import OUTPUT_FIELDS, open_job_sink
+    from job_record import JobRecord, json_value
+    from tile_extractor import extract_job_tiles, posted_within, tile_record, tiles_cover
+    from keyword_filter import KeywordFilter
+    from result_filter import ResultFilter, days_posted_cutoff
+    from session_store import open_session_store, restore_session
+    from session_refresher import RefreshingSession, DEFAULT_MAX_REFRESHES
+    from browser_pool import open_browser_pool
+    from account_pool import ACCOUNT_STATUS_PATH, DEFAULT_COOLDOWN_MINUTES, AccountPool, lease_sessions
+    from attr_extractor import DEFAULT_PARSER_BACKEND, extract_job_attributes, resolve_parser_backend
     from logger import Logger
 except ImportError:
     # Fall back to importing from execution package (running from root)
-    from execution.attr_extractor import extract_job_attributes
+    from execution.attr_extractor import DEFAULT_PARSER_BACKEND, extract_job_attributes, resolve_parser_backend
     from execution.logger import Logger
+    from execution.async_http import AsyncUpworkClient, async_engine_available
+    from execution.rate_limiter import RateLimiter, get_default_limiter
+    from execution.concurrency_controller import AIMDController, is_cloudflare_challenge
+    from execution.job_cache import job_id_from_url, open_job_cache
+    from execution.search_watermark import SearchWatermark, published_at
+    from execution.run_checkpoint import open_run_checkpoint
+    from execution.output_sinks import OUTPUT_FIELDS, open_job_sink
+    from execution.job_record import JobRecord, json_value
+    from execution.tile_extractor import extract_job_tiles, posted_within, tile_record, tiles_cover
+    from execution.keyword_filter import KeywordFilter
+    from execution.result_filter import ResultFilter, days_posted_cutoff
+    from execution.session_store import open_session_store, restore_session
+    from execution.session_refresher import RefreshingSession, DEFAULT_MAX_REFRESHES
+    from execution.browser_pool import open_browser_pool
+    from execution.account_pool import ACCOUNT_STATUS_PATH, DEFAULT_COOLDOWN_MINUTES, AccountPool, lease_sessions
     import execution.uchrome_utils as uchrome_utils
     import execution.camoufox_utils as camoufox_utils
 
@@ -129,6 +160,20 @@ UPWORK_SUBCATEGORIES = {
     "professional & business writing": "531770282597445646"
 }
 
+# Search pages of one query fetched at once after page 1 (requests engine); the search budget still applies
+SEARCH_PAGE_WORKERS = 4
+
+# Job URLs found by the search but not yet taken by a detail worker (streaming pipeline)
+URL_QUEUE_SIZE = 200
+
+# Raw search pages saved for debugging, one file per query and page (independent of the working directory)
+DEBUG_PAGE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'debug')
+
+def _debug_page_path(query, page_num):
+    """File for the raw HTML of one search page; the query is part of the name so concurrent queries do not collide."""
+    slug = ''.join(c if c.isalnum() else '_' for c in str(query)).strip('_')[:60] or 'search'
+    return os.path.join(DEBUG_PAGE_DIR, f"requests_{slug}_page_{page_num}.html")
+
 def normalize_search_params(params: dict, credentials_provided: bool, buffer: int = 5) -> tuple[dict, int]:
     """
     Normalize search parameters from config or input JSON for Upwork job search URL.
@@ -325,47 +370,17 @@ def build_upwork_search_url(params: dict) -> str:
 
 
 
-def parse_job_search_results(html_content: str) -> list[str]:
+def parse_job_search_results(html_content: str, parser: str = DEFAULT_PARSER_BACKEND) -> list[str]:
     """
     Parse HTML content of job search page to extract job URLs.
     
     :param html_content: HTML content of the search result page
+    :param parser: BeautifulSoup tree builder ('html.parser' or 'lxml')
     :return: List of valid Upwork job URLs
     """
-    soup = BeautifulSoup(html_content, 'html.parser')
-    articles = soup.find_all('article')
-    logger.debug(f"[Parsing] Found {len(articles)} <article> elements.")
-    
-    if len(articles) == 0:
-        # Debug: check for common 'no results' containers?
-        # Just logging for now
-        pass
-
-    page_hrefs = []
-    for i, article in enumerate(articles):
-        a_tag = article.find('a', attrs={'data-test': 'job-tile-title-link UpLink'})
-        if not a_tag:
-            # Fallback scan
-            for a in article.find_all('a', href=True):
-                if '/jobs/' in a['href'] and '~' in a['href']:
-                    a_tag = a
-                    break
-        
-        if a_tag and a_tag.has_attr('href'):
-            href = a_tag['href']
-            match = re.search(r'~([0-9a-zA-Z]+)', href)
-            if match:
-                job_id = match.group(0)
-                job_url = f"https://www.upwork.com/jobs/{job_id}"
-                page_hrefs.append(job_url)
-            else:
-                logger.debug(f"[Parsing] Article {i}: Found link {href} but regex failed.")
-        else:
-             logger.debug(f"[Parsing] Article {i}: No job link found in article HTML snippet: {str(article)[:200]}...")
-    
-    return page_hrefs
+    return [tile['url'] for tile in extract_job_tiles(html_content, parser)]
 
-def get_job_urls_selenium(driver, search_querys, search_urls, limit=50):
+def get_job_urls_selenium(driver, search_querys, search_urls, limit=50, parser=DEFAULT_PARSER_BACKEND, limiter=None, watermark=None, on_tiles=None):
     """
     For each search query and URL, use Selenium to fetch the page within the browser and extract job URLs.
     
@@ -373,8 +388,13 @@ def get_job_urls_selenium(driver, search_querys, search_urls, limit=50):
     :param search_querys: List of search query strings
     :param search_urls: List of Upwork search URLs
     :param limit: Maximum number of job URLs to extract
+    :param limiter: RateLimiter pacing the page loads (defaults to the shared limiter)
+    :param watermark: SearchWatermark for incremental runs; only unseen jobs are returned and
+        pagination stops at the first page without any
+    :param on_tiles: Callback receiving each page's job tiles (partial records, see tile_extractor)
     :return: Dictionary mapping each query to a list of job URLs
     """
+    limiter = limiter or get_default_limiter()
     search_results = {}
     
     for query, base_url in zip(search_querys, search_urls):
@@ -387,8 +407,8 @@ def get_job_urls_selenium(driver, search_querys, search_urls, limit=50):
             logger.debug(f"[selenium] Navigating to URL: {url}")
             
             try:
-                # Add random sleep before navigation
-                time.sleep(random.uniform(5.5, 9.5))
+                # Wait for the search budget before navigation
+                limiter.acquire('search')
                 driver.get(url)
                 
                 # Check for "log in" string to detect sessions issues
@@ -409,12 +429,12 @@ def get_job_urls_selenium(driver, search_querys, search_urls, limit=50):
                         logger.error("❌ Session validation failed: 'Log In' / 'Sign Up' text found on search page.")
                         raise Exception("Session Invalid: Appears to not be logged in.")
 
-                page_hrefs = parse_job_search_results(html)
+                page_tiles = extract_job_tiles(html, parser)
                 
-                logger.debug(f"Found {len(page_hrefs)} jobs on page {page_num} for query '{query}'")
+                logger.debug(f"Found {len(page_tiles)} jobs on page {page_num} for query '{query}'")
                 
                 # If no jobs found
-                if not page_hrefs:
+                if not page_tiles:
                     if page_num == 1:
                         logger.error(f"❌ No jobs found on page 1 for query '{query}'. Search parameters might be invalid or Upwork is blocking.")
                         raise Exception("No jobs found on first page. Aborting pipeline.")
@@ -429,11 +449,19 @@ def get_job_urls_selenium(driver, search_querys, search_urls, limit=50):
                         pass
                     break
 
+                if watermark is not None:
+                    page_tiles = watermark.filter_new_tiles(page_tiles)
+                    if not page_tiles:
+                        logger.info(f"🔖 Page {page_num} of '{query}' has only already-seen jobs. Stopping pagination.")
+                        break
+
                 if page_num == pages_needed:
-                    page_hrefs = page_hrefs[:jobs_from_last_page]
-                all_hrefs.extend(page_hrefs)
+                    page_tiles = page_tiles[:jobs_from_last_page]
+                page_tiles = page_tiles[:limit - len(all_hrefs)]
+                all_hrefs.extend(tile['url'] for tile in page_tiles)
+                if on_tiles is not None:
+                    on_tiles(page_tiles)
                 if len(all_hrefs) >= limit:
-                    all_hrefs = all_hrefs[:limit]
                     break
             except Exception as e:
                 # If session invalid, abort immediately
@@ -447,135 +475,701 @@ def get_job_urls_selenium(driver, search_querys, search_urls, limit=50):
     logger.debug(f"[selenium] Search results: {search_results}\n")
     return search_results
 
-def get_job_urls_requests(session, search_querys, search_urls, limit=50):
+def _fetch_search_page(session, url, page_num, query, parser, limiter, validate_session, cancelled):
     """
-    For each search query and URL, use requests to fetch the page and extract job URLs.
+    Fetch and parse one search results page for get_job_urls_requests.
+    Returns the page's job tiles ([] for an empty page), or None if the page was cancelled
+    while waiting for its search budget or the request failed.
     """
-    search_results = {}
-    for query, base_url in zip(search_querys, search_urls):
-        all_hrefs = []
-        pages_needed = (limit + 49) // 50
-        jobs_from_last_page = limit % 50 or 50
-        for page_num in range(1, pages_needed + 1):
-            url = f"{base_url}&page={page_num}" if page_num > 1 else base_url
-            logger.debug(f"[requests] Fetching URL: {url}")
-            try:
-                # Add random sleep (more human-like)
-                time.sleep(random.uniform(3.0, 7.0))
-                resp = session.get(url, timeout=30)
-                logger.debug(f"[requests] Response Status: {resp.status_code}")
-                try:
-                    soup_debug = BeautifulSoup(resp.text, 'html.parser')
-                    body_debug = soup_debug.body.get_text(separator=' ', strip=True) if soup_debug.body else "No body tag found"
-                    logger.debug(f"[requests] DEBUG BODY TEXT:\n{body_debug[:1500]}")
-                except Exception as e:
-                    logger.error(f"Failed to debug print body: {e}")
+    # Wait for the search budget (token bucket with jitter)
+    limiter.acquire('search')
+    if cancelled.is_set():
+        return None
+    logger.debug(f"[requests] Fetching URL: {url}")
+    resp = session.get(url, timeout=30)
+    logger.debug(f"[requests] Response Status: {resp.status_code}")
+    try:
+        soup_debug = BeautifulSoup(resp.text, parser)
+        body_debug = soup_debug.body.get_text(separator=' ', strip=True) if soup_debug.body else "No body tag found"
+        logger.debug(f"[requests] DEBUG BODY TEXT:\n{body_debug[:1500]}")
+    except Exception as e:
+        logger.error(f"Failed to debug print body: {e}")
+    try:
+         resp.raise_for_status()
+    except Exception as e:
+         logger.error(f"[requests] Request failed: {e}")
+         logger.debug(f"[requests] Response content snippet: {resp.text[:1500]}")
+         return None
+    html = resp.text
+    logger.debug(f"[requests] Response content length: {len(html)}")
+    # save html to file
+    debug_path = _debug_page_path(query, page_num)
+    try:
+        os.makedirs(DEBUG_PAGE_DIR, exist_ok=True)
+        with open(debug_path, "w", encoding="utf-8") as f:
+            f.write(html)
+    except OSError as e:
+        logger.debug(f"[requests] Could not save {debug_path}: {e}")
+    if len(html) < 2000:
+         logger.debug(f"[requests] Short response content: {html}")
+
+    # Check for "log in" string on the first page of the first query
+    if validate_session:
+        if "log in" in html.lower() and "sign up" in html.lower() and "user menu" not in html.lower():
+             logger.warning("⚠️ 'log in' string detected. Session might be invalid.")
+             raise Exception("Session Invalid: 'log in' detected on search page.")
+
+    page_tiles = extract_job_tiles(html, parser)
+    logger.debug(f"Found {len(page_tiles)} jobs on page {page_num} for query '{query}'")
+    if not page_tiles and page_num == 1:
+        logger.error(f"❌ No jobs found on page 1 for query '{query}'. Search parameters might be invalid or Upwork is blocking.")
+        raise Exception("No jobs found on first page. Aborting pipeline.")
+    return page_tiles
+
+def _collect_query_requests(session, query, base_url, limit, parser, limiter, watermark, validate_session, page_workers, on_tiles=None, stop_event=None):
+    """
+    Collect up to `limit` job URLs for one query. Page 1 is fetched first (it validates the
+    session and the search); the remaining pages are then prefetched concurrently and consumed
+    in order. Outstanding pages are cancelled once the limit is reached, a page comes back
+    empty, (incremental mode) a page has no unseen jobs, or `stop_event` is set.
+    Each page's job tiles are passed to `on_tiles` as soon as the page is consumed.
+    """
+    all_hrefs = []
+    pages_needed = (limit + 49) // 50
+    jobs_from_last_page = limit % 50 or 50
+    cancelled = threading.Event()
+    page_url = lambda page_num: f"{base_url}&page={page_num}" if page_num > 1 else base_url
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, min(page_workers, pages_needed))) as executor:
+        futures = [executor.submit(_fetch_search_page, session, page_url(1), 1, query, parser, limiter, validate_session, cancelled)]
+        try:
+            for page_num in range(1, pages_needed + 1):
+                if stop_event is not None and stop_event.is_set():
+                    break
                 try:
-                     resp.raise_for_status()
+                    page_tiles = futures[page_num - 1].result()
                 except Exception as e:
-                     logger.error(f"[requests] Request failed: {e}")
-                     logger.debug(f"[requests] Response content snippet: {resp.text[:1500]}")
-                     continue
-                html = resp.text
-                logger.debug(f"[requests] Response content length: {len(html)}")
-                # save html to file
-                with open(f"execution/debug_requests_page_{page_num}.html", "w", encoding="utf-8") as f:
-                     f.write(html)
-                if len(html) < 2000:
-                     logger.debug(f"[requests] Short response content: {html}")
-                
-                # Check for "log in" string in the first iteration
-                if page_num == 1 and query == search_querys[0]:
-                    if "log in" in html.lower() and "sign up" in html.lower() and "user menu" not in html.lower():
-                         logger.warning("⚠️ 'log in' string detected. Session might be invalid.")
-                         raise Exception("Session Invalid: 'log in' detected on search page.")
-
-                page_hrefs = parse_job_search_results(html)
-                logger.debug(f"Found {len(page_hrefs)} jobs on page {page_num} for query '{query}'")
-                if not page_hrefs:
-                     if page_num == 1:
-                         logger.error(f"❌ No jobs found on page 1 for query '{query}'. Search parameters might be invalid or Upwork is blocking.")
-                         raise Exception("No jobs found on first page. Aborting pipeline.")
-                         sys.exit(0)
-                     break
-                
+                    if page_num == 1:
+                        # Page 1 validates the session and the search: nothing after it can work
+                        cancelled.set()
+                        raise
+                    logger.exception(f"[requests] Skipping page {page_num} due to errors: {e}")
+                    continue
+                if page_num == 1:
+                    # Page 1 looked fine: prefetch the rest of the pages within the search budget
+                    futures.extend(
+                        executor.submit(_fetch_search_page, session, page_url(n), n, query, parser, limiter, False, cancelled)
+                        for n in range(2, pages_needed + 1)
+                    )
+                if page_tiles is None:
+                    continue
+                if not page_tiles:
+                    break
+
+                if watermark is not None:
+                    page_tiles = watermark.filter_new_tiles(page_tiles)
+                    if not page_tiles:
+                        logger.info(f"🔖 Page {page_num} of '{query}' has only already-seen jobs. Stopping pagination.")
+                        break
+
                 if page_num == pages_needed:
-                    page_hrefs = page_hrefs[:jobs_from_last_page]
-                all_hrefs.extend(page_hrefs)
+                    page_tiles = page_tiles[:jobs_from_last_page]
+                page_tiles = page_tiles[:limit - len(all_hrefs)]
+                all_hrefs.extend(tile['url'] for tile in page_tiles)
+                if on_tiles is not None:
+                    on_tiles(page_tiles)
                 if len(all_hrefs) >= limit:
-                    all_hrefs = all_hrefs[:limit]
                     break
-            except Exception as e:
-                logger.exception(f"[requests] Skipping page {page_num} due to errors: {e}")
-                sys.exit(0)
-                
-                continue
-        search_results[query] = all_hrefs
+        finally:
+            # Drop pages that have not started and tell waiting ones not to send their request
+            cancelled.set()
+            for future in futures:
+                future.cancel()
+    return all_hrefs
+
+def get_job_urls_requests(session, search_querys, search_urls, limit=50, parser=DEFAULT_PARSER_BACKEND, limiter=None, watermark=None, page_workers=SEARCH_PAGE_WORKERS, on_tiles=None, stop_event=None):
+    """
+    For each search query and URL, use requests to fetch the pages and extract job URLs.
+    Queries run concurrently and, after page 1, up to `page_workers` pages per query are
+    prefetched at once; every page request still waits for the 'search' budget of `limiter`.
+    With a SearchWatermark only unseen jobs are returned and pagination stops at the first
+    page without any. `on_tiles` receives each page's job tiles as they are found (for
+    streaming into the detail stage) and `stop_event` ends pagination early.
+    """
+    limiter = limiter or get_default_limiter()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, len(search_querys))) as executor:
+        futures = [
+            executor.submit(_collect_query_requests, session, query, base_url, limit, parser, limiter, watermark, i == 0, page_workers, on_tiles, stop_event)
+            for i, (query, base_url) in enumerate(zip(search_querys, search_urls))
+        ]
+        search_results = {query: future.result() for query, future in zip(search_querys, futures)}
     logger.debug(f"[requests] Search results: {search_results}\n")
     return search_results
 
-def fetch_job_detail(session, url, credentials_provided):
+async def get_job_urls_async(client, search_querys, search_urls, limit=50, parser=DEFAULT_PARSER_BACKEND, watermark=None, on_tiles=None, stop_event=None):
     """
-    Fetch job detail page and extract job attributes.
+    Async counterpart of get_job_urls_requests: queries run concurrently on the shared
+    AsyncUpworkClient. Page 1 of each query is fetched first; the remaining pages are then
+    requested concurrently (bounded by the client's concurrency and search budget) and
+    consumed in order, and outstanding pages are cancelled once the limit is reached, a page
+    is empty, (with a SearchWatermark) a page has no unseen jobs, or `stop_event` is set.
+    `on_tiles` receives each page's job tiles as soon as the page is consumed.
+    """
+    async def fetch_page(query, url, page_num, validate_session):
+        logger.debug(f"[async] Fetching URL: {url}")
+        try:
+            resp = await client.get(url, endpoint='search')
+            logger.debug(f"[async] Response Status: {resp.status_code}")
+            resp.raise_for_status()
+        except Exception as e:
+            logger.error(f"[async] Request failed for page {page_num} of '{query}': {e}")
+            return None
+        html = resp.text
+
+        # Check for "log in" string in the first iteration
+        if validate_session:
+            if "log in" in html.lower() and "sign up" in html.lower() and "user menu" not in html.lower():
+                logger.warning("⚠️ 'log in' string detected. Session might be invalid.")
+                raise Exception("Session Invalid: 'log in' detected on search page.")
+
+        page_tiles = extract_job_tiles(html, parser)
+        logger.debug(f"Found {len(page_tiles)} jobs on page {page_num} for query '{query}'")
+        if not page_tiles and page_num == 1:
+            logger.error(f"❌ No jobs found on page 1 for query '{query}'. Search parameters might be invalid or Upwork is blocking.")
+            raise Exception("No jobs found on first page. Aborting pipeline.")
+        return page_tiles
+
+    async def collect(query, base_url, validate_session):
+        all_hrefs = []
+        pages_needed = (limit + 49) // 50
+        jobs_from_last_page = limit % 50 or 50
+        page_url = lambda page_num: f"{base_url}&page={page_num}" if page_num > 1 else base_url
+        tasks = [asyncio.ensure_future(fetch_page(query, page_url(1), 1, validate_session))]
+        try:
+            for page_num in range(1, pages_needed + 1):
+                if stop_event is not None and stop_event.is_set():
+                    break
+                page_tiles = await tasks[page_num - 1]
+                if page_num == 1:
+                    tasks.extend(asyncio.ensure_future(fetch_page(query, page_url(n), n, False)) for n in range(2, pages_needed + 1))
+                if page_tiles is None:
+                    # A failed page ends this query, as before
+                    break
+                if not page_tiles:
+                    break
+
+                if watermark is not None:
+                    page_tiles = watermark.filter_new_tiles(page_tiles)
+                    if not page_tiles:
+                        logger.info(f"🔖 Page {page_num} of '{query}' has only already-seen jobs. Stopping pagination.")
+                        break
+
+                if page_num == pages_needed:
+                    page_tiles = page_tiles[:jobs_from_last_page]
+                page_tiles = page_tiles[:limit - len(all_hrefs)]
+                all_hrefs.extend(tile['url'] for tile in page_tiles)
+                if on_tiles is not None:
+                    on_tiles(page_tiles)
+                if len(all_hrefs) >= limit:
+                    break
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        return all_hrefs
+
+    results = await asyncio.gather(*(
+        collect(query, base_url, i == 0) for i, (query, base_url) in enumerate(zip(search_querys, search_urls))
+    ))
+    search_results = dict(zip(search_querys, results))
+    logger.debug(f"[async] Search results: {search_results}\n")
+    return search_results
+
+def fetch_job_html(session, url, limiter=None, controller=None):
+    """
+    Download a job detail page and return its HTML, or None if the request failed.
+    The request waits for the 'detail' budget of `limiter` (defaults to the shared limiter) and,
+    when an AIMDController is given, for a slot in its window; the response is fed back to it.
     """
     logger.debug(f"[requests] Fetching details for: {url}")
+    (limiter or get_default_limiter()).acquire('detail')
+    with controller.slot() if controller else nullcontext(0) as epoch:
+        status_code, text = None, None
+        start = time.monotonic()
+        try:
+            resp = session.get(url, timeout=30)
+            status_code, text = resp.status_code, resp.text
+            resp.raise_for_status()
+            if is_cloudflare_challenge(text):
+                raise ValueError("Cloudflare challenge page returned")
+            return text
+        except Exception as e:
+            logger.debug(f"[requests] Failed to fetch {url}: {e}")
+            return None
+        finally:
+            if controller is not None:
+                controller.record(epoch, status_code, time.monotonic() - start, text, url)
+
+def parse_job_detail(url, html, parser=DEFAULT_PARSER_BACKEND):
+    """
+    Extract job attributes from a downloaded job detail page.
+    Kept free of network state so it can run inside the parse process pool.
+    """
+    job_id = job_id_from_url(url) or "0"
+    attrs = extract_job_attributes(html, parser)
+    attrs['url'] = url
+    attrs['job_id'] = job_id
+    return attrs
+
+def fetch_job_detail(session, url, credentials_provided, parser=DEFAULT_PARSER_BACKEND, limiter=None, controller=None):
+    """
+    Fetch job detail page and extract job attributes.
+    """
+    html = fetch_job_html(session, url, limiter, controller)
+    if html is None:
+        return None
     try:
-        # random sleep
-        time.sleep(random.uniform(2.5, 5.5))
-        resp = session.get(url, timeout=30)
-        resp.raise_for_status()
-        html = resp.text
-        job_id_match = re.search(r'~([0-9a-zA-Z]+)', url)
-        job_id = job_id_match.group(1) if job_id_match else "0"
-        attrs = extract_job_attributes(html)
-        attrs['url'] = url
-        attrs['job_id'] = job_id
-        return attrs
+        return parse_job_detail(url, html, parser)
     except Exception as e:
         logger.debug(f"[requests] Failed to process {url}: {e}")
         return None
 
-def browser_worker_requests(session, job_urls, credentials_provided, max_workers=5):
+def _iter_url_queue(url_queue):
+    """
+    Yield URLs from a producer queue until its None sentinel. The sentinel is put back so
+    every other worker draining the same queue sees it too.
+    """
+    while True:
+        url = url_queue.get()
+        if url is None:
+            url_queue.put(None)
+            return
+        yield url
+
+def _url_queue_from_list(job_urls):
+    """A finished URL list as a closed queue, so lists and streaming producers share one code path."""
+    url_queue = queue.Queue()
+    for url in job_urls:
+        url_queue.put(url)
+    url_queue.put(None)
+    return url_queue
+
+def _serve_cached(url, cache, emit):
+    """Emit the cached record for `url` if the cache has a fresh one; returns True on a hit."""
+    if cache is None:
+        return False
+    cached = cache.get(job_id_from_url(url))
+    if cached is None:
+        return False
+    emit(cached)
+    return True
+
+def _fetch_stage(session, url_queue, html_queue, emit, limiter, controller, cache, stop_event):
     """
-    Fetch job details in parallel using ThreadPoolExecutor with rate limiting.
-    Pauses after every 25 requests to avoid 429 errors and simulate human behavior.
+    Fetch stage worker: take URLs from `url_queue`, serve cache hits directly and hand
+    downloaded pages to the parse stage. Blocks while the html queue is full, which throttles
+    the fetch threads when parsing falls behind. Once `stop_event` is set the remaining URLs
+    are drained without being fetched.
+    """
+    for url in _iter_url_queue(url_queue):
+        if stop_event.is_set() or _serve_cached(url, cache, emit):
+            continue
+        html = fetch_job_html(session, url, limiter, controller)
+        if html is not None:
+            html_queue.put((url, html))
+
+def _store_parsed(cache, url, html, attrs):
+    """Write a freshly parsed job to the cache (if any); cache errors never fail the run."""
+    if cache is None or not attrs:
+        return
+    try:
+        cache.put(attrs.get('job_id'), url, html, attrs)
+    except Exception as e:
+        logger.debug(f"[cache] Failed to store {url}: {e}")
+
+def _collect_parsed(futures, pending, emit, cache=None):
+    """
+    Emit the results of finished parse futures and drop them from `pending`.
+    A broken pool is re-raised so the parse stage can fall back to in-thread parsing.
+    """
+    for future in futures:
+        try:
+            result = future.result()
+        except concurrent.futures.BrokenExecutor:
+            raise
+        except Exception as e:
+            logger.debug(f"[parse] Failed to process {pending[future][0]}: {e}")
+            result = None
+        item = pending.pop(future)
+        if result:
+            _store_parsed(cache, *item, result)
+            emit(result)
+
+def _parse_stage(html_queue, parse_workers, emit, parser=DEFAULT_PARSER_BACKEND, cache=None):
+    """
+    Parse stage: feed downloaded pages to a process pool until the None sentinel arrives.
+    At most 2 * parse_workers pages are in flight in the pool; beyond that the stage stops
+    draining the queue so backpressure reaches the fetch threads.
+    """
+    max_in_flight = parse_workers * 2
+    # future -> (url, html), kept so pages can be re-parsed if the pool breaks
+    pending = {}
+    backlog = []
+    try:
+        # spawn instead of fork: the fetch threads are already running when the pool starts
+        with concurrent.futures.ProcessPoolExecutor(max_workers=parse_workers, mp_context=multiprocessing.get_context('spawn')) as pool:
+            while True:
+                if len(pending) >= max_in_flight:
+                    done, _ = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                    _collect_parsed(done, pending, emit, cache)
+                item = html_queue.get()
+                if item is None:
+                    break
+                pending[pool.submit(parse_job_detail, *item, parser)] = item
+            _collect_parsed(concurrent.futures.as_completed(list(pending)), pending, emit, cache)
+        return
+    except (OSError, NotImplementedError, concurrent.futures.BrokenExecutor) as e:
+        logger.warning(f"⚠️ Parse process pool unavailable ({e}). Parsing in-thread instead.")
+        backlog = list(pending.values())
+
+    # Fallback: parse whatever the pool did not finish, then keep draining the queue here
+    while True:
+        item = backlog.pop(0) if backlog else html_queue.get()
+        if item is None:
+            break
+        try:
+            result = parse_job_detail(*item, parser)
+        except Exception as e:
+            logger.debug(f"[parse] Failed to process {item[0]}: {e}")
+            continue
+        _store_parsed(cache, *item, result)
+        emit(result)
+
+def browser_worker_requests(session, job_urls, credentials_provided, max_workers=5, parse_workers=None, parser=DEFAULT_PARSER_BACKEND, limiter=None, controller=None, cache=None, on_record=None, stop_event=None):
+    """
+    Fetch job details with a two-stage pipeline.
+    A ThreadPoolExecutor of max_workers threads downloads pages (with an AIMDController, up to its
+    maximum window, and the controller decides how many are in flight); a ProcessPoolExecutor of
+    parse_workers processes (default: CPU count) extracts attributes, so parsing is not
+    serialized on the GIL. A bounded queue between the stages provides backpressure.
+    Request pacing comes from the 'detail' budget of `limiter` rather than fixed pauses.
+    Jobs with a fresh entry in `cache` (a JobCache) skip both stages; parsed jobs are written back.
+
+    `job_urls` is either a list or a queue.Queue that a search producer fills while this runs,
+    closed with a None sentinel. Finished records go to `on_record` as they complete (from
+    several threads, one call at a time); without it they are collected and returned.
+    Setting `stop_event` stops further fetches.
     """
     job_attributes = []
-    total_urls = len(job_urls)
-    # Process in smaller batches
-    batch_size = 25 
-    
-    # Track requests for rate limiting
-    request_count = 0
-    rate_limit_threshold = 50
-    
-    for i in range(0, total_urls, batch_size):
-        batch = job_urls[i:i + batch_size]
-        
-        # Check if we need to rate limit pause
-        if request_count > 0 and request_count % rate_limit_threshold == 0:
-            pause_time = random.uniform(90, 150)
-            logger.info(f"🛑 Rate limit threshold reached ({request_count} requests). Pausing for {pause_time:.2f} seconds...")
-            time.sleep(pause_time)
-            
-        logger.info(f"Processing batch {i//batch_size + 1} ({len(batch)} jobs)...")
-        
-        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+    emit_lock = threading.Lock()
+    sink = on_record or job_attributes.append
+
+    def emit(record):
+        with emit_lock:
+            sink(record)
+
+    url_queue = job_urls if isinstance(job_urls, queue.Queue) else _url_queue_from_list(job_urls)
+    stop_event = stop_event or threading.Event()
+    parse_workers = parse_workers or os.cpu_count() or 1
+    limiter = limiter or get_default_limiter()
+    fetch_threads = controller.maximum if controller else max_workers
+
+    # Downloaded pages waiting for a parse worker
+    html_queue = queue.Queue(maxsize=parse_workers * 2)
+    parse_thread = threading.Thread(target=_parse_stage, args=(html_queue, parse_workers, emit, parser, cache), daemon=True)
+    parse_thread.start()
+    logger.debug(f"Detail pipeline: {fetch_threads} fetch threads -> {parse_workers} parse processes")
+    if isinstance(job_urls, queue.Queue):
+        logger.info("Processing jobs as search pages arrive...")
+    else:
+        logger.info(f"Processing {len(job_urls)} jobs...")
+
+    try:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=fetch_threads) as executor:
             futures = [
-                executor.submit(fetch_job_detail, session, url, credentials_provided)
-                for url in batch
+                executor.submit(_fetch_stage, session, url_queue, html_queue, emit, limiter, controller, cache, stop_event)
+                for _ in range(fetch_threads)
             ]
             for future in concurrent.futures.as_completed(futures):
-                result = future.result()
-                if result:
-                    job_attributes.append(result)
-        
-        request_count += len(batch)
-        # Larger pause between batches
-        time.sleep(random.uniform(5, 10))
+                future.result()
+    finally:
+        # Let the parse stage drain what was fetched, then stop it
+        html_queue.put(None)
+        parse_thread.join()
 
     return job_attributes
 
+async def browser_worker_async(client, job_urls, parse_workers=None, parser=DEFAULT_PARSER_BACKEND, cache=None, on_record=None, stop_event=None):
+    """
+    Fetch job details as coroutines on the shared AsyncUpworkClient and parse them on a
+    ProcessPoolExecutor. A fixed set of worker coroutines drains the URLs, which bounds the
+    fetched-but-unparsed pages so memory stays flat when parsing falls behind the network.
+    Jobs with a fresh entry in `cache` are not fetched.
+
+    `job_urls` is a list or an asyncio.Queue filled by a search producer and closed with None;
+    records go to `on_record` as they complete (or are collected and returned without it), and
+    setting `stop_event` stops further fetches.
+    """
+    job_attributes = []
+    emit = on_record or job_attributes.append
+    stop_event = stop_event or threading.Event()
+    if isinstance(job_urls, asyncio.Queue):
+        url_queue = job_urls
+    else:
+        url_queue = asyncio.Queue()
+        for url in job_urls:
+            url_queue.put_nowait(url)
+        url_queue.put_nowait(None)
+    parse_workers = parse_workers or os.cpu_count() or 1
+    loop = asyncio.get_running_loop()
+
+    try:
+        # spawn instead of fork: the event loop and its helper threads are already running
+        pool = concurrent.futures.ProcessPoolExecutor(max_workers=parse_workers, mp_context=multiprocessing.get_context('spawn'))
+    except (OSError, NotImplementedError) as e:
+        logger.warning(f"⚠️ Parse process pool unavailable ({e}). Parsing in-thread instead.")
+        pool = None
+    # None runs parse_job_detail on the loop's default thread pool
+    executor = pool
+
+    async def fetch_and_parse(url):
+        nonlocal executor
+        html = await client.get_text(url)
+        if html is None:
+            return
+        try:
+            result = await loop.run_in_executor(executor, parse_job_detail, url, html, parser)
+        except concurrent.futures.BrokenExecutor as e:
+            if executor is not None:
+                logger.warning(f"⚠️ Parse process pool broke ({e}). Parsing in-thread instead.")
+                executor = None
+            try:
+                result = await loop.run_in_executor(None, parse_job_detail, url, html, parser)
+            except Exception as e:
+                logger.debug(f"[parse] Failed to process {url}: {e}")
+                return
+        except Exception as e:
+            logger.debug(f"[parse] Failed to process {url}: {e}")
+            return
+        if result:
+            _store_parsed(cache, url, html, result)
+            emit(result)
+
+    async def worker():
+        while True:
+            url = await url_queue.get()
+            if url is None:
+                # Leave the sentinel for the other workers
+                url_queue.put_nowait(None)
+                return
+            if stop_event.is_set() or _serve_cached(url, cache, emit):
+                continue
+            await fetch_and_parse(url)
+
+    workers = client.concurrency + parse_workers * 2
+    logger.debug(f"Async detail pipeline: {client.concurrency} concurrent requests -> {parse_workers} parse processes")
+    try:
+        await asyncio.gather(*(worker() for _ in range(workers)))
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    return job_attributes
+
+def _days_posted_cutoff(search_params):
+    """UTC cutoff for the days_posted search param, or None if it is absent or invalid."""
+    if 'days_posted' not in search_params:
+        return None
+    cutoff_time = days_posted_cutoff(search_params['days_posted'])
+    if cutoff_time is not None:
+        logger.info(f"📅 Filtering jobs posted before {cutoff_time} (Last {search_params['days_posted']} days)")
+    return cutoff_time
+
+def _posted_after(job, cutoff_time):
+    """days_posted check for one JobRecord; jobs without a usable ts_create are kept."""
+    ts_create = job.ts_create
+    return ts_create is None or ts_create >= cutoff_time
+
+class _JobStream:
+    """
+    Receives finished records from the detail workers one at a time. Applies the days_posted
+    cutoff, the filtering thresholds, the keyword filter, the incremental watermark and the
+    result limit, forwards accepted records to the output sink, and sets `stop_event` once the
+    limit is reached so no further pages are fetched. Every processed job is logged to the run
+    checkpoint and collected in `processed_urls` for the watermark. Records are turned into typed
+    JobRecords on arrival. Without `keep_records` accepted records only go to the sink, so memory
+    does not grow with the run.
+    """
+
+    def __init__(self, cutoff_time, watermark, max_records, sink, stop_event, keyword_filter=None, checkpoint=None,
+                 keep_records=True, result_filter=None):
+        self.cutoff_time = cutoff_time
+        self.watermark = watermark
+        self.max_records = max_records
+        self.sink = sink
+        self.stop_event = stop_event
+        self.keyword_filter = keyword_filter
+        self.checkpoint = checkpoint
+        self.keep_records = keep_records
+        self.result_filter = result_filter
+        self.records = []
+        self.count = 0
+        # Newest accepted record, for the watermark when records are not kept
+        self.newest = None
+        # URLs of every job this stream decided on (accepted or rejected), for the watermark
+        self.processed_urls = []
+        self.old_jobs = 0
+        self.seen_jobs = 0
+        self.unqualified_jobs = 0
+        # Jobs dropped per filtering threshold, e.g. {'min_client_spent': 3}
+        self.below_threshold = {}
+        self._lock = threading.Lock()
+
+    def _accept(self, record):
+        if self.cutoff_time is not None and not _posted_after(record, self.cutoff_time):
+            self.old_jobs += 1
+            return False
+        if self.result_filter is not None:
+            reason = self.result_filter.check(record)
+            if reason is not None:
+                self.below_threshold[reason] = self.below_threshold.get(reason, 0) + 1
+                return False
+        if self.keyword_filter is not None and not self.keyword_filter.accept_record(record):
+            self.unqualified_jobs += 1
+            return False
+        if self.watermark is not None and not self.watermark.is_newer(record):
+            self.seen_jobs += 1
+            return False
+        return True
+
+    def __call__(self, record):
+        record = JobRecord.from_dict(record)
+        with self._lock:
+            if self.max_records is not None and self.count >= self.max_records:
+                return
+            accepted = self._accept(record)
+            if accepted:
+                self.count += 1
+                if self.keep_records:
+                    self.records.append(record)
+                if self.watermark is not None:
+                    published = published_at(record)
+                    if published is not None and (self.newest is None or published > published_at(self.newest)):
+                        self.newest = record
+                if self.sink is not None:
+                    self.sink.write(record)
+            if self.watermark is not None and record.get('url'):
+                self.processed_urls.append(record.get('url'))
+            if self.checkpoint is not None:
+                self.checkpoint.record(record.get('job_id'), accepted)
+            if accepted and self.max_records is not None and self.count >= self.max_records:
+                logger.info(f"🎯 Reached {self.max_records} jobs. Stopping further fetches.")
+                self.stop_event.set()
+
+def _tile_prefilters(cutoff_time, keyword_filter=None, tile_only=False, checkpoint=None):
+    """
+    Checks run on every search tile before a detail request is spent on it. Each takes a tile
+    and returns the reason to drop it, or None to keep it.
+    """
+    prefilters = []
+    if checkpoint is not None and checkpoint.resuming:
+        prefilters.append(lambda tile: 'checkpoint' if checkpoint.is_processed(tile.get('job_id')) else None)
+    if cutoff_time is not None:
+        prefilters.append(lambda tile: None if posted_within(tile, cutoff_time) else 'days_posted')
+    if keyword_filter is not None:
+        prefilters.append(lambda tile: keyword_filter.check_tile(tile, final=tile_only))
+    return prefilters
+
+class _TileFeeder:
+    """
+    on_tiles callback for the search producers. Every new tile is recorded in `produced`, run
+    through the pre-filters, and then either handed to `put` as a URL for the detail stage or,
+    in tile-only mode (`emit` set), emitted straight to the job stream as a partial record.
+    """
+
+    def __init__(self, put, produced, prefilters=(), emit=None):
+        self.put = put
+        self.produced = produced
+        self.prefilters = list(prefilters)
+        self.emit = emit
+        self.dropped = {}
+        self._seen = set()
+        self._lock = threading.Lock()
+
+    def _drop_reason(self, tile):
+        for prefilter in self.prefilters:
+            reason = prefilter(tile)
+            if reason:
+                return reason
+        return None
+
+    def __call__(self, tiles):
+        with self._lock:
+            for tile in tiles:
+                url = tile['url']
+                if url in self._seen:
+                    continue
+                self._seen.add(url)
+                self.produced.append(url)
+                reason = self._drop_reason(tile)
+                if reason:
+                    self.dropped[reason] = self.dropped.get(reason, 0) + 1
+                elif self.emit is not None:
+                    self.emit(tile_record(tile))
+                else:
+                    self.put(url)
+
+def _drain_until_done(producer, url_queue):
+    """Wait for the search producer thread, discarding URLs so it never blocks on a full queue."""
+    while producer.is_alive():
+        try:
+            url_queue.get(timeout=0.1)
+        except queue.Empty:
+            pass
+    producer.join()
+
+def _run_search_producer(search, url_queue, errors):
+    """
+    Thread target for the streaming requests pipeline: run the search (which feeds `url_queue`
+    through its on_tiles callback), then close the queue with the None sentinel. Errors,
+    such as a failed first search page, are kept for the caller to re-raise.
+    """
+    try:
+        search()
+    except BaseException as e:
+        errors.append(e)
+    finally:
+        url_queue.put(None)
+
+def _resolve_output_fields(value):
+    """
+    general.output_fields (a list or a comma-separated string) as a tuple of known output
+    columns, or None for every column. Unknown names are dropped with a warning.
+    """
+    if not value:
+        return None
+    names = [name.strip() for name in (value.split(',') if isinstance(value, str) else value) if str(name).strip()]
+    unknown = [name for name in names if name not in OUTPUT_FIELDS]
+    if unknown:
+        logger.warning(f"⚠️ Ignoring unknown output fields: {', '.join(unknown)}")
+    fields = tuple(name for name in names if name in OUTPUT_FIELDS)
+    return fields or None
+
+def _close_browser_pool(browser_pool):
+    """Stop the pooled browser, if the run has one."""
+    if browser_pool is None:
+        return
+    logger.info(f"🌐 Browser pool stats: {browser_pool.stats()}")
+    browser_pool.close()
+
+def _save_session(session_store, username, session, browser_type):
+    """Persist the run's session for the next run; a failed write only costs the next run a login."""
+    if session_store is None or session is None:
+        return
+    try:
+        session_store.save(username, session, browser_type)
+    except OSError as e:
+        logger.warning(f"⚠️ Failed to save the login session: {e}")
+
 # Helper to normalize browser type string
 def normalize_browser_type(b_type: str) -> str:
     b_type = str(b_type).lower().strip()
@@ -588,6 +1182,7 @@ def normalize_browser_type(b_type: str) -> str:
 async def main(jsonInput: dict) -> list[dict]:
     """
     Main entry point for the Upwork Job Scraper. Orchestrates browser setup, login, job search, and extraction.
+    Returns the jobs as JSON-serialisable dicts (timestamps as ISO text), or [] with general.keep_records off.
     """
     logger.info("🏁 Starting Upwork Job Scraper...")
     start_time = time.time()
@@ -616,6 +1211,39 @@ async def main(jsonInput: dict) -> list[dict]:
     # New optimization params
     headless = general_params.get('headless', False)
     max_workers_count = general_params.get('max_workers', 5)
+    parse_workers_count = general_params.get('parse_workers', None)
+    parser_backend = resolve_parser_backend(general_params.get('parser', DEFAULT_PARSER_BACKEND))
+    logger.info(f"🧮 HTML parser backend: {parser_backend}")
+
+    # HTTP engine for search and detail pages: blocking requests threads or asyncio (httpx)
+    http_engine = str(general_params.get('http_engine', 'requests')).lower().strip()
+    concurrency = general_params.get('concurrency', 10)
+    if http_engine == 'async' and not async_engine_available():
+        logger.warning("⚠️ httpx is not installed. Falling back to the requests engine.")
+        http_engine = 'requests'
+    # Account pool (general.accounts): several logins from email_status.json share the requests engine
+    account_params = general_params.get('accounts') or {}
+    if account_params.get('enabled') and http_engine == 'async':
+        logger.warning("⚠️ The account pool runs on the requests engine. Ignoring http_engine=async.")
+        http_engine = 'requests'
+    logger.info(f"🌍 HTTP engine: {http_engine}")
+    search_workers_count = general_params.get('search_workers', SEARCH_PAGE_WORKERS)
+
+    # Output columns (general.output_fields); when the search tiles carry all of them, no detail page is fetched
+    output_fields = _resolve_output_fields(general_params.get('output_fields'))
+    tile_only = tiles_cover(output_fields)
+    if tile_only:
+        logger.info(f"🧾 Output fields {', '.join(output_fields)} are all on the search tiles. Skipping detail fetches.")
+
+    # Shared request budgets for every fetch path (see rate_limiter.DEFAULT_RATE_BUDGETS)
+    rate_limiter = RateLimiter(general_params.get('rate_limits'))
+
+    # AIMD concurrency window for detail/search fetches, starting from the configured worker count
+    controller = None
+    if general_params.get('adaptive_concurrency', True):
+        initial_window = max_workers_count if http_engine == 'requests' else concurrency
+        controller = AIMDController(initial=initial_window, maximum=general_params.get('max_concurrency') or initial_window * 4)
+        logger.info(f"🎛️ Adaptive concurrency: window {controller.limit}, max {controller.maximum}")
     
     # Determine Browser Type
     browser_type_input = general_params.get('browser_type', jsonInput.get('browser_type', 'camoufox'))
@@ -636,14 +1264,53 @@ async def main(jsonInput: dict) -> list[dict]:
 
     search_queries = [search_params.get('query', search_params.get('search_any', 'search'))]
     search_urls = [search_url]
+
+    # Incremental mode: only jobs not seen by earlier runs of this search (general.incremental or search.incremental)
+    watermark = None
+    if general_params.get('incremental', search_params.get('incremental', False)):
+        watermark = SearchWatermark(search_url)
     
     # proxy
     proxy_details = jsonInput.get('proxy_details', None)
     logger.debug(f"proxy_details: {proxy_details}")
 
     session = None
+    async_client = None
+
+    # Saved session of an earlier run (general.session_store); if it passes one search page request the browser is skipped
+    session_store = open_session_store(general_params.get('session_store'))
+    proxy_url = camoufox_utils._build_proxy_url_from_details(proxy_details)
+    proxies = {'http': proxy_url, 'https': proxy_url} if proxy_url else None
+
+    # One warmed Camoufox browser for every login of the run, refreshes included (general.browser_pool)
+    browser_pool = open_browser_pool(general_params.get('browser_pool'), headless, proxy_details) if browser_type == 'camoufox' else None
+
+    session_pool = None
+    if account_params.get('enabled'):
+        if browser_type != 'camoufox' or not password:
+            logger.warning("⚠️ The account pool needs the camoufox browser and a password. Using the single account.")
+        else:
+            account_pool = AccountPool(account_params.get('path') or ACCOUNT_STATUS_PATH, account_params.get('cooldown_minutes', DEFAULT_COOLDOWN_MINUTES))
+            account_password = account_params.get('password') or password
+            login = lambda email: camoufox_utils.camoufox_login_flow(email, account_password, login_url, search_url, True, proxy_details,
+                                                                   headless=headless, browser_pool=browser_pool)
+            session_pool = await lease_sessions(account_pool, int(account_params.get('max_accounts', 3)), login, general_params.get('rate_limits'),
+                                                session_store=session_store, check_url=search_url, proxies=proxies)
+            if session_pool is None:
+                logger.error("❌ No account in the pool could log in. Exiting.")
+                _close_browser_pool(browser_pool)
+                return []
+            session = session_pool
+            # Each account paces itself with the configured budgets; the shared limiter caps their sum
+            rate_limiter = rate_limiter.scaled(len(session_pool.leases))
+
+    if session_pool is None:
+        session = restore_session(session_store, username, search_url, bool(credentials_provided), proxies=proxies)
     
-    if browser_type == 'selenium':
+    if session is not None:
+        # Search runs below over the restored session, streaming its URLs into the detail workers
+        job_urls = None
+    elif browser_type == 'selenium':
         # --- SELENIUM FLOW ---
         # Initialize Selenium driver for Login
         logger.info("🌐 Initializing Selenium driver for Login...") 
@@ -663,18 +1330,23 @@ async def main(jsonInput: dict) -> list[dict]:
             # --- Selenium for Search (Reliable) ---
             logger.info("💼 Getting Related Jobs (Selenium)...")
             # We need to make sure get_job_urls_selenium is available (it is in the file as I restored it earlier)
-            job_urls_dict = get_job_urls_selenium(driver, search_queries, search_urls, limit=limit)
+            search_tiles = []
+            job_urls_dict = get_job_urls_selenium(driver, search_queries, search_urls, limit=limit, parser=parser_backend, limiter=rate_limiter, watermark=watermark, on_tiles=search_tiles.extend)
             job_urls = list(job_urls_dict.values())[0] if job_urls_dict else []
             logger.debug(f"Got {len(job_urls)} job URLs.")
             
             if not job_urls:
-                logger.warning("No jobs URLs found. Exiting.")
+                if watermark is not None:
+                    logger.info("🔖 No new jobs since the last run.")
+                else:
+                    logger.warning("No jobs URLs found. Exiting.")
                 driver.quit()
                 return []
 
             # --- Convert to Requests for Details (Fast) ---
             logger.info("✅ Converting cookies to requests session for detailed scraping...")
             session = uchrome_utils.selenium_cookies_to_requests(driver)
+            _save_session(session_store, username, session, browser_type)
             
         except Exception as e:
             logger.error(f"Critical error during Selenium scraping logic: {e}")
@@ -690,100 +1362,214 @@ async def main(jsonInput: dict) -> list[dict]:
     elif browser_type == 'camoufox':
         # --- CAMOUFOX FLOW ---
         try:
-            # Login and get session (Browser closes automatically after this)
+            # Login and get session (on a pooled browser context, or a browser that closes after this)
             session = await camoufox_utils.camoufox_login_flow(
-                username, password, login_url, search_url, credentials_provided, proxy_details, headless=headless
+                username, password, login_url, search_url, credentials_provided, proxy_details, headless=headless, browser_pool=browser_pool
             )
             logger.info("✅ Login successful (Camoufox). Got requests session.")
+            _save_session(session_store, username, session, browser_type)
             
             # Debug: Check what the session sees immediately
             try:
                 logger.debug("🔍 Fetching search page to debug session state...")
                 debug_r = session.get(search_url, timeout=30)
-                soup = BeautifulSoup(debug_r.text, 'html.parser')
+                soup = BeautifulSoup(debug_r.text, parser_backend)
                 body_text = soup.body.get_text(separator=' ', strip=True) if soup.body else "No body tag found"
                 logger.debug(f"DEBUG BODY TEXT (Status {debug_r.status_code}):\n{body_text[:500]}")
             except Exception as e:
                 logger.error(f"Failed to fetch debug body: {e}")
             
-            # --- Requests for Search (Fast, matching old script) ---
-            logger.info("💼 Getting Related Jobs (Requests)...")
-            job_urls_dict = get_job_urls_requests(session, search_queries, search_urls, limit=limit)
-            job_urls = list(job_urls_dict.values())[0] if job_urls_dict else []
-            logger.debug(f"Got {len(job_urls)} job URLs.")
-             
+            # Search runs below, streaming its URLs straight into the detail workers
+            job_urls = None
+
         except Exception as e:
             logger.error(f"Critical error during Camoufox logic: {e}")
+            _close_browser_pool(browser_pool)
             return []
 
     # --- Requests-based Job Detail Scraping (Shared) ---
     if not session:
          logger.error("❌ No valid session established. Exiting.")
+         _close_browser_pool(browser_pool)
          return []
 
-    try: 
-        logger.info(f"🏢 Getting Job Attributes for {len(job_urls)} jobs with Requests (ThreadPool)...")
-        job_attributes = browser_worker_requests(session, job_urls, credentials_provided, max_workers=max_workers_count)
+    # On-disk cache of job detail pages (general.cache); fresh hits skip fetch and parse
+    job_cache = open_job_cache(general_params.get('cache')) if not tile_only else None
+
+    # --- Streaming pipeline: search pages -> tile pre-filters -> detail workers -> output sink ---
+    # Records are filtered and written as they complete; an incremental run emits its whole delta
+    stop_event = threading.Event()
+    # Processed job ids of this search (general.checkpoint); an interrupted run resumes from them
+    checkpoint = open_run_checkpoint(general_params.get('checkpoint'), search_url) if save_csv else None
+    # general.output_format: csv (default), jsonl, parquet (typed columns), sqlite (cross-run job store), or several
+    output_sink = open_job_sink(general_params.get('output_format', 'csv'), fields=output_fields or OUTPUT_FIELDS,
+                                parquet_params=general_params.get('parquet'), store_params=general_params.get('job_store'),
+                                resume_paths=checkpoint.outputs if checkpoint is not None else None) if save_csv else None
+    if checkpoint is not None:
+        checkpoint.start(output_sink.paths)
+    max_records = None if watermark is not None else limit - buffer
+    if max_records is not None and checkpoint is not None and checkpoint.resuming:
+        max_records = max(0, max_records - checkpoint.written)
+        if not max_records:
+            logger.info("⏯️ The interrupted run had already reached the limit.")
+            stop_event.set()
+    cutoff_time = _days_posted_cutoff(search_params)
+    # Re-login in the background when the session goes bad mid-run (general.session_refresh)
+    session_refresher = None
+    refresh_params = general_params.get('session_refresh') or {}
+    if refresh_params.get('enabled', True) and session is not None and session_pool is None and job_urls is None and browser_type == 'camoufox':
+        login = lambda: camoufox_utils.camoufox_login_flow(username, password, login_url, search_url, credentials_provided, proxy_details,
+                                                           headless=headless, browser_pool=browser_pool)
+        session_refresher = RefreshingSession(session, login, logged_in=bool(credentials_provided),
+                                              max_refreshes=int(refresh_params.get('max_refreshes', DEFAULT_MAX_REFRESHES)))
+        session = session_refresher
+
+    # filtering.qualify_keywords / disqualify_keywords; tile-only runs take the final decision on the tile
+    keyword_filter = KeywordFilter.from_search_params(search_params)
+    # filtering.min_client_spent / min_client_rating / ... (see result_filter.FILTER_PREDICATES)
+    result_filter = ResultFilter.from_search_params(search_params)
+    job_stream = _JobStream(cutoff_time, watermark, max_records, output_sink, stop_event,
+                            keyword_filter=keyword_filter if not tile_only else None, checkpoint=checkpoint,
+                            keep_records=general_params.get('keep_records', True), result_filter=result_filter)
+    logger.debug(f"limit: {limit-buffer}")
+    produced_urls = []
+    # Tiles either become detail requests or, in tile-only mode, records of their own
+    feeder = _TileFeeder(None, produced_urls, _tile_prefilters(cutoff_time, keyword_filter, tile_only, checkpoint), emit=job_stream if tile_only else None)
+
+    try:
+        if http_engine == 'async':
+            async_client = AsyncUpworkClient(session, concurrency=concurrency, limiter=rate_limiter, controller=controller,
+                                             refresher=session_refresher)
+        if job_urls is not None:
+            # Selenium flow: the search already ran, so its tiles go through the pre-filters here
+            job_urls = []
+            feeder.put = job_urls.append
+            feeder(search_tiles)
+
+        if tile_only:
+            if job_urls is None:
+                logger.info("💼 Getting Related Jobs, taking the records from the search tiles...")
+                if http_engine == 'async':
+                    await get_job_urls_async(async_client, search_queries, search_urls, limit=limit, parser=parser_backend, watermark=watermark, on_tiles=feeder, stop_event=stop_event)
+                else:
+                    get_job_urls_requests(session, search_queries, search_urls, limit=limit, parser=parser_backend, limiter=rate_limiter, watermark=watermark, page_workers=search_workers_count, on_tiles=feeder, stop_event=stop_event)
+        elif http_engine == 'async':
+            if job_urls is None:
+                logger.info("💼 Getting Related Jobs (Async), streaming them into detail fetches...")
+                url_queue = asyncio.Queue()
+                feeder.put = url_queue.put_nowait
+
+                async def produce():
+                    try:
+                        await get_job_urls_async(async_client, search_queries, search_urls, limit=limit, parser=parser_backend, watermark=watermark, on_tiles=feeder, stop_event=stop_event)
+                    finally:
+                        url_queue.put_nowait(None)
+                producer = asyncio.ensure_future(produce())
+            else:
+                url_queue, producer = job_urls, None
+            logger.info(f"🏢 Getting Job Attributes with async HTTP (concurrency {async_client.concurrency}, ProcessPool parse)...")
+            try:
+                await browser_worker_async(async_client, url_queue, parse_workers=parse_workers_count, parser=parser_backend, cache=job_cache, on_record=job_stream, stop_event=stop_event)
+            finally:
+                if producer is not None:
+                    stop_event.set()
+                    # Re-raises a search failure (e.g. an invalid session)
+                    await producer
+        else:
+            search_errors = []
+            producer = None
+            if job_urls is None:
+                logger.info("💼 Getting Related Jobs (Requests), streaming them into detail fetches...")
+                url_queue = queue.Queue(maxsize=URL_QUEUE_SIZE)
+                feeder.put = url_queue.put
+                search = lambda: get_job_urls_requests(session, search_queries, search_urls, limit=limit, parser=parser_backend, limiter=rate_limiter, watermark=watermark, page_workers=search_workers_count, on_tiles=feeder, stop_event=stop_event)
+                producer = threading.Thread(target=_run_search_producer, args=(search, url_queue, search_errors), daemon=True)
+                producer.start()
+            else:
+                url_queue = job_urls
+            logger.info("🏢 Getting Job Attributes with Requests (ThreadPool fetch, ProcessPool parse)...")
+            try:
+                browser_worker_requests(session, url_queue, credentials_provided, max_workers=max_workers_count, parse_workers=parse_workers_count, parser=parser_backend, limiter=rate_limiter, controller=controller, cache=job_cache, on_record=job_stream, stop_event=stop_event)
+            finally:
+                stop_event.set()
+                if producer is not None:
+                    _drain_until_done(producer, url_queue)
+            if search_errors:
+                raise search_errors[0]
+        logger.debug(f"Got {len(produced_urls)} job URLs.")
 
     except Exception as e:
-        logger.error(f"Critical error during detail scraping: {e}")
+        logger.error(f"Critical error during scraping: {e}")
         return []
+    finally:
+        if session_refresher is not None and session_refresher.refreshes:
+            logger.info(f"🔄 Session refresh stats: {session_refresher.stats()}")
+        _close_browser_pool(browser_pool)
+        if session_pool is not None:
+            logger.info(f"👥 Account pool stats: {session_pool.stats()}")
+            session_pool.close()
+        if async_client is not None:
+            await async_client.aclose()
+        if output_sink is not None:
+            output_sink.close()
+        if checkpoint is not None:
+            checkpoint.close()
+        if controller is not None:
+            logger.info(f"🎛️ Adaptive concurrency stats: {controller.stats()}")
+        if job_cache is not None:
+            logger.info(f"🗄️ Job cache: {job_cache.stats()}")
+            job_cache.close()
 
-    # Filter out jobs where Nuxt data was missing (i.e., job is None)
-    logger.debug(f"job_attributes after filter: {len(job_attributes)}")
-    # Trim to the original limit
-    logger.debug(f"limit: {limit-buffer}")
-    # Filter by days_posted (Client-side enforcement)
-    if 'days_posted' in search_params:
+    # Keep cookies the server refreshed during the run
+    if session_pool is None:
+        _save_session(session_store, username, session, browser_type)
+
+    # The run finished: nothing left to resume
+    if checkpoint is not None:
+        if checkpoint.resuming:
+            logger.info(f"⏯️ Resumed run complete: {checkpoint.written} jobs from the interrupted run, {job_stream.count} from this one.")
+        checkpoint.discard()
+
+    # Typed records stop here: callers get plain JSON-serialisable dicts
+    job_attributes = [{key: json_value(value) for key, value in job.items()} for job in job_stream.records]
+    if feeder.dropped:
+        logger.info(f"🪓 Pre-filtered {sum(feeder.dropped.values())} jobs from their search tiles: {feeder.dropped}")
+    if job_stream.old_jobs:
+        logger.info(f"📉 Filtered out {job_stream.old_jobs} old jobs. Remaining: {job_stream.count}")
+    if job_stream.below_threshold:
+        logger.info(f"📏 Filtered out {sum(job_stream.below_threshold.values())} jobs below the filtering thresholds: {job_stream.below_threshold}")
+    if keyword_filter is not None:
+        logger.info(f"🔎 Keyword filter decisions: {keyword_filter.summary()}")
+        if output_sink is not None:
+            decisions_path = f"{os.path.splitext(output_sink.path)[0]}_filter_decisions.jsonl"
+            try:
+                keyword_filter.save_decisions(decisions_path)
+                logger.info(f"💾 Saved keyword filter decisions to {decisions_path}")
+            except OSError as e:
+                logger.warning(f"⚠️ Failed to save keyword filter decisions: {e}")
+
+    if watermark is not None:
+        if job_stream.seen_jobs:
+            logger.info(f"🔖 Dropped {job_stream.seen_jobs} jobs published before the watermark.")
+        # Only jobs that reached a decision count as seen; failed fetches and dropped tiles are retried next run
+        watermark.advance(job_stream.processed_urls, [job_stream.newest] if job_stream.newest is not None else [])
         try:
-             days = int(search_params['days_posted'])
-             cutoff_time = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(days=days)
-             logger.info(f"📅 Filtering jobs posted before {cutoff_time} (Last {days} days)")
-             
-             filtered_attributes = []
-             for job in job_attributes:
-                 ts_create_str = job.get('ts_create')
-                 if ts_create_str:
-                     try:
-                         # Handle typical ISO format from Upwork: 2026-01-11T17:44:16.509Z
-                         # Ensure it's treated as UTC
-                         ts_create = datetime.datetime.fromisoformat(ts_create_str.replace('Z', '+00:00'))
-                         if ts_create >= cutoff_time:
-                             filtered_attributes.append(job)
-                         else:
-                             # Debug log for discarded jobs?
-                             pass
-                     except ValueError:
-                         logger.warning(f"Failed to parse timestamp {ts_create_str}, keeping job.")
-                         filtered_attributes.append(job)
-                 else:
-                     # Keep if no timestamp
-                     filtered_attributes.append(job)
-             
-             logger.info(f"📉 Filtered out {len(job_attributes) - len(filtered_attributes)} old jobs. Remaining: {len(filtered_attributes)}")
-             job_attributes = filtered_attributes
-
-        except ValueError:
-            logger.warning(f"Invalid days_posted value: {search_params['days_posted']}")
-
-    job_attributes = job_attributes[:limit-buffer]
-    
-    if save_csv:
-        # Ensure data directory is in execution/ folder, not project root
-        execution_dir = os.path.dirname(os.path.abspath(__file__))
-        data_dir = os.path.join(execution_dir, 'data', 'outputs', 'jobs', 'csv')
-        os.makedirs(data_dir, exist_ok=True)
-        csv_path = os.path.join(data_dir, f'job_results_{datetime.datetime.now().strftime("%Y%m%d_%H%M%S")}.csv')
-        df = pd.DataFrame(job_attributes)
-        df.to_csv(csv_path, index=False)
-        
+            watermark.save()
+        except OSError as e:
+            logger.warning(f"⚠️ Failed to save search watermark: {e}")
+        logger.info(f"🔖 {job_stream.count} new jobs since the last run.")
+
+    if output_sink is not None:
+        logger.info(f"💾 Saved {output_sink.count} jobs to {', '.join(output_sink.paths)}")
+
     end_time = time.time()
     elapsed = end_time - start_time
     logger.info("🏁 Job Fetch Complete!")
-    logger.info(f"🎯 Number of results: {len(job_attributes)}")
-    # Log number of unique columns across all job records
-    num_columns = len(set().union(*(job.keys() for job in job_attributes))) if job_attributes else 0
-    logger.info(f"🧩 Number of columns: {num_columns}")
+    logger.info(f"🎯 Number of results: {job_stream.count}")
+    if job_stream.keep_records:
+        # Every record has every column, so count the ones that hold a value in at least one job
+        num_columns = len({key for job in job_attributes for key, value in job.items() if value not in (None, '', [])})
+        logger.info(f"🧩 Number of filled columns: {num_columns}")
     minutes = int(elapsed // 60)
     seconds = int(elapsed % 60)
     logger.info(f"🕒 Total run time: {minutes}m {seconds}s ({elapsed:.2f} seconds)")
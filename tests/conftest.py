@@ -0,0 +1,18 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+FIXTURE_DIR = Path(__file__).resolve().parent / 'fixtures'
+JOB_PAGES = sorted((FIXTURE_DIR / 'job_pages').glob('*.html'))
+
+# Tests import the scraper modules as the `execution` package
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+
+@pytest.fixture(params=JOB_PAGES, ids=lambda path: path.stem)
+def job_page(request) -> str:
+    """HTML of one anonymised job detail page from tests/fixtures/job_pages."""
+    return request.param.read_text(encoding='utf-8')
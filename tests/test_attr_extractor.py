@@ -0,0 +1,48 @@
+from pathlib import Path
+
+import pytest
+from bs4.builder import builder_registry
+
+from execution.attr_extractor import JobAttrExtractor, extract_job_attributes
+
+JOB_PAGE_DIR = Path(__file__).resolve().parent / 'fixtures' / 'job_pages'
+
+
+@pytest.mark.skipif(builder_registry.lookup('lxml') is None, reason="lxml is not installed")
+def test_lxml_matches_html_parser(job_page):
+    assert extract_job_attributes(job_page, 'lxml') == extract_job_attributes(job_page, 'html.parser')
+
+
+def test_extracts_core_fields(job_page):
+    data = extract_job_attributes(job_page, 'html.parser')
+    assert data['title']
+    assert data['description']
+    assert data['type'] in ('Hourly', 'Fixed')
+    assert data['skills']
+
+
+def test_payload_fast_path_matches_full_extraction(job_page):
+    fast = JobAttrExtractor('html.parser').extract_from_html(job_page)
+    full = JobAttrExtractor('html.parser', payload_fast_path=False).extract_from_html(job_page)
+    assert fast == full
+
+
+@pytest.mark.parametrize('name', ['hourly_payload', 'fixed_payload'])
+def test_payload_pages_skip_the_dom(name, monkeypatch):
+    html = (JOB_PAGE_DIR / f'{name}.html').read_text(encoding='utf-8')
+
+    def fail(*args, **kwargs):
+        raise AssertionError("DOM pass ran on a complete payload page")
+
+    monkeypatch.setattr(JobAttrExtractor, '_extract_from_dom', fail)
+    assert JobAttrExtractor('html.parser').extract_from_html(html)['title']
+
+
+def test_dom_only_fields_survive_the_fast_path():
+    html = (JOB_PAGE_DIR / 'dom_only_fields.html').read_text(encoding='utf-8')
+    data = JobAttrExtractor('html.parser').extract_from_html(html)
+    assert data['questions'] == ['Describe your recent experience with similar projects', 'Include a link to your portfolio']
+    assert data['qualifications'] == ['Working Zapier workflow', 'Short handover document']
+    assert data['buyer_hire_rate_pct'] == '40'
+    assert data['buyer_avgHourlyJobsRate_amount'] == '23.45'
+    assert data['phone_verified'] is True
@@ -0,0 +1,83 @@
+import asyncio
+
+from execution.concurrency_controller import AIMDController, is_cloudflare_challenge
+
+
+def warm_up(controller, latency=1.0, samples=5):
+    for _ in range(samples):
+        controller.record(controller.epoch, 200, latency)
+
+
+def test_successes_grow_the_window_additively():
+    controller = AIMDController(initial=2, maximum=10)
+    for _ in range(4):
+        controller.record(controller.epoch, 200, 1.0)
+    assert controller.limit == 3
+
+
+def test_throttling_halves_the_window_once_per_epoch():
+    controller = AIMDController(initial=8)
+    epoch = controller.epoch
+    assert controller.record(epoch, 429, 1.0) == 'throttled'
+    assert controller.limit == 4
+    # A response to a request from before the cut does not cut again
+    controller.record(epoch, 403, 1.0)
+    assert controller.limit == 4
+    assert controller.record(controller.epoch, 200, 1.0, text='<title>Just a moment...</title>') == 'throttled'
+    assert controller.limit == 2
+
+
+def test_errors_leave_the_window_alone():
+    controller = AIMDController(initial=4)
+    assert controller.record(controller.epoch, None, 1.0) == 'error'
+    assert controller.record(controller.epoch, 500, 1.0) == 'error'
+    assert controller.limit == 4
+
+
+def test_baseline_follows_a_sustained_latency_rise():
+    controller = AIMDController(initial=8, minimum=1)
+    warm_up(controller, latency=1.0)
+    outcomes = [controller.record(controller.epoch, 200, 10.0) for _ in range(20)]
+    assert outcomes[0] == 'slow'
+    # Once the baseline has caught up, the new latency counts as normal and the window grows again
+    assert outcomes[-1] == 'ok'
+    assert controller.latency_baseline > 10.0 / controller.latency_factor
+    window = controller.limit
+    for _ in range(window * 2):
+        controller.record(controller.epoch, 200, 10.0)
+    assert controller.limit > window
+
+
+def test_widening_the_window_wakes_waiting_coroutines():
+    controller = AIMDController(initial=1, maximum=2)
+
+    async def scenario():
+        held = asyncio.Event()
+        release = asyncio.Event()
+
+        async def holder():
+            async with controller.slot_async():
+                held.set()
+                await release.wait()
+
+        async def waiter():
+            async with controller.slot_async():
+                return controller.in_flight
+
+        holding = asyncio.create_task(holder())
+        await held.wait()
+        waiting = asyncio.create_task(waiter())
+        await asyncio.sleep(0)
+        # A success recorded from a worker thread grows the window from 1 to 2 while the first slot is still held
+        await asyncio.to_thread(controller.record, controller.epoch, 200, 1.0)
+        in_flight = await asyncio.wait_for(waiting, timeout=2)
+        release.set()
+        await holding
+        return in_flight
+
+    assert asyncio.run(scenario()) == 2
+
+def test_cloudflare_markers():
+    assert is_cloudflare_challenge('<html><title>Just a moment...</title>')
+    assert not is_cloudflare_challenge('<html><title>Job</title>')
+    assert not is_cloudflare_challenge(None)
@@ -0,0 +1,73 @@
+import pytest
+
+from execution import job_cache
+from execution.job_cache import JobCache, job_id_from_url, open_job_cache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_700_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(job_cache.time, 'time', fake)
+    return fake
+
+
+@pytest.fixture
+def cache(tmp_path, clock):
+    with JobCache(str(tmp_path / 'cache.sqlite3'), ttl_hours=1, max_mb=1) as cache:
+        yield cache
+
+
+def test_job_id_from_url():
+    assert job_id_from_url('https://www.upwork.com/jobs/Python-scraper_~0123abc/?referrer=search') == '0123abc'
+    assert job_id_from_url('https://www.upwork.com/nx/search/jobs/') is None
+    assert job_id_from_url(None) is None
+
+
+def test_round_trip_and_counters(cache):
+    assert cache.get('0123') is None
+    cache.put('0123', 'https://www.upwork.com/jobs/~0123', '<html>job</html>', {'title': 'Scraper', 'skills': ['Python']})
+    assert cache.get('0123') == {'title': 'Scraper', 'skills': ['Python']}
+    assert cache.get_html('0123') == '<html>job</html>'
+    assert cache.stats()['hits'] == 1
+    assert cache.stats()['misses'] == 1
+    assert cache.stats()['writes'] == 1
+
+
+def test_entries_expire_after_the_ttl(cache, clock):
+    cache.put('0123', 'url', '<html></html>', {'title': 'Scraper'})
+    clock.now += 3599
+    assert cache.get('0123') is not None
+    clock.now += 2
+    assert cache.get('0123') is None
+    # Stale HTML stays readable until pruned
+    assert cache.get_html('0123') == '<html></html>'
+    assert cache.prune() == 1
+    assert cache.get_html('0123') is None
+
+
+def test_prune_evicts_least_recently_used_over_the_size_bound(cache, clock):
+    cache.max_bytes = 3000
+    for index in range(3):
+        cache.put(f'job{index}', 'url', None, {'description': 'x' * 1000})
+        clock.now += 1
+    # Reading job0 makes job1 the least recently used entry
+    cache.get('job0')
+    assert cache.prune() == 1
+    assert cache.get('job1') is None
+    assert cache.get('job0') is not None
+    assert cache.get('job2') is not None
+
+
+def test_open_job_cache_honours_enabled(tmp_path):
+    assert open_job_cache({'enabled': False}) is None
+    cache = open_job_cache({'path': str(tmp_path / 'cache.sqlite3'), 'ttl_hours': 2})
+    assert cache.ttl == 7200
+    cache.close()
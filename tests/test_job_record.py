@@ -0,0 +1,129 @@
+import csv
+import dataclasses
+import datetime
+import json
+from pathlib import Path
+
+import pytest
+
+from execution.attr_extractor import JobAttrExtractor
+from execution.job_record import (
+    OUTPUT_FIELDS, JobRecord, coerce_value, field_type, format_text, json_value, records_to_dataframe,
+)
+from execution.output_sinks import CsvJobSink, JsonlJobSink
+
+JOB_PAGE_DIR = Path(__file__).resolve().parent / 'fixtures' / 'job_pages'
+
+EXTRACTED = {
+    'job_id': '0123',
+    'url': 'https://www.upwork.com/jobs/~0123',
+    'title': 'Python scraper',
+    'type': 'Hourly',
+    'applicants': '12',
+    'client_total_spent': '19,000',
+    'hourly_min': '15',
+    'hourly_max': '45.5',
+    'payment_verified': 'true',
+    'phone_verified': '',
+    'ts_create': '2026-01-11T17:44:16.509Z',
+    'skills': ['Python', 'Scrapy'],
+    'questions': '',
+    'search_query': 'python',
+}
+
+
+def test_field_types():
+    assert field_type('applicants') == 'int'
+    assert field_type('client_total_spent') == 'float'
+    assert field_type('payment_verified') == 'bool'
+    assert field_type('ts_publish') == 'timestamp'
+    assert field_type('skills') == 'list'
+    assert field_type('title') == 'str'
+
+
+@pytest.mark.parametrize('value, kind, expected', [
+    ('1,234', 'int', 1234),
+    ('3.0', 'int', 3),
+    (True, 'int', 1),
+    ('$1,234.5', 'float', 1234.5),
+    ('nan', 'float', None),
+    ('Yes', 'bool', True),
+    ('0', 'bool', False),
+    ('maybe', 'bool', None),
+    ('2026-01-11T17:44:16Z', 'timestamp', datetime.datetime(2026, 1, 11, 17, 44, 16, tzinfo=datetime.timezone.utc)),
+    ('2026-01-11T17:44:16', 'timestamp', datetime.datetime(2026, 1, 11, 17, 44, 16, tzinfo=datetime.timezone.utc)),
+    ('not a date', 'timestamp', None),
+    ('Python', 'list', ['Python']),
+    (['Python', 'n8n'], 'str', 'Python, n8n'),
+    ('  ', 'str', None),
+    (None, 'int', None),
+])
+def test_coerce_value(value, kind, expected):
+    assert coerce_value(value, kind) == expected
+
+
+def test_from_dict_types_fields_and_keeps_extras():
+    record = JobRecord.from_dict(EXTRACTED)
+    assert record.applicants == 12
+    assert record.client_total_spent == 19000.0
+    assert record.hourly_max == 45.5
+    assert record.payment_verified is True
+    assert record.phone_verified is None
+    assert record.ts_create == datetime.datetime(2026, 1, 11, 17, 44, 16, 509000, tzinfo=datetime.timezone.utc)
+    assert record.skills == ['Python', 'Scrapy']
+    assert record.extras == {'search_query': 'python'}
+    assert JobRecord.from_dict(record) is record
+    assert not hasattr(record, '__dict__')
+
+
+def test_dict_interface():
+    record = JobRecord.from_dict(EXTRACTED)
+    assert record['title'] == 'Python scraper'
+    assert record['search_query'] == 'python'
+    assert record['questions'] is None
+    assert record.get('questions', 'n/a') == 'n/a'
+    assert 'title' in record and 'search_query' in record and 'other' not in record
+    assert list(record.keys()) == list(OUTPUT_FIELDS) + ['search_query']
+    with pytest.raises(KeyError):
+        record['other']
+
+
+def test_round_trip_through_dict_and_text():
+    record = JobRecord.from_dict(EXTRACTED)
+    assert JobRecord.from_dict(record.to_dict()) == record
+    # CSV text of every scalar field parses back to the same typed values
+    as_text = {key: format_text(value) for key, value in record.items() if field_type(key) != 'list'}
+    assert JobRecord.from_dict(as_text) == dataclasses.replace(record, skills=None)
+
+
+def test_format_text_matches_the_csv_forms():
+    assert format_text(None) == ''
+    assert format_text(19000.0) == '19000'
+    assert format_text(45.5) == '45.5'
+    assert format_text(12) == '12'
+    assert format_text(True) == 'True'
+    assert format_text(datetime.datetime(2026, 1, 11, 17, 44, 16, 509000, tzinfo=datetime.timezone.utc)) == '2026-01-11T17:44:16.509Z'
+    assert json_value(datetime.datetime(2026, 1, 11, tzinfo=datetime.timezone.utc)) == '2026-01-11T00:00:00.000Z'
+
+
+def test_records_to_dataframe_keeps_missing_values_missing():
+    pytest.importorskip('pandas')
+    frame = records_to_dataframe([EXTRACTED, {'job_id': '0456', 'applicants': '3'}])
+    assert list(frame.columns) == list(OUTPUT_FIELDS)
+    assert frame['applicants'].tolist() == [12, 3]
+    assert frame['client_total_spent'].isna().tolist() == [False, True]
+    assert frame['payment_verified'].isna().tolist() == [False, True]
+
+
+def test_dom_only_page_keeps_the_contract_date_in_every_text_sink(tmp_path):
+    html = (JOB_PAGE_DIR / 'fixed_no_payload.html').read_text(encoding='utf-8')
+    record = JobRecord.from_dict(JobAttrExtractor('html.parser').extract_from_html(html))
+    assert record.buyer_company_contractDate == 'Oct 26, 2022'
+    with CsvJobSink(str(tmp_path / 'jobs.csv')) as sink:
+        sink.write(record)
+    with JsonlJobSink(str(tmp_path / 'jobs.jsonl')) as sink:
+        sink.write(record)
+    with open(tmp_path / 'jobs.csv', newline='', encoding='utf-8') as f:
+        assert next(csv.DictReader(f))['buyer_company_contractDate'] == 'Oct 26, 2022'
+    with open(tmp_path / 'jobs.jsonl', encoding='utf-8') as f:
+        assert json.loads(f.readline())['buyer_company_contractDate'] == 'Oct 26, 2022'
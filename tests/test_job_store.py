@@ -0,0 +1,103 @@
+import pytest
+
+from execution.job_store import JobStore, JobStoreSink, from_sql_value, to_sql_value
+
+
+def job(job_id='0123', **fields):
+    record = {
+        'job_id': job_id,
+        'url': f'https://www.upwork.com/jobs/~{job_id}',
+        'title': 'Python scraper',
+        'type': 'Fixed',
+        'fixed_budget_amount': '500',
+        'ts_publish': '2026-01-11T17:44:16.509Z',
+        'skills': ['Python', 'Scrapy'],
+        'payment_verified': True,
+        'applicants': '5',
+        'clientActivity_invitationsSent': '2',
+    }
+    record.update(fields)
+    return record
+
+
+@pytest.fixture
+def store(tmp_path):
+    with JobStore(str(tmp_path / 'jobs.sqlite3')) as store:
+        yield store
+
+
+def test_sql_values_round_trip():
+    assert to_sql_value('1,234.5', 'float') == 1234.5
+    assert to_sql_value('true', 'bool') == 1
+    assert to_sql_value('2026-01-11T17:44:16Z', 'timestamp') == '2026-01-11T17:44:16+00:00'
+    assert from_sql_value(to_sql_value(['Python'], 'list'), 'list') == ['Python']
+    assert to_sql_value('', 'int') is None
+
+
+def test_insert_stores_typed_columns(store):
+    assert store.upsert(job()) == 'inserted'
+    [row] = store.query()
+    assert row['fixed_budget_amount'] == 500.0
+    assert row['payment_verified'] is True
+    assert row['skills'] == ['Python', 'Scrapy']
+    assert row['seen_count'] == 1
+    assert store.upsert({'title': 'no id'}) is None
+
+
+def test_upsert_keeps_values_a_later_run_did_not_collect(store):
+    store.upsert(job())
+    # A tile-only record: no budget or skills, but a new title
+    assert store.upsert(job(title='Python scraper (updated)', fixed_budget_amount=None, skills=None)) == 'updated'
+    [row] = store.query()
+    assert row['title'] == 'Python scraper (updated)'
+    assert row['fixed_budget_amount'] == 500.0
+    assert row['skills'] == ['Python', 'Scrapy']
+    assert row['seen_count'] == 2
+    assert row['last_seen_at'] >= row['first_seen_at']
+
+
+def test_history_snapshots_only_competition_changes(store):
+    store.upsert(job(applicants='5'))
+    store.upsert(job(applicants='5', title='Same competition'))
+    store.upsert(job(applicants='12'))
+    # Missing values do not count as a change
+    store.upsert(job(applicants=None, clientActivity_invitationsSent=None))
+    assert [row['applicants'] for row in store.history('0123')] == [5, 12]
+    assert store.stats()['changed'] == 1
+    assert store.stats()['inserted'] == 1
+    assert store.stats()['updated'] == 3
+
+
+def test_query_filters(store):
+    store.upsert(job('1', type='Fixed', fixed_budget_amount='200', ts_publish='2026-01-10T00:00:00Z'))
+    store.upsert(job('2', type='Fixed', fixed_budget_amount='900', ts_publish='2026-01-12T00:00:00Z'))
+    store.upsert(job('3', type='Hourly', fixed_budget_amount='0', hourly_max='60', ts_publish='2026-01-13T00:00:00Z'))
+    assert [row['job_id'] for row in store.query()] == ['3', '2', '1']
+    assert [row['job_id'] for row in store.query(job_type='Fixed', min_budget=500)] == ['2']
+    assert [row['job_id'] for row in store.query(published_since='2026-01-11')] == ['3', '2']
+    assert [row['job_id'] for row in store.query(min_hourly=50)] == ['3']
+    assert len(store.query(limit=1)) == 1
+
+
+def test_sink_counts_records_with_a_job_id(tmp_path):
+    sink = JobStoreSink(str(tmp_path / 'jobs.sqlite3'))
+    sink.write(job('1'))
+    sink.write({'title': 'no id'})
+    sink.close()
+    assert sink.count == 1
+    with JobStore(sink.path) as store:
+        assert store.stats()['jobs'] == 1
+
+
+def test_sink_writes_only_the_selected_fields(tmp_path):
+    path = str(tmp_path / 'jobs.sqlite3')
+    with JobStoreSink(path) as sink:
+        sink.write(job('1', applicants='4'))
+    with JobStoreSink(path, fields=('title', 'applicants')) as sink:
+        sink.write(job('1', title='Renamed', applicants='9', fixed_budget_amount='900'))
+        sink.write(job('2', title='New job'))
+    with JobStore(path) as store:
+        stored = {row['job_id']: row for row in store.query()}
+    assert stored['1']['title'] == 'Renamed' and stored['1']['applicants'] == 9
+    assert stored['1']['fixed_budget_amount'] == 500.0
+    assert stored['2']['title'] == 'New job' and stored['2']['fixed_budget_amount'] is None
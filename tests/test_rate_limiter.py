@@ -0,0 +1,67 @@
+import pytest
+
+from execution import rate_limiter
+from execution.rate_limiter import DEFAULT_RATE_BUDGETS, RateLimiter, TokenBucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(rate_limiter.time, 'monotonic', fake)
+    return fake
+
+
+def test_burst_is_free_then_requests_queue_at_the_rate(clock):
+    bucket = TokenBucket(rate=2.0, burst=3)
+    assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+    # Later callers queue behind earlier reservations, 1/rate apart
+    assert bucket.reserve() == pytest.approx(0.5)
+    assert bucket.reserve() == pytest.approx(1.0)
+
+
+def test_tokens_refill_over_time_up_to_the_burst(clock):
+    bucket = TokenBucket(rate=1.0, burst=2)
+    bucket.reserve()
+    bucket.reserve()
+    clock.now += 1.5
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == pytest.approx(0.5)
+    clock.now += 60
+    assert [bucket.reserve() for _ in range(2)] == [0.0, 0.0]
+    assert bucket.reserve() == pytest.approx(1.0)
+
+
+def test_jitter_is_added_to_the_wait(clock):
+    bucket = TokenBucket(rate=1.0, burst=1, jitter=(0.25, 0.25))
+    assert bucket.reserve() == pytest.approx(0.25)
+    assert bucket.reserve() == pytest.approx(1.25)
+
+
+def test_rate_must_be_positive():
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
+
+
+def test_budget_overrides_merge_with_defaults():
+    limiter = RateLimiter({'detail': {'rate': 4.0}, 'profile': {'burst': 2}})
+    assert limiter.bucket('detail').rate == 4.0
+    assert limiter.bucket('detail').burst == DEFAULT_RATE_BUDGETS['detail']['burst']
+    assert limiter.bucket('search').rate == DEFAULT_RATE_BUDGETS['search']['rate']
+    assert limiter.bucket('profile').burst == 2
+    assert limiter.bucket('unknown') is limiter.bucket('detail')
+
+
+def test_scaled_limiter_multiplies_rates_without_jitter():
+    scaled = RateLimiter().scaled(3)
+    detail = DEFAULT_RATE_BUDGETS['detail']
+    assert scaled.bucket('detail').rate == pytest.approx(detail['rate'] * 3)
+    assert scaled.bucket('detail').burst == detail['burst'] * 3
+    assert scaled.bucket('search').jitter == (0.0, 0.0)
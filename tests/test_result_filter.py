@@ -0,0 +1,122 @@
+import datetime
+
+import pytest
+
+pd = pytest.importorskip('pandas')
+
+from execution.job_record import JobRecord  # noqa: E402
+from execution.result_filter import (  # noqa: E402
+    ResultFilter, days_posted_cutoff, load_results, normalize_frame, post_process, save_results,
+)
+
+NOW = datetime.datetime(2026, 1, 20, tzinfo=datetime.timezone.utc)
+
+
+def job(job_id, **fields):
+    record = {
+        'job_id': job_id,
+        'type': 'Fixed',
+        'fixed_budget_amount': '500',
+        'ts_create': '2026-01-18T10:00:00Z',
+        'skills': ['Python'],
+    }
+    record.update(fields)
+    return record
+
+
+def text_frame(rows):
+    """Rows as a CSV-loaded result set: every value text, missing values ''."""
+    return pd.DataFrame(rows).fillna('').astype(str)
+
+
+def test_package_import_normalizes_list_columns():
+    frame = normalize_frame(text_frame([{'skills': "['Python', 'Scrapy']", 'questions': ''}]))
+    assert frame.loc[0, 'skills'] == ['Python', 'Scrapy']
+    assert frame.loc[0, 'questions'] is None
+
+
+@pytest.mark.parametrize('text, amount', [
+    ('$19K', 19_000.0),
+    ('19k', 19_000.0),
+    ('$1.2M+', 1_200_000.0),
+    ('$1,234.5', 1234.5),
+    ('250', 250.0),
+    ('', None),
+    ('n/a', None),
+])
+def test_money_text_is_scaled(text, amount):
+    frame = normalize_frame(text_frame([{'client_total_spent': text}]))
+    value = frame.loc[0, 'client_total_spent']
+    assert (pd.isna(value) if amount is None else value == amount)
+
+
+def test_normalize_frame_types_and_cleanups():
+    frame = normalize_frame(text_frame([
+        {'type': 'Hourly', 'hourly_max': '45', 'fixed_budget_amount': '300', 'client_rating': '7.5',
+         'buyer_hire_rate_pct': '250', 'payment_verified': 'true', 'ts_publish': '2026-01-11T17:44:16.509Z'},
+        {'type': 'Fixed', 'hourly_max': '45', 'fixed_budget_amount': '300', 'client_rating': '4.9',
+         'buyer_hire_rate_pct': '', 'buyer_stats_totalJobsWithHires': '3', 'buyer_jobs_postedCount': '4',
+         'payment_verified': '', 'ts_publish': ''},
+    ]))
+    assert frame['fixed_budget_amount'].tolist() == [0.0, 300.0]
+    assert frame['hourly_max'].tolist() == [45.0, 0.0]
+    # Ratings above 5 are extraction noise
+    assert frame['client_rating'].tolist() == [0.0, 4.9]
+    assert frame['buyer_hire_rate_pct'].tolist() == [100, 75]
+    assert frame['payment_verified'].tolist()[0] is True
+    assert pd.isna(frame['payment_verified'][1])
+    assert frame['ts_publish'][0] == pd.Timestamp('2026-01-11T17:44:16.509Z')
+    assert pd.isna(frame['ts_publish'][1])
+
+
+def test_from_search_params():
+    assert ResultFilter.from_search_params({'filtering': {'qualify_keywords': ['python']}}) is None
+    result_filter = ResultFilter.from_search_params({'filtering': {'min_client_spent': '1000', 'max_applicants': 'many'}})
+    assert result_filter.thresholds == {'min_client_spent': 1000.0}
+
+
+def test_check_streaming_records():
+    result_filter = ResultFilter({'min_client_spent': 1000, 'max_applicants': 20})
+    assert result_filter.check(JobRecord.from_dict(job('1', client_total_spent='5000', applicants='10'))) is None
+    assert result_filter.check(job('2', client_total_spent='500')) == 'min_client_spent'
+    assert result_filter.check(job('3', client_total_spent='5000', applicants='50')) == 'max_applicants'
+    # Missing values never drop a job
+    assert result_filter.check(job('4')) is None
+
+
+def test_post_process_applies_thresholds_and_days_posted():
+    records = [
+        job('keep', client_total_spent='$19K', client_rating='4.8', applicants='5'),
+        job('cheap', client_total_spent='$500', client_rating='4.8', applicants='5'),
+        job('crowded', client_total_spent='$2K', applicants='60'),
+        job('unknown'),
+        job('old', client_total_spent='$19K', ts_create='2026-01-01T00:00:00Z'),
+    ]
+    search = {'days_posted': 7, 'filtering': {'min_client_spent': 1000, 'max_applicants': 20}}
+    kept, dropped = post_process(records, search, now=NOW)
+    assert kept['job_id'].tolist() == ['keep', 'unknown']
+    assert dropped == {'days_posted': 1, 'min_client_spent': 1, 'max_applicants': 1}
+
+
+def test_vectorized_and_streaming_filters_agree():
+    records = [job(str(i), client_total_spent=f'${i}K', client_rating=str(3 + i % 3), applicants=str(i * 7 % 50))
+               for i in range(40)]
+    search = {'filtering': {'min_client_spent': 10000, 'min_client_rating': 4, 'max_applicants': 30}}
+    kept, _ = post_process(records, search, now=NOW)
+    result_filter = ResultFilter.from_search_params(search)
+    assert kept['job_id'].tolist() == [record['job_id'] for record in records if result_filter.check(record) is None]
+
+
+def test_days_posted_cutoff():
+    assert days_posted_cutoff(3, now=NOW) == NOW - datetime.timedelta(days=3)
+    assert days_posted_cutoff('') is None
+    assert days_posted_cutoff('soon') is None
+
+
+def test_csv_round_trip(tmp_path):
+    path = str(tmp_path / 'jobs.csv')
+    kept, _ = post_process([job('1', client_total_spent='2000', skills=['Python', 'Scrapy'])])
+    save_results(kept, path)
+    reloaded, _ = post_process(load_results([path]))
+    assert reloaded.loc[0, 'client_total_spent'] == 2000.0
+    assert reloaded.loc[0, 'skills'] == ['Python', 'Scrapy']
@@ -0,0 +1,91 @@
+import json
+import os
+
+import pytest
+
+from execution import output_sinks
+from execution.run_checkpoint import RunCheckpoint, open_run_checkpoint
+
+SEARCH_URL = 'https://www.upwork.com/nx/search/jobs/?q=python&sort=recency'
+
+
+def interrupted_run(directory, output):
+    checkpoint = RunCheckpoint(SEARCH_URL, str(directory))
+    checkpoint.start([str(output)])
+    checkpoint.record('01', True)
+    checkpoint.record('02', False)
+    checkpoint.record('03', True)
+    checkpoint.record(None, True)
+    # The process dies here: no discard()
+    checkpoint.close()
+
+
+def test_resume_counts_processed_and_written_jobs(tmp_path):
+    output = tmp_path / 'jobs.csv'
+    output.write_text('url\n')
+    interrupted_run(tmp_path / 'checkpoints', output)
+
+    resumed = RunCheckpoint(SEARCH_URL + '&page=2', str(tmp_path / 'checkpoints'))
+    assert resumed.resuming
+    assert resumed.processed == {'01', '02', '03'}
+    assert resumed.written == 2
+    assert resumed.outputs == [str(output)]
+    assert resumed.is_processed('02')
+    assert not resumed.is_processed('04')
+
+
+def test_resumed_run_appends_and_counts_each_job_once(tmp_path):
+    output = tmp_path / 'jobs.csv'
+    output.write_text('url\n')
+    interrupted_run(tmp_path / 'checkpoints', output)
+    resumed = RunCheckpoint(SEARCH_URL, str(tmp_path / 'checkpoints'))
+    resumed.start(resumed.outputs)
+    resumed.record('04', True)
+    resumed.record('01', True)
+    resumed.close()
+
+    again = RunCheckpoint(SEARCH_URL, str(tmp_path / 'checkpoints'))
+    assert len(again.processed) == 4
+    assert again.written == 3
+
+
+def test_missing_outputs_are_dropped(tmp_path):
+    interrupted_run(tmp_path / 'checkpoints', tmp_path / 'deleted.csv')
+    assert RunCheckpoint(SEARCH_URL, str(tmp_path / 'checkpoints')).outputs == []
+
+
+def test_finished_or_fresh_runs_start_empty(tmp_path):
+    directory = tmp_path / 'checkpoints'
+    interrupted_run(directory, tmp_path / 'jobs.csv')
+    fresh = RunCheckpoint(SEARCH_URL, str(directory), resume=False)
+    assert not fresh.resuming
+    assert not os.path.exists(fresh.ids_path)
+
+    interrupted_run(directory, tmp_path / 'jobs.csv')
+    RunCheckpoint(SEARCH_URL, str(directory)).discard()
+    assert not RunCheckpoint(SEARCH_URL, str(directory)).resuming
+
+
+def test_other_searches_do_not_resume(tmp_path):
+    interrupted_run(tmp_path / 'checkpoints', tmp_path / 'jobs.csv')
+    assert not RunCheckpoint(SEARCH_URL.replace('python', 'rust'), str(tmp_path / 'checkpoints')).resuming
+
+
+def test_open_run_checkpoint(tmp_path):
+    assert open_run_checkpoint({'enabled': False}, SEARCH_URL) is None
+    checkpoint = open_run_checkpoint({'path': str(tmp_path)}, SEARCH_URL)
+    assert checkpoint.ids_path.startswith(str(tmp_path))
+
+
+def test_resumed_parquet_output_copies_the_interrupted_jsonl_rows(tmp_path, monkeypatch):
+    pq = pytest.importorskip('pyarrow.parquet')
+    monkeypatch.setattr(output_sinks, 'PARQUET_OUTPUT_DIR', str(tmp_path))
+    jsonl = tmp_path / 'jobs.jsonl'
+    jsonl.write_text(json.dumps({'job_id': '01', 'applicants': 3}) + '\n' + json.dumps({'job_id': '02'}) + '\n{"job_id": "0', encoding='utf-8')
+    sink = output_sinks.open_job_sink('jsonl,parquet', fields=('job_id', 'applicants'), resume_paths=[str(jsonl)])
+    sink.write({'job_id': '03', 'applicants': 5})
+    sink.close()
+    parquet_path = sink.paths[1]
+    assert sink.count == 1
+    assert jsonl.read_text(encoding='utf-8').splitlines()[-1] == '{"job_id": "03", "applicants": 5}'
+    assert pq.read_table(parquet_path).to_pydict() == {'job_id': ['01', '02', '03'], 'applicants': [3, None, 5]}
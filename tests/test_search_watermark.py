@@ -0,0 +1,62 @@
+import datetime
+
+from execution.search_watermark import SearchWatermark, published_at, search_key
+
+SEARCH_URL = 'https://www.upwork.com/nx/search/jobs/?q=python&sort=recency'
+
+
+def job_url(job_id):
+    return f'https://www.upwork.com/jobs/Python-job_~0{job_id}/'
+
+
+def test_search_key_ignores_the_page_parameter():
+    assert search_key(SEARCH_URL + '&page=3') == search_key(SEARCH_URL)
+    assert search_key(SEARCH_URL) != search_key(SEARCH_URL.replace('python', 'rust'))
+
+
+def test_published_at_falls_back_to_creation_time():
+    assert published_at({'ts_publish': '2026-01-11T17:44:16.509Z'}).tzinfo is not None
+    created = datetime.datetime(2026, 1, 10, tzinfo=datetime.timezone.utc)
+    assert published_at({'ts_publish': None, 'ts_create': created}) == created
+    assert published_at({}) is None
+
+
+def test_advance_marks_only_the_given_jobs_and_persists(tmp_path):
+    path = str(tmp_path / 'watermarks.json')
+    watermark = SearchWatermark(SEARCH_URL, path=path)
+    assert watermark.filter_new([job_url(1), job_url(2)]) == [job_url(1), job_url(2)]
+    watermark.advance([job_url(1)], [{'ts_publish': '2026-01-11T17:44:16.509Z'}, {'ts_publish': '2026-01-09T00:00:00Z'}])
+    watermark.save()
+
+    reloaded = SearchWatermark(SEARCH_URL + '&page=2', path=path)
+    assert reloaded.filter_new([job_url(1), job_url(2)]) == [job_url(2)]
+    assert reloaded.filter_new_tiles([{'url': job_url(1)}, {'url': job_url(3)}]) == [{'url': job_url(3)}]
+    assert reloaded.last_ts_publish == '2026-01-11T17:44:16.509Z'
+
+
+def test_advance_keeps_the_newest_publish_time(tmp_path):
+    watermark = SearchWatermark(SEARCH_URL, path=str(tmp_path / 'watermarks.json'))
+    watermark.advance([], [{'ts_publish': '2026-01-11T00:00:00Z'}])
+    watermark.advance([], [{'ts_publish': '2026-01-05T00:00:00Z'}])
+    assert watermark.last_ts_publish == '2026-01-11T00:00:00.000Z'
+
+
+def test_seen_list_is_bounded_most_recent_first(tmp_path):
+    watermark = SearchWatermark(SEARCH_URL, path=str(tmp_path / 'watermarks.json'), max_seen=3)
+    watermark.advance([job_url(1), job_url(2)], [])
+    watermark.advance([job_url(3), job_url(4)], [])
+    assert watermark.seen_order == ['03', '04', '01']
+    assert watermark.filter_new([job_url(2)]) == [job_url(2)]
+
+
+def test_is_newer_uses_publish_time_once_the_seen_list_is_full(tmp_path):
+    watermark = SearchWatermark(SEARCH_URL, path=str(tmp_path / 'watermarks.json'), max_seen=2)
+    watermark.advance([job_url(1)], [{'ts_publish': '2026-01-11T00:00:00Z'}])
+    old = {'ts_publish': '2026-01-10T00:00:00Z'}
+    new = {'ts_publish': '2026-01-12T00:00:00Z'}
+    # Ids alone decide while the list has room
+    assert watermark.is_newer(old)
+    watermark.advance([job_url(2)], [])
+    assert not watermark.is_newer(old)
+    assert watermark.is_newer(new)
+    assert watermark.is_newer({'ts_publish': None})
@@ -0,0 +1,94 @@
+import os
+import stat
+import time
+import types
+
+import requests
+
+from execution.session_store import (
+    SessionStore, account_key, check_session, is_login_page, open_session_store, restore_session,
+)
+
+SEARCH_URL = 'https://www.upwork.com/nx/search/jobs/?q=python'
+SEARCH_PAGE = '<html><nav>user menu</nav><article>job</article></html>'
+LOGIN_PAGE = '<html><a>Log in</a><a>Sign up</a></html>'
+
+
+class FakeSession:
+    def __init__(self, status_code=200, text=SEARCH_PAGE, error=None):
+        self.response = types.SimpleNamespace(status_code=status_code, text=text)
+        self.error = error
+
+    def get(self, url, timeout=None):
+        if self.error:
+            raise self.error
+        return self.response
+
+
+def logged_in_session():
+    session = requests.Session()
+    session.headers['User-Agent'] = 'Mozilla/5.0 Test'
+    session.cookies.set('master_access_token', 'abc', domain='.upwork.com', path='/')
+    session.cookies.set('old', 'x', domain='.upwork.com', path='/', expires=int(time.time()) - 60)
+    return session
+
+
+def test_account_key_is_case_insensitive_and_anonymous_without_username():
+    assert account_key(' User@Example.com ') == account_key('user@example.com')
+    assert account_key(None) == 'anonymous'
+
+
+def test_save_and_load_round_trip(tmp_path):
+    store = SessionStore(str(tmp_path / 'sessions.json'))
+    store.save('user@example.com', logged_in_session(), browser_type='camoufox')
+    assert stat.S_IMODE(os.stat(store.path).st_mode) == 0o600
+
+    session = store.load('USER@example.com', proxies={'https': 'http://proxy:8080'})
+    assert session.headers['User-Agent'] == 'Mozilla/5.0 Test'
+    # Expired cookies are not restored
+    assert {cookie.name for cookie in session.cookies} == {'master_access_token'}
+    assert session.proxies['https'] == 'http://proxy:8080'
+    assert store.load('someone-else') is None
+
+
+def test_sessions_expire_after_max_age(tmp_path, monkeypatch):
+    store = SessionStore(str(tmp_path / 'sessions.json'), max_age_hours=1)
+    store.save('user', logged_in_session())
+    later = time.time() + 3601
+    monkeypatch.setattr('execution.session_store.time.time', lambda: later)
+    assert store.load('user') is None
+
+
+def test_invalidate_keeps_other_accounts(tmp_path):
+    store = SessionStore(str(tmp_path / 'sessions.json'))
+    store.save('a', logged_in_session())
+    store.save('b', logged_in_session())
+    store.invalidate('a')
+    assert store.load('a') is None
+    assert store.load('b') is not None
+
+
+def test_check_session():
+    assert is_login_page(LOGIN_PAGE)
+    assert check_session(FakeSession(), SEARCH_URL)
+    assert not check_session(FakeSession(text=LOGIN_PAGE), SEARCH_URL)
+    # Anonymous sessions only need a usable search page
+    assert check_session(FakeSession(text=LOGIN_PAGE), SEARCH_URL, logged_in=False)
+    assert not check_session(FakeSession(status_code=403), SEARCH_URL)
+    assert not check_session(FakeSession(text='<title>Just a moment...</title>'), SEARCH_URL)
+    assert not check_session(FakeSession(error=requests.ConnectionError('down')), SEARCH_URL)
+
+
+def test_restore_session_drops_a_failing_session(tmp_path, monkeypatch):
+    store = SessionStore(str(tmp_path / 'sessions.json'))
+    store.save('user', logged_in_session())
+    monkeypatch.setattr('execution.session_store.check_session', lambda *args, **kwargs: False)
+    assert restore_session(store, 'user', SEARCH_URL, logged_in=True) is None
+    assert store.load('user') is None
+
+
+def test_restore_session_respects_reuse(tmp_path):
+    store = open_session_store({'path': str(tmp_path / 'sessions.json'), 'reuse': False})
+    store.save('user', logged_in_session())
+    assert restore_session(store, 'user', SEARCH_URL, logged_in=True) is None
+    assert open_session_store({'enabled': False}) is None